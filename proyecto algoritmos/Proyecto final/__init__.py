@@ -1,6 +1,6 @@
-from ingredientes import CategoriaIngrediente, Ingrediente
-from inventario import Inventario
-from hotdogs import HotDog
-from menu import Menu
-
+from ingredientes import CategoriaIngrediente, Ingrediente
+from inventario import Inventario
+from hotdogs import HotDog
+from menu import Menu
+
 __all__ = ['CategoriaIngrediente', 'Ingrediente', 'Inventario', 'HotDog', 'Menu']
\ No newline at end of file
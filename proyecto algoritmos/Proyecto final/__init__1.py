@@ -1,6 +1,12 @@
-from gestor_ingredientes import GestorIngredientes
-from gestor_inventario import GestorInventario
-from gestor_menu import GestorMenu
-from simulacion_ventas import SimulacionVentas
-
-__all__ = ['GestorIngredientes', 'GestorInventario', 'GestorMenu', 'SimulacionVentas']
\ No newline at end of file
+from gestor_ingredientes import GestorIngredientes
+from gestor_inventario import GestorInventario
+from gestor_menu import GestorMenu
+from simulacion_ventas import SimulacionVentas
+from sustituciones import MotorSustituciones
+from barrido_parametros import BarridoParametros
+from reabastecimiento import ControlReabastecimiento, PoliticaPuntoReorden, PoliticaRevisionPeriodica, PoliticaPronostico
+from simulacion_multipuesto import SimulacionMultipuesto
+
+__all__ = ['GestorIngredientes', 'GestorInventario', 'GestorMenu', 'SimulacionVentas', 'MotorSustituciones', 'BarridoParametros',
+           'ControlReabastecimiento', 'PoliticaPuntoReorden', 'PoliticaRevisionPeriodica', 'PoliticaPronostico',
+           'SimulacionMultipuesto']
\ No newline at end of file
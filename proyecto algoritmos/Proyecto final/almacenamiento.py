@@ -0,0 +1,416 @@
+import json
+import os
+import sqlite3
+import threading
+import uuid
+from typing import Dict, List
+from ingredientes import Ingrediente, CategoriaIngrediente
+from inventario import Inventario
+from hotdogs import HotDog
+from menu import Menu
+from menu_perezoso import MenuPerezoso, ResumenHotDog, HotDogsPerezosos
+from gestor_ingredientes import GestorIngredientes
+from instantanea_binaria import AlmacenamientoBinario
+from lector_json import LectorJSONIncremental, progreso_en_consola
+from guardado_seguro import escribir_atomico
+
+class AlmacenamientoJSON:
+    """Guarda ingredientes, inventario y menú en un único archivo JSON.
+
+    Junto al archivo se escribe `<ruta>.menu.idx` con id, nombre, precio y rango
+    en bytes de cada hot dog. Un menú perezoso toma sus resúmenes del índice y
+    deja de leer el archivo al llegar al menú; si el índice no corresponde al
+    archivo (otra versión, edición a mano), se recorre el menú como siempre.
+    """
+
+    # Versión 1: sin campo "version", el menú embebe cada ingrediente completo.
+    # Versión 2: el menú referencia los ingredientes por ID.
+    VERSION = 2
+    # A partir de este tamaño se informa el avance de la carga
+    TAMANO_PARA_PROGRESO = 50 * 1024 * 1024
+
+    def __init__(self, ruta: str):
+        self.ruta = ruta
+        self.ruta_indice = ruta + ".menu.idx"
+        # Archivo del que lee un menú perezoso, abierto solo hasta el primer guardado:
+        # reemplazar un archivo abierto falla en Windows y además invalidaría los rangos
+        self._archivo_menu = None
+        self._menu_perezoso = None
+        # Recetas leídas al cerrar el archivo, para las instantáneas tomadas antes
+        self._recetas: Dict[ResumenHotDog, HotDog] = {}
+
+    def existe(self) -> bool:
+        return os.path.exists(self.ruta)
+
+    def cerrar(self):
+        if self._archivo_menu is not None:
+            self._archivo_menu.close()
+            self._archivo_menu = None
+
+    def cargar(self, gestor_ingredientes: GestorIngredientes, inventario: Inventario, menu: Menu):
+        """Construye los objetos a medida que se lee cada elemento del archivo"""
+        al_progresar = None
+        if os.path.getsize(self.ruta) >= self.TAMANO_PARA_PROGRESO:
+            al_progresar = progreso_en_consola(f"Leyendo {os.path.basename(self.ruta)}")
+        perezoso = isinstance(menu, MenuPerezoso)
+        lector = LectorJSONIncremental(self.ruta, al_progresar=al_progresar, registrar_posiciones=perezoso)
+        indice = None
+        if perezoso:
+            menu.usar_origen(self._lector_hotdogs(gestor_ingredientes))
+            self._menu_perezoso = menu
+            indice = self._leer_indice()
+
+        seccion_actual = None
+        recorrido = lector.recorrer()
+        for seccion, elemento in recorrido:
+            if seccion != seccion_actual:
+                seccion_actual = seccion
+                self._verificar_version(lector.escalares)
+                if seccion == 'menu' and indice and indice['indice_menu'] == lector.escalares.get('indice_menu'):
+                    for hotdog_id, nombre, precio_venta, inicio, fin in indice['hotdogs']:
+                        if not menu.contiene(hotdog_id):
+                            menu.agregar_resumen(ResumenHotDog(hotdog_id, nombre, precio_venta, (inicio, fin)))
+                    recorrido.close()
+                    return
+
+            if seccion == 'ingredientes':
+                # Cargar ingredientes locales
+                ingrediente = Ingrediente.from_dict(elemento)
+                if not gestor_ingredientes.buscar_por_id(ingrediente.id):
+                    gestor_ingredientes.agregar_ingrediente(ingrediente)
+            elif seccion == 'inventario':
+                # Cargar inventario local
+                ingrediente = gestor_ingredientes.buscar_por_id(elemento['ingrediente_id'])
+                if ingrediente:
+                    inventario.actualizar_existencia(ingrediente, elemento['cantidad'])
+            elif seccion == 'menu':
+                # Cargar menú local
+                if menu.contiene(elemento['id']):
+                    continue
+                if perezoso:
+                    menu.agregar_resumen(ResumenHotDog(elemento['id'], elemento['nombre'],
+                                                       elemento.get('precio_venta', 0.0), lector.posicion_elemento))
+                else:
+                    menu.agregar_hotdog(HotDog.from_dict(elemento, gestor_ingredientes))
+        # "version" puede venir después de los arreglos si el archivo no lo escribió este programa
+        self._verificar_version(lector.escalares)
+
+    def _leer_indice(self):
+        try:
+            with open(self.ruta_indice, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _verificar_version(self, escalares: dict):
+        version = escalares.get('version', 1)
+        if not isinstance(version, int) or isinstance(version, bool) or not 1 <= version <= self.VERSION:
+            raise ValueError(f"El archivo {self.ruta} usa la versión {version!r}, no soportada (1 a {self.VERSION})")
+
+    def _lector_hotdogs(self, gestor_ingredientes: GestorIngredientes):
+        self.cerrar()
+        archivo = self._archivo_menu = open(self.ruta, 'rb')
+
+        def leer(resumen: ResumenHotDog) -> HotDog:
+            inicio, fin = resumen.ubicacion
+            archivo.seek(inicio)
+            return HotDog.from_dict(json.loads(archivo.read(fin - inicio)), gestor_ingredientes)
+        return leer
+
+    def _soltar_archivo_menu(self):
+        """Lee las recetas que el menú perezoso aún no usó y cierra el archivo antes de reemplazarlo"""
+        if self._menu_perezoso is not None:
+            self._recetas.update(self._menu_perezoso.materializar_todo())
+            self._menu_perezoso = None
+        self.cerrar()
+
+    def guardar(self, ingredientes: List[Ingrediente], existencias: Dict[str, int], hotdogs: List[HotDog]):
+        if self._archivo_menu is not None:
+            self._soltar_archivo_menu()
+        if isinstance(hotdogs, HotDogsPerezosos):
+            # Una instantánea tomada antes de soltar el archivo puede tener resúmenes ya leídos
+            hotdogs = [self._recetas[entrada] if entrada in self._recetas else hotdogs.cargar(entrada)
+                       for entrada in hotdogs.sin_cargar()]
+        marca = uuid.uuid4().hex
+        datos = {
+            'version': self.VERSION,
+            'indice_menu': marca,
+            'ingredientes': [ingrediente.to_dict() for ingrediente in ingredientes],
+            'inventario': [{'ingrediente_id': ing_id, 'cantidad': cantidad} for ing_id, cantidad in existencias.items()]
+        }
+        # El menú se escribe a mano para conocer el rango en bytes de cada hot dog
+        partes = [json.dumps(datos, indent=2, ensure_ascii=False)[:-2].encode('utf-8'), b',\n  "menu": [']
+        tamano = sum(len(parte) for parte in partes)
+        filas_indice = []
+        for i, hotdog in enumerate(hotdogs):
+            separador = b'\n    ' if i == 0 else b',\n    '
+            elemento = json.dumps(hotdog.to_dict(), indent=2, ensure_ascii=False).replace('\n', '\n    ').encode('utf-8')
+            inicio = tamano + len(separador)
+            filas_indice.append([hotdog.id, hotdog.nombre, hotdog.precio_venta, inicio, inicio + len(elemento)])
+            partes += [separador, elemento]
+            tamano = inicio + len(elemento)
+        partes.append(b'\n  ]\n}' if filas_indice else b']\n}')
+
+        escribir_atomico(self.ruta, lambda f: f.writelines(partes), binario=True)
+        # Después del archivo: si se interrumpe aquí, la marca vieja del índice ya no coincide
+        indice = {'indice_menu': marca, 'hotdogs': filas_indice}
+        escribir_atomico(self.ruta_indice, lambda f: json.dump(indice, f, ensure_ascii=False), conservar_respaldo=False)
+
+    def validar(self, ruta: str) -> bool:
+        """Detecta archivos truncados: el objeto JSON de primer nivel debe estar cerrado"""
+        with open(ruta, 'rb') as f:
+            f.seek(0, os.SEEK_END)
+            tamano = f.tell()
+            f.seek(max(0, tamano - 64))
+            final = f.read().rstrip()
+        return final.endswith(b'}') and b'\x00' not in final
+
+class AlmacenamientoSQLite:
+    """Guarda los datos en SQLite con tablas indexadas y escrituras por diferencias"""
+
+    ESQUEMA = """
+        CREATE TABLE IF NOT EXISTS ingredientes (
+            id TEXT PRIMARY KEY,
+            nombre TEXT NOT NULL,
+            categoria TEXT NOT NULL,
+            tipo TEXT NOT NULL,
+            costo REAL NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS idx_ingredientes_categoria_tipo ON ingredientes (categoria, tipo);
+        CREATE TABLE IF NOT EXISTS existencias (
+            ingrediente_id TEXT PRIMARY KEY,
+            cantidad INTEGER NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS hotdogs (
+            id TEXT PRIMARY KEY,
+            nombre TEXT NOT NULL,
+            precio_venta REAL NOT NULL,
+            posicion INTEGER NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS componentes (
+            hotdog_id TEXT NOT NULL,
+            rol TEXT NOT NULL,
+            posicion INTEGER NOT NULL,
+            ingrediente_id TEXT NOT NULL,
+            PRIMARY KEY (hotdog_id, rol, posicion)
+        );
+        CREATE INDEX IF NOT EXISTS idx_componentes_ingrediente ON componentes (ingrediente_id);
+    """
+
+    def __init__(self, ruta: str):
+        self.ruta = ruta
+        self._conexion = None
+        # Último estado escrito/leído, para escribir solo las filas que cambian
+        self._ingredientes_guardados = {}
+        self._existencias_guardadas = {}
+        self._hotdogs_guardados = {}
+        # El guardado automático puede escribir desde otro hilo
+        self._bloqueo = threading.RLock()
+
+    @property
+    def conexion(self) -> sqlite3.Connection:
+        if self._conexion is None:
+            self._conexion = sqlite3.connect(self.ruta, check_same_thread=False)
+            self._conexion.execute("PRAGMA journal_mode=WAL")
+            self._conexion.executescript(self.ESQUEMA)
+        return self._conexion
+
+    def cerrar(self):
+        if self._conexion is not None:
+            self._conexion.close()
+            self._conexion = None
+
+    def existe(self) -> bool:
+        return os.path.exists(self.ruta)
+
+    def validar(self, ruta: str) -> bool:
+        # SQLite ya garantiza escrituras atómicas con su diario
+        return True
+
+    @staticmethod
+    def _fila_ingrediente(ingrediente: Ingrediente) -> tuple:
+        return (ingrediente.id, ingrediente.nombre, ingrediente.categoria.value, ingrediente.tipo, ingrediente.costo)
+
+    @staticmethod
+    def _filas_componentes(hotdog: HotDog) -> List[tuple]:
+        filas = [(hotdog.id, 'pan', 0, hotdog.pan.id), (hotdog.id, 'salchicha', 0, hotdog.salchicha.id)]
+        filas.extend((hotdog.id, 'topping', i, t.id) for i, t in enumerate(hotdog.toppings))
+        filas.extend((hotdog.id, 'salsa', i, s.id) for i, s in enumerate(hotdog.salsas))
+        if hotdog.acompanante:
+            filas.append((hotdog.id, 'acompanante', 0, hotdog.acompanante.id))
+        return filas
+
+    def cargar(self, gestor_ingredientes: GestorIngredientes, inventario: Inventario, menu: Menu):
+        conexion = self.conexion
+        por_id = {ing.id: ing for ing in gestor_ingredientes.ingredientes}
+
+        for fila in conexion.execute("SELECT id, nombre, categoria, tipo, costo FROM ingredientes ORDER BY rowid"):
+            self._ingredientes_guardados[fila[0]] = fila
+            if fila[0] not in por_id:
+                ingrediente = Ingrediente(id=fila[0], nombre=fila[1], categoria=CategoriaIngrediente.from_string(fila[2]),
+                                          tipo=fila[3], costo=fila[4])
+                gestor_ingredientes.agregar_ingrediente(ingrediente)
+                por_id[ingrediente.id] = ingrediente
+
+        for ing_id, cantidad in conexion.execute("SELECT ingrediente_id, cantidad FROM existencias"):
+            self._existencias_guardadas[ing_id] = cantidad
+            if ing_id in por_id:
+                inventario.actualizar_existencia(por_id[ing_id], cantidad)
+
+        if isinstance(menu, MenuPerezoso):
+            self._cargar_menu_perezoso(conexion, por_id, menu)
+            return
+
+        componentes = {}
+        consulta = "SELECT hotdog_id, rol, ingrediente_id FROM componentes ORDER BY hotdog_id, rol, posicion"
+        for hotdog_id, rol, ing_id in conexion.execute(consulta):
+            componentes.setdefault(hotdog_id, {}).setdefault(rol, []).append(por_id.get(ing_id))
+
+        for hotdog_id, nombre, precio_venta in conexion.execute("SELECT id, nombre, precio_venta FROM hotdogs ORDER BY posicion"):
+            hotdog = self._construir_hotdog(hotdog_id, nombre, precio_venta, componentes.get(hotdog_id, {}))
+            if not hotdog:
+                continue
+            self._hotdogs_guardados[hotdog_id] = ((nombre, precio_venta), self._filas_componentes(hotdog))
+            if not menu.contiene(hotdog_id):
+                menu.agregar_hotdog(hotdog)
+
+    @staticmethod
+    def _construir_hotdog(hotdog_id: str, nombre: str, precio_venta: float, roles: Dict[str, list]):
+        pan = roles.get('pan', [None])[0]
+        salchicha = roles.get('salchicha', [None])[0]
+        if not pan or not salchicha:
+            print(f"Hot dog '{nombre}' omitido: le falta el pan o la salchicha")
+            return None
+        return HotDog(
+            id=hotdog_id,
+            nombre=nombre,
+            pan=pan,
+            salchicha=salchicha,
+            toppings=[t for t in roles.get('topping', []) if t],
+            salsas=[s for s in roles.get('salsa', []) if s],
+            acompanante=roles.get('acompanante', [None])[0],
+            precio_venta=precio_venta
+        )
+
+    def _cargar_menu_perezoso(self, conexion, por_id: Dict[str, Ingrediente], menu: MenuPerezoso):
+        """Registra solo id, nombre y precio; las recetas se consultan al usar cada hot dog"""
+        consulta = """
+            SELECT id, nombre, precio_venta,
+                   EXISTS (SELECT 1 FROM componentes WHERE hotdog_id = h.id AND rol = 'pan'),
+                   EXISTS (SELECT 1 FROM componentes WHERE hotdog_id = h.id AND rol = 'salchicha')
+            FROM hotdogs h ORDER BY posicion
+        """
+        for hotdog_id, nombre, precio_venta, tiene_pan, tiene_salchicha in conexion.execute(consulta):
+            if not tiene_pan or not tiene_salchicha:
+                print(f"Hot dog '{nombre}' omitido: le falta el pan o la salchicha")
+                continue
+            # Estado desconocido hasta leer la receta; guardar() trata los resúmenes como sin cambios
+            self._hotdogs_guardados[hotdog_id] = None
+            if not menu.contiene(hotdog_id):
+                menu.agregar_resumen(ResumenHotDog(hotdog_id, nombre, precio_venta, hotdog_id))
+
+        def leer(resumen: ResumenHotDog) -> HotDog:
+            roles = {}
+            with self._bloqueo:
+                consulta = "SELECT rol, ingrediente_id FROM componentes WHERE hotdog_id = ? ORDER BY rol, posicion"
+                for rol, ing_id in self.conexion.execute(consulta, (resumen.ubicacion,)):
+                    roles.setdefault(rol, []).append(por_id.get(ing_id))
+            return self._construir_hotdog(resumen.id, resumen.nombre, resumen.precio_venta, roles)
+        menu.usar_origen(leer, self.hotdogs_con_ingrediente)
+
+    def guardar(self, ingredientes: List[Ingrediente], existencias: Dict[str, int], hotdogs: List[HotDog],
+                reemplazar: bool = False):
+        """Escribe en una sola transacción únicamente las filas que cambiaron.
+
+        Con `reemplazar` se vacían antes todas las tablas en la misma transacción,
+        así no sobrevive ninguna fila que no esté en los datos recibidos.
+        """
+        filas_ingredientes = {ing.id: self._fila_ingrediente(ing) for ing in ingredientes}
+        existencias = dict(existencias)
+        estado_hotdogs = {}
+        # De un menú perezoso, los hot dogs sin leer que vienen de esta base no cambiaron
+        entradas = hotdogs.sin_cargar() if isinstance(hotdogs, HotDogsPerezosos) else hotdogs
+        for hotdog in entradas:
+            if isinstance(hotdog, ResumenHotDog):
+                if hotdog.id in self._hotdogs_guardados:
+                    estado_hotdogs[hotdog.id] = self._hotdogs_guardados[hotdog.id]
+                    continue
+                hotdog = hotdogs.cargar(hotdog)
+            estado_hotdogs[hotdog.id] = ((hotdog.nombre, hotdog.precio_venta), self._filas_componentes(hotdog))
+
+        with self._bloqueo:
+            if reemplazar:
+                self._ingredientes_guardados, self._existencias_guardadas, self._hotdogs_guardados = {}, {}, {}
+            with self.conexion as conexion:
+                if reemplazar:
+                    for tabla in ('componentes', 'hotdogs', 'existencias', 'ingredientes'):
+                        conexion.execute(f"DELETE FROM {tabla}")
+                self._sincronizar_ingredientes(conexion, filas_ingredientes)
+                self._sincronizar_existencias(conexion, existencias)
+                self._sincronizar_hotdogs(conexion, estado_hotdogs)
+
+            self._ingredientes_guardados = filas_ingredientes
+            self._existencias_guardadas = existencias
+            self._hotdogs_guardados = estado_hotdogs
+
+    def _sincronizar_ingredientes(self, conexion, filas: Dict[str, tuple]):
+        cambiadas = [fila for ing_id, fila in filas.items() if self._ingredientes_guardados.get(ing_id) != fila]
+        eliminadas = [(ing_id,) for ing_id in self._ingredientes_guardados if ing_id not in filas]
+        conexion.executemany("INSERT OR REPLACE INTO ingredientes (id, nombre, categoria, tipo, costo) VALUES (?, ?, ?, ?, ?)", cambiadas)
+        conexion.executemany("DELETE FROM ingredientes WHERE id = ?", eliminadas)
+
+    def _sincronizar_existencias(self, conexion, existencias: Dict[str, int]):
+        cambiadas = [(ing_id, cantidad) for ing_id, cantidad in existencias.items()
+                     if self._existencias_guardadas.get(ing_id) != cantidad]
+        eliminadas = [(ing_id,) for ing_id in self._existencias_guardadas if ing_id not in existencias]
+        conexion.executemany("INSERT OR REPLACE INTO existencias (ingrediente_id, cantidad) VALUES (?, ?)", cambiadas)
+        conexion.executemany("DELETE FROM existencias WHERE ingrediente_id = ?", eliminadas)
+
+    def _sincronizar_hotdogs(self, conexion, estado: Dict[str, tuple]):
+        for posicion, (hotdog_id, actual) in enumerate(estado.items()):
+            if hotdog_id in self._hotdogs_guardados and self._hotdogs_guardados[hotdog_id] == actual:
+                continue
+            datos, componentes = actual
+            conexion.execute("INSERT OR REPLACE INTO hotdogs (id, nombre, precio_venta, posicion) VALUES (?, ?, ?, ?)",
+                             (hotdog_id, datos[0], datos[1], posicion))
+            conexion.execute("DELETE FROM componentes WHERE hotdog_id = ?", (hotdog_id,))
+            conexion.executemany("INSERT INTO componentes (hotdog_id, rol, posicion, ingrediente_id) VALUES (?, ?, ?, ?)", componentes)
+
+        for hotdog_id in self._hotdogs_guardados:
+            if hotdog_id not in estado:
+                conexion.execute("DELETE FROM hotdogs WHERE id = ?", (hotdog_id,))
+                conexion.execute("DELETE FROM componentes WHERE hotdog_id = ?", (hotdog_id,))
+
+        # Mantener el orden del menú aunque solo cambien las posiciones
+        conexion.executemany("UPDATE hotdogs SET posicion = ? WHERE id = ? AND posicion != ?",
+                             [(posicion, hotdog_id, posicion) for posicion, hotdog_id in enumerate(estado)])
+
+    def hotdogs_con_ingrediente(self, ingrediente_id: str) -> List[str]:
+        """IDs de los hot dogs guardados que usan el ingrediente, resuelto con el índice de componentes"""
+        consulta = "SELECT DISTINCT hotdog_id FROM componentes WHERE ingrediente_id = ?"
+        with self._bloqueo:
+            return [fila[0] for fila in self.conexion.execute(consulta, (ingrediente_id,))]
+
+    def importar_json(self, ruta_json: str):
+        """Reemplaza el contenido de la base con el de un archivo JSON local"""
+        gestor_ingredientes = GestorIngredientes()
+        inventario = Inventario()
+        menu = Menu()
+        AlmacenamientoJSON(ruta_json).cargar(gestor_ingredientes, inventario, menu)
+        self.guardar(gestor_ingredientes.ingredientes, inventario.existencias, menu.hotdogs, reemplazar=True)
+
+    def exportar_json(self, ruta_json: str):
+        gestor_ingredientes = GestorIngredientes()
+        inventario = Inventario()
+        menu = Menu()
+        self.cargar(gestor_ingredientes, inventario, menu)
+        AlmacenamientoJSON(ruta_json).guardar(gestor_ingredientes.ingredientes, inventario.existencias, menu.hotdogs)
+
+def crear_almacenamiento(ruta: str):
+    """Elige el backend según la extensión del archivo (.db/.sqlite usa SQLite, .hdsnap la instantánea binaria)"""
+    extension = os.path.splitext(ruta)[1].lower()
+    if extension in ('.db', '.sqlite', '.sqlite3'):
+        return AlmacenamientoSQLite(ruta)
+    if extension == '.hdsnap':
+        return AlmacenamientoBinario(ruta)
+    return AlmacenamientoJSON(ruta)
@@ -0,0 +1,168 @@
+from array import array
+from operator import mul
+from typing import Dict, Iterable, List, Union
+from ingredientes import Ingrediente, CategoriaIngrediente
+from hotdogs import HotDog
+
+class MatrizMenu:
+    """Menú como matriz dispersa hot dog × ingrediente (cuántas unidades de cada ingrediente lleva cada hot dog).
+
+    Se guarda por filas (CSR) para calcular el costo de todo el menú con un
+    solo producto matriz-vector contra los costos de los ingredientes, y por
+    columnas (CSC) para que un cambio de costos solo recalcule los hot dogs
+    que usan los ingredientes afectados.
+    """
+
+    def __init__(self, hotdogs: Iterable[HotDog], ingredientes: Iterable[Ingrediente] = ()):
+        self.hotdog_ids: List[str] = []
+        self.nombres: List[str] = []
+        self.precios = array('d')
+        self.ingrediente_ids: List[str] = []
+        self.categorias: List[CategoriaIngrediente] = []
+        self.costos_base = array('d')
+        self._columnas: Dict[str, int] = {}
+        self._filas: Dict[str, int] = {}
+
+        for ingrediente in ingredientes:
+            self._columna(ingrediente)
+
+        # CSR: las entradas de la fila i están en [inicio_filas[i], inicio_filas[i + 1])
+        self.inicio_filas = array('q', [0])
+        self.indices = array('q')
+        self.valores = array('d')
+        for hotdog in hotdogs:
+            self._filas[hotdog.id] = len(self.hotdog_ids)
+            self.hotdog_ids.append(hotdog.id)
+            self.nombres.append(hotdog.nombre)
+            self.precios.append(hotdog.precio_venta)
+            cantidades: Dict[int, int] = {}
+            for ingrediente in hotdog.componentes():
+                columna = self._columna(ingrediente)
+                cantidades[columna] = cantidades.get(columna, 0) + 1
+            for columna in sorted(cantidades):
+                self.indices.append(columna)
+                self.valores.append(cantidades[columna])
+            self.inicio_filas.append(len(self.indices))
+
+        # CSC a partir del CSR: filas que usan cada ingrediente
+        self.filas_por_columna: List[List[int]] = [[] for _ in self.ingrediente_ids]
+        self.valores_por_columna: List[List[float]] = [[] for _ in self.ingrediente_ids]
+        for fila in range(len(self.hotdog_ids)):
+            for k in range(self.inicio_filas[fila], self.inicio_filas[fila + 1]):
+                self.filas_por_columna[self.indices[k]].append(fila)
+                self.valores_por_columna[self.indices[k]].append(self.valores[k])
+        self.columnas_por_categoria: Dict[CategoriaIngrediente, List[int]] = {}
+        for columna, categoria in enumerate(self.categorias):
+            self.columnas_por_categoria.setdefault(categoria, []).append(columna)
+
+        self._costos = None
+
+    def _columna(self, ingrediente: Ingrediente) -> int:
+        columna = self._columnas.get(ingrediente.id)
+        if columna is None:
+            columna = self._columnas[ingrediente.id] = len(self.ingrediente_ids)
+            self.ingrediente_ids.append(ingrediente.id)
+            self.categorias.append(ingrediente.categoria)
+            self.costos_base.append(ingrediente.costo)
+        return columna
+
+    def __len__(self) -> int:
+        return len(self.hotdog_ids)
+
+    def producto(self, vector) -> array:
+        """Matriz por vector: para costos de ingredientes, el costo de cada hot dog"""
+        resultado = array('d', bytes(8 * len(self.hotdog_ids)))
+        inicio, indices, valores = self.inicio_filas, self.indices, self.valores
+        obtener = vector.__getitem__
+        for fila in range(len(self.hotdog_ids)):
+            desde, hasta = inicio[fila], inicio[fila + 1]
+            resultado[fila] = sum(map(mul, valores[desde:hasta], map(obtener, indices[desde:hasta])))
+        return resultado
+
+    def producto_transpuesto(self, cantidades: Dict[str, float]) -> array:
+        """Vector por matriz: para unidades vendidas por ID de hot dog, las unidades de cada ingrediente"""
+        resultado = array('d', bytes(8 * len(self.ingrediente_ids)))
+        inicio, indices, valores = self.inicio_filas, self.indices, self.valores
+        for hotdog_id, cantidad in cantidades.items():
+            fila = self._filas.get(hotdog_id)
+            if fila is None or not cantidad:
+                continue
+            for k in range(inicio[fila], inicio[fila + 1]):
+                resultado[indices[k]] += valores[k] * cantidad
+        return resultado
+
+    def columna_de(self, ingrediente_id: str) -> int:
+        """Posición del ingrediente en los vectores por ingrediente, o -1 si no está"""
+        return self._columnas.get(ingrediente_id, -1)
+
+    @property
+    def costos(self) -> array:
+        """Costo de cada hot dog con los costos actuales del catálogo"""
+        if self._costos is None:
+            self._costos = self.producto(self.costos_base)
+        return self._costos
+
+    def margenes(self, costos: array = None) -> List[float]:
+        """Margen porcentual (ganancia / precio) de cada hot dog; 0 si no tiene precio"""
+        costos = self.costos if costos is None else costos
+        return [(precio - costo) / precio * 100 if precio else 0.0 for precio, costo in zip(self.precios, costos)]
+
+    def costos_con_cambios(self, factores: Dict[Union[CategoriaIngrediente, str], float]) -> array:
+        """Costos de los hot dogs si los ingredientes cambian de costo.
+
+        `factores` multiplica el costo por categoría o por ID de ingrediente
+        (p. ej. {CategoriaIngrediente.SALCHICHA: 1.2} es +20% en salchichas);
+        el ID tiene prioridad sobre la categoría.
+        """
+        return self._aplicar_cambios(factores)[0]
+
+    def _factores_por_columna(self, factores) -> Dict[int, float]:
+        por_columna = {}
+        for clave, factor in factores.items():
+            if isinstance(clave, CategoriaIngrediente):
+                for columna in self.columnas_por_categoria.get(clave, ()):
+                    por_columna.setdefault(columna, factor)
+        for clave, factor in factores.items():
+            if not isinstance(clave, CategoriaIngrediente) and clave in self._columnas:
+                por_columna[self._columnas[clave]] = factor
+        return por_columna
+
+    def _aplicar_cambios(self, factores):
+        """Costos nuevos y filas tocadas; solo se recorren las columnas afectadas (CSC)"""
+        costos = array('d', self.costos)
+        tocadas = set()
+        for columna, factor in self._factores_por_columna(factores).items():
+            if factor == 1:
+                continue
+            diferencia = self.costos_base[columna] * (factor - 1)
+            filas = self.filas_por_columna[columna]
+            tocadas.update(filas)
+            for fila, cantidad in zip(filas, self.valores_por_columna[columna]):
+                costos[fila] += cantidad * diferencia
+        return costos, tocadas
+
+    def sensibilidad(self, factores: Dict[Union[CategoriaIngrediente, str], float], margen_minimo: float) -> List[dict]:
+        """Hot dogs que pasarían a estar por debajo de `margen_minimo` (%) con los cambios, del peor al mejor"""
+        costos_nuevos, tocadas = self._aplicar_cambios(factores)
+        afectados = []
+        # Solo los hot dogs que usan algún ingrediente con cambio pueden cruzar el umbral
+        for fila in tocadas:
+            precio = self.precios[fila]
+            if not precio:
+                continue
+            # Redondeado para que el orden de las sumas no decida los casos justo en el umbral
+            antes = round((precio - self.costos[fila]) / precio * 100, 6)
+            despues = round((precio - costos_nuevos[fila]) / precio * 100, 6)
+            if despues < margen_minimo <= antes:
+                afectados.append({'id': self.hotdog_ids[fila], 'nombre': self.nombres[fila], 'precio_venta': precio,
+                                  'margen_actual': antes, 'margen_nuevo': despues})
+        return sorted(afectados, key=lambda fila: fila['margen_nuevo'])
+
+    def resumen(self) -> List[dict]:
+        """Costo, ganancia y margen de todo el menú, del menos al más rentable"""
+        margenes = self.margenes()
+        filas = [{'id': hotdog_id, 'nombre': nombre, 'precio_venta': precio, 'costo': costo,
+                  'ganancia': precio - costo, 'margen': margen}
+                 for hotdog_id, nombre, precio, costo, margen
+                 in zip(self.hotdog_ids, self.nombres, self.precios, self.costos, margenes)]
+        return sorted(filas, key=lambda fila: fila['margen'])
@@ -0,0 +1,181 @@
+import csv
+import hashlib
+import itertools
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import replace
+from typing import Dict, List, Optional
+from inventario import Inventario, EXISTENCIAS_POR_DEFECTO
+from hotdogs import HotDog
+from menu import Menu
+from gestor_ingredientes import GestorIngredientes
+from guardado_seguro import escribir_atomico
+from simulacion_ventas import SimulacionVentas
+
+# Valores usados para los parámetros que no aparecen en la cuadrícula
+PARAMETROS_POR_DEFECTO = {
+    'multiplicador_precio': 1.0,
+    'escala_existencias': 1.0,
+    'clientes_por_dia': None,
+    'dias': 1,
+    'semilla': 0
+}
+
+# Catálogo y menú compartidos, cargados una sola vez por proceso trabajador
+_contexto_trabajador = {}
+
+def _inicializar_trabajador(datos_catalogo: Dict):
+    gestor_ingredientes = GestorIngredientes()
+    gestor_ingredientes.cargar_desde_lista(datos_catalogo['ingredientes'])
+    hotdogs = [HotDog.from_dict(hd_data, gestor_ingredientes) for hd_data in datos_catalogo['menu']]
+    _contexto_trabajador['ingredientes'] = gestor_ingredientes.ingredientes
+    _contexto_trabajador['hotdogs'] = hotdogs
+
+def _ejecutar_celda(parametros: Dict) -> Dict:
+    """Simula una celda de la cuadrícula usando el contexto del trabajador"""
+    ingredientes = _contexto_trabajador['ingredientes']
+
+    # Existencias iniciales escaladas a partir de las constantes por defecto
+    escala = parametros['escala_existencias']
+    cantidades = {categoria: int(round(cantidad * escala)) for categoria, cantidad in EXISTENCIAS_POR_DEFECTO.items()}
+    inventario = Inventario()
+    inventario.inicializar_por_categoria(ingredientes, cantidades)
+
+    # Copias con el precio ajustado: el menú compartido no se modifica
+    menu = Menu()
+    multiplicador = parametros['multiplicador_precio']
+    for hotdog in _contexto_trabajador['hotdogs']:
+        menu.agregar_hotdog(replace(hotdog, precio_venta=hotdog.precio_venta * multiplicador))
+
+    simulador = SimulacionVentas(menu, inventario, semilla=parametros['semilla'], silencioso=True)
+    resultados = simulador.simular(parametros['dias'], parametros['clientes_por_dia'])
+
+    return {
+        'total_clientes': resultados['total_clientes'],
+        'ventas_exitosas': resultados['ventas_exitosas'],
+        'clientes_no_pudieron_comprar': resultados['clientes_no_pudieron_comprar'],
+        'total_hotdogs_vendidos': resultados['total_hotdogs_vendidos'],
+        'hotdogs_no_vendidos': resultados['hotdogs_no_vendidos'],
+        'ingredientes_agotados': resultados['ingredientes_agotados'],
+        'ingresos_totales': round(resultados['ingresos_totales'], 2),
+        'costos_totales': round(resultados['costos_totales'], 2),
+        'ganancia_neta': round(resultados['ganancia_neta'], 2)
+    }
+
+class BarridoParametros:
+    """Ejecuta simulaciones sobre una cuadrícula de precios, existencias y clientes"""
+
+    def __init__(self, gestor_ingredientes: GestorIngredientes, menu: Menu,
+                 archivo_cache: str = "barrido_cache.json", trabajadores: Optional[int] = None,
+                 intervalo_guardado: float = 1.0):
+        self.datos_catalogo = {
+            'ingredientes': [ing.to_dict() for ing in gestor_ingredientes.ingredientes],
+            'menu': [hd.to_dict() for hd in menu.hotdogs]
+        }
+        texto_catalogo = json.dumps(self.datos_catalogo, sort_keys=True, ensure_ascii=False)
+        self.huella_catalogo = hashlib.sha256(texto_catalogo.encode('utf-8')).hexdigest()
+        self.archivo_cache = archivo_cache
+        self.trabajadores = trabajadores
+        # Segundos mínimos entre dos escrituras del cache mientras terminan celdas
+        self.intervalo_guardado = intervalo_guardado
+        self.cache = self._cargar_cache()
+
+    def _cargar_cache(self) -> Dict[str, Dict]:
+        if self.archivo_cache and os.path.exists(self.archivo_cache):
+            try:
+                with open(self.archivo_cache, 'r', encoding='utf-8') as f:
+                    return json.load(f)
+            except (OSError, ValueError) as e:
+                print(f"Cache del barrido ignorado: {e}")
+        return {}
+
+    def _guardar_cache(self):
+        if not self.archivo_cache:
+            return
+        escribir_atomico(self.archivo_cache, lambda f: json.dump(self.cache, f, ensure_ascii=False), conservar_respaldo=False)
+
+    def expandir_cuadricula(self, cuadricula: Dict[str, List]) -> List[Dict]:
+        """Convierte {'parametro': [valores]} en la lista de combinaciones a simular"""
+        desconocidos = set(cuadricula) - set(PARAMETROS_POR_DEFECTO)
+        if desconocidos:
+            raise ValueError(f"Parámetros desconocidos: {', '.join(sorted(desconocidos))}")
+
+        claves = list(cuadricula)
+        celdas = []
+        for valores in itertools.product(*(cuadricula[clave] for clave in claves)):
+            celda = dict(PARAMETROS_POR_DEFECTO)
+            celda.update(zip(claves, valores))
+            celdas.append(celda)
+        return celdas
+
+    def clave_celda(self, parametros: Dict) -> str:
+        """Hash de los parámetros y del catálogo usado; identifica el resultado en el cache"""
+        texto = json.dumps({'catalogo': self.huella_catalogo, 'parametros': parametros}, sort_keys=True)
+        return hashlib.sha256(texto.encode('utf-8')).hexdigest()
+
+    def ejecutar(self, cuadricula: Dict[str, List]) -> List[Dict]:
+        """Simula las celdas que no estén en cache y devuelve una fila por celda"""
+        celdas = self.expandir_cuadricula(cuadricula)
+        claves = [self.clave_celda(celda) for celda in celdas]
+
+        pendientes = {}
+        for clave, celda in zip(claves, celdas):
+            if clave not in self.cache:
+                pendientes[clave] = celda
+
+        print(f"Barrido: {len(celdas)} celdas, {len(celdas) - len(pendientes)} en cache, {len(pendientes)} por simular")
+
+        if pendientes:
+            self._simular_pendientes(pendientes)
+
+        filas = []
+        for clave, celda in zip(claves, celdas):
+            fila = dict(celda)
+            fila.update(self.cache[clave])
+            filas.append(fila)
+        return filas
+
+    def _simular_pendientes(self, pendientes: Dict[str, Dict]):
+        """Guarda cada celda en el cache apenas termina; lo terminado sobrevive a fallos e interrupciones"""
+        errores = []
+        ultimo_guardado = time.monotonic()
+        try:
+            with ProcessPoolExecutor(max_workers=self.trabajadores,
+                                     initializer=_inicializar_trabajador,
+                                     initargs=(self.datos_catalogo,)) as ejecutor:
+                futuros = {ejecutor.submit(_ejecutar_celda, celda): clave for clave, celda in pendientes.items()}
+                try:
+                    for futuro in as_completed(futuros):
+                        try:
+                            self.cache[futuros[futuro]] = futuro.result()
+                        except Exception as e:
+                            errores.append(e)
+                            continue
+                        if time.monotonic() - ultimo_guardado >= self.intervalo_guardado:
+                            self._guardar_cache()
+                            ultimo_guardado = time.monotonic()
+                except BaseException:
+                    # Ctrl+C: no esperar a las celdas que ni siquiera empezaron
+                    ejecutor.shutdown(cancel_futures=True)
+                    raise
+        finally:
+            self._guardar_cache()
+        if errores:
+            raise errores[0]
+
+    @staticmethod
+    def ordenar(filas: List[Dict], columna: str, descendente: bool = True) -> List[Dict]:
+        return sorted(filas, key=lambda fila: (fila[columna] is None, fila[columna]), reverse=descendente)
+
+    @staticmethod
+    def guardar_tabla(filas: List[Dict], archivo_csv: str):
+        """Escribe los resultados como CSV para ordenarlos o filtrarlos fuera del sistema"""
+        if not filas:
+            return
+        with open(archivo_csv, 'w', encoding='utf-8', newline='') as f:
+            escritor = csv.DictWriter(f, fieldnames=list(filas[0]))
+            escritor.writeheader()
+            escritor.writerows(filas)
+        print(f"Resultados del barrido guardados en {archivo_csv}")
@@ -0,0 +1,65 @@
+"""Mide el arranque en frío: tiempo de importación y tiempo hasta tener el menú listo, por fase.
+
+Cada repetición corre en un proceso nuevo para que ningún módulo quede importado.
+Uso: python benchmark_arranque.py [--ingredientes 10000] [--repeticiones 5] [--formato json]
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+from benchmark_instantanea import generar_datos
+from almacenamiento import crear_almacenamiento
+
+# Se ejecuta en el proceso hijo; imprime una línea JSON con las mediciones
+_PROGRAMA = """
+import contextlib, io, json, sys, time
+inicio = time.perf_counter()
+from sistema import SistemaHotDog
+importacion = time.perf_counter() - inicio
+sistema = SistemaHotDog(sys.argv[1], menu_perezoso=True, priorizar_datos_locales=True)
+# La actualización del catálogo corre en segundo plano y no retrasa el menú
+sistema.iniciar_actualizacion_catalogo = lambda: None
+with contextlib.redirect_stdout(io.StringIO()):
+    sistema.preparar()
+listo = time.perf_counter() - inicio
+print(json.dumps({'importacion': importacion, 'listo': listo, 'fases': sistema.tiempos_arranque,
+                  'requests_importado': 'requests' in sys.modules}))
+"""
+
+def medir_arranque(ruta: str) -> dict:
+    directorio = os.path.dirname(os.path.abspath(__file__))
+    salida = subprocess.run([sys.executable, "-c", _PROGRAMA, ruta], cwd=directorio,
+                            capture_output=True, text=True, check=True)
+    return json.loads(salida.stdout.strip().splitlines()[-1])
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--ingredientes', type=int, default=10_000)
+    parser.add_argument('--repeticiones', type=int, default=5)
+    parser.add_argument('--formato', choices=['json', 'db', 'hdsnap'], default='json')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directorio:
+        ruta = os.path.join(directorio, f"datos_locales.{args.formato}")
+        almacenamiento = crear_almacenamiento(ruta)
+        almacenamiento.guardar(*generar_datos(args.ingredientes))
+        if hasattr(almacenamiento, 'cerrar'):
+            almacenamiento.cerrar()
+
+        mediciones = [medir_arranque(ruta) for _ in range(args.repeticiones)]
+
+    fases = sorted({fase for medicion in mediciones for fase in medicion['fases']})
+    print(f"Arranque con {args.ingredientes} ingredientes ({args.formato}), mediana de {args.repeticiones} procesos")
+    print("-" * 50)
+    print(f"{'importación':<22} {statistics.median(m['importacion'] for m in mediciones) * 1000:>10.1f} ms")
+    for fase in fases:
+        mediana = statistics.median(m['fases'].get(fase, 0.0) for m in mediciones)
+        print(f"{'  ' + fase:<22} {mediana * 1000:>10.1f} ms")
+    print(f"{'listo para el menú':<22} {statistics.median(m['listo'] for m in mediciones) * 1000:>10.1f} ms")
+    print(f"requests importado: {'sí' if any(m['requests_importado'] for m in mediciones) else 'no'}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""Compara tiempos de carga y guardado entre el JSON local y la instantánea binaria.
+
+Uso: python benchmark_instantanea.py [--tamanos 10000 100000 1000000]
+"""
+import argparse
+import os
+import tempfile
+import time
+from ingredientes import Ingrediente, CategoriaIngrediente
+from inventario import Inventario
+from hotdogs import HotDog
+from menu import Menu
+from gestor_ingredientes import GestorIngredientes
+from almacenamiento import AlmacenamientoJSON
+from instantanea_binaria import AlmacenamientoBinario
+
+def generar_datos(num_ingredientes: int):
+    """Catálogo sintético con un hot dog por cada 20 ingredientes"""
+    categorias = list(CategoriaIngrediente)
+    ingredientes = []
+    for i in range(num_ingredientes):
+        categoria = categorias[i % len(categorias)]
+        ingredientes.append(Ingrediente(id=f"ing_{i:07d}", nombre=f"ingrediente {i}", categoria=categoria,
+                                        tipo=f"tipo {i % 37}", costo=0.25 + (i % 17) * 0.1))
+    existencias = {ing.id: (i * 7) % 120 for i, ing in enumerate(ingredientes)}
+
+    por_categoria = {categoria: [ing for ing in ingredientes if ing.categoria == categoria] for categoria in categorias}
+    hotdogs = []
+    for i in range(max(1, num_ingredientes // 20)):
+        def elegir(categoria, desplazamiento=0):
+            opciones = por_categoria[categoria]
+            return opciones[(i + desplazamiento) % len(opciones)]
+        hotdogs.append(HotDog(
+            id=f"hd_{i:07d}",
+            nombre=f"hot dog {i}",
+            pan=elegir(CategoriaIngrediente.PAN),
+            salchicha=elegir(CategoriaIngrediente.SALCHICHA),
+            toppings=[elegir(CategoriaIngrediente.TOPPING), elegir(CategoriaIngrediente.TOPPING, 1)],
+            salsas=[elegir(CategoriaIngrediente.SALSA)],
+            acompanante=elegir(CategoriaIngrediente.ACOMPANANTE) if i % 2 else None,
+            precio_venta=5.0 + (i % 5) * 0.5
+        ))
+    return ingredientes, existencias, hotdogs
+
+def medir(almacenamiento, ingredientes, existencias, hotdogs):
+    inicio = time.perf_counter()
+    almacenamiento.guardar(ingredientes, existencias, hotdogs)
+    tiempo_guardado = time.perf_counter() - inicio
+
+    inicio = time.perf_counter()
+    almacenamiento.cargar(GestorIngredientes(), Inventario(), Menu())
+    tiempo_carga = time.perf_counter() - inicio
+    return tiempo_guardado, tiempo_carga, os.path.getsize(almacenamiento.ruta)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--tamanos', type=int, nargs='+', default=[10_000, 100_000, 1_000_000])
+    args = parser.parse_args()
+
+    print(f"{'INGREDIENTES':>12} {'FORMATO':<8} {'GUARDAR (s)':>12} {'CARGAR (s)':>11} {'TAMAÑO (MB)':>12}")
+    print("-" * 60)
+    with tempfile.TemporaryDirectory() as directorio:
+        for tamano in args.tamanos:
+            datos = generar_datos(tamano)
+            backends = [
+                ('json', AlmacenamientoJSON(os.path.join(directorio, f"datos_{tamano}.json"))),
+                ('binario', AlmacenamientoBinario(os.path.join(directorio, f"datos_{tamano}.hdsnap")))
+            ]
+            for formato, almacenamiento in backends:
+                guardado, carga, tamano_archivo = medir(almacenamiento, *datos)
+                print(f"{tamano:>12} {formato:<8} {guardado:>12.3f} {carga:>11.3f} {tamano_archivo / 1e6:>12.2f}")
+
+if __name__ == "__main__":
+    main()
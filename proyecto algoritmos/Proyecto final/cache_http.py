@@ -0,0 +1,105 @@
+import hashlib
+import json
+import os
+import time
+from typing import Optional
+from guardado_seguro import escribir_atomico
+
+class RespuestaCacheada:
+    """Respuesta HTTP mínima con la misma interfaz que usa el sistema (status_code, json())"""
+
+    def __init__(self, status_code: int, contenido: bytes, origen: str):
+        self.status_code = status_code
+        self.contenido = contenido
+        # 'red' (descarga completa), 'validada' (304) o 'cache' (sin consultar la red)
+        self.origen = origen
+
+    def json(self):
+        return json.loads(self.contenido)
+
+class CacheHTTP:
+    """Caché en disco de respuestas GET que revalida con ETag / Last-Modified.
+
+    Con `max_edad` > 0, una entrada más reciente que ese número de segundos se
+    sirve sin consultar la red.
+    """
+
+    def __init__(self, directorio: str = ".cache_http", max_edad: float = 0.0, sesion=None):
+        self.directorio = directorio
+        self.max_edad = max_edad
+        self._sesion = sesion
+        self.descargas = 0
+        self.validadas = 0
+        self.aciertos = 0
+
+    @property
+    def sesion(self):
+        # requests se importa solo cuando hace falta consultar la red
+        if self._sesion is None:
+            import requests
+            self._sesion = requests.Session()
+        return self._sesion
+
+    @sesion.setter
+    def sesion(self, sesion):
+        self._sesion = sesion
+
+    def _rutas(self, url: str):
+        clave = hashlib.sha256(url.encode('utf-8')).hexdigest()
+        base = os.path.join(self.directorio, clave)
+        return base + ".json", base + ".cuerpo"
+
+    def _leer_entrada(self, url: str) -> Optional[dict]:
+        ruta_meta, ruta_cuerpo = self._rutas(url)
+        try:
+            with open(ruta_meta, 'r', encoding='utf-8') as f:
+                entrada = json.load(f)
+            with open(ruta_cuerpo, 'rb') as f:
+                entrada['cuerpo'] = f.read()
+        except (OSError, ValueError):
+            return None
+        return entrada if entrada.get('url') == url else None
+
+    def _guardar_entrada(self, url: str, cuerpo: Optional[bytes], etag: Optional[str], ultima_modificacion: Optional[str]):
+        os.makedirs(self.directorio, exist_ok=True)
+        ruta_meta, ruta_cuerpo = self._rutas(url)
+        # El cuerpo va primero: los metadatos solo apuntan a cuerpos completos
+        if cuerpo is not None:
+            escribir_atomico(ruta_cuerpo, lambda f: f.write(cuerpo), binario=True, conservar_respaldo=False)
+        meta = {'url': url, 'etag': etag, 'ultima_modificacion': ultima_modificacion, 'fecha': time.time()}
+        escribir_atomico(ruta_meta, lambda f: json.dump(meta, f), conservar_respaldo=False)
+
+    def obtener(self, url: str, timeout: float = 10) -> RespuestaCacheada:
+        entrada = self._leer_entrada(url)
+        if entrada and self.max_edad > 0 and time.time() - entrada['fecha'] < self.max_edad:
+            self.aciertos += 1
+            return RespuestaCacheada(200, entrada['cuerpo'], 'cache')
+
+        encabezados = {}
+        if entrada:
+            if entrada.get('etag'):
+                encabezados['If-None-Match'] = entrada['etag']
+            if entrada.get('ultima_modificacion'):
+                encabezados['If-Modified-Since'] = entrada['ultima_modificacion']
+
+        respuesta = self.sesion.get(url, headers=encabezados, timeout=timeout)
+        if respuesta.status_code == 304 and entrada:
+            self.validadas += 1
+            # Solo se renueva la fecha; el cuerpo guardado sigue vigente
+            self._guardar_entrada(url, None, respuesta.headers.get('ETag', entrada.get('etag')),
+                                  respuesta.headers.get('Last-Modified', entrada.get('ultima_modificacion')))
+            return RespuestaCacheada(200, entrada['cuerpo'], 'validada')
+
+        if respuesta.status_code == 200:
+            self.descargas += 1
+            self._guardar_entrada(url, respuesta.content, respuesta.headers.get('ETag'),
+                                  respuesta.headers.get('Last-Modified'))
+        return RespuestaCacheada(respuesta.status_code, respuesta.content, 'red')
+
+    def limpiar(self):
+        """Borra todas las entradas de la caché"""
+        if not os.path.isdir(self.directorio):
+            return
+        for nombre in os.listdir(self.directorio):
+            if nombre.endswith(('.json', '.cuerpo')):
+                os.remove(os.path.join(self.directorio, nombre))
@@ -0,0 +1,348 @@
+"""Línea de comandos sin interacción para tareas por lotes.
+
+Uso: python main.py [--archivo datos_locales.json] <comando> [opciones]
+
+Comandos:
+  cargar        sincroniza con la API y guarda los datos locales
+  simular       simula N días de ventas y escribe los resultados en JSON
+  inventario    actualiza existencias desde un CSV (columnas: ingrediente, cantidad)
+  exportar      guarda una copia de los datos (.json, .db o .hdsnap según la extensión)
+  reporte       escribe en JSON el estado del catálogo, el menú y el inventario
+  factibilidad  verifica sin descontar nada si alcanza para un pedido (3 si no alcanza)
+  ventas        escribe en JSON el historial agregado de las simulaciones aplicadas
+  libro         resume un rango del libro de ventas y opcionalmente lo exporta por columnas
+  pronostico    pronostica el consumo de cada ingrediente y los días hasta agotarse
+
+Los mensajes de avance van a stderr; stdout queda solo para el JSON.
+Códigos de salida: 0 éxito, 1 error, 2 uso incorrecto, 3 éxito parcial.
+"""
+import argparse
+import contextlib
+import csv
+import json
+import os
+import sys
+import time
+from datetime import datetime
+from sistema import SistemaHotDog
+from almacenamiento import crear_almacenamiento
+from ingredientes import CategoriaIngrediente
+from inventario import ConflictoBifurcacion
+from libro_ventas import LibroVentas
+
+EXITO = 0
+ERROR = 1
+USO_INCORRECTO = 2
+EXITO_PARCIAL = 3
+
+def _escribir_json(datos, args):
+    texto = json.dumps(datos, indent=2, ensure_ascii=False)
+    if getattr(args, 'salida', None):
+        with open(args.salida, 'w', encoding='utf-8') as f:
+            f.write(texto + "\n")
+    else:
+        print(texto, file=args.stdout)
+
+def _cargar_local(sistema: SistemaHotDog) -> bool:
+    """Datos locales, o los de respaldo si no hay; nunca consulta la red"""
+    return sistema.cargar_datos_locales() or sistema._cargar_datos_respaldo()
+
+def comando_cargar(sistema: SistemaHotDog, args) -> int:
+    cargados = sistema.cargar_datos_locales()
+    if not sistema.cargar_datos_desde_api(usar_respaldo=not cargados) and not cargados:
+        return ERROR
+    if not sistema.guardar_datos_locales():
+        return ERROR
+    _escribir_json({
+        'ingredientes': len(sistema.gestor_ingredientes.ingredientes),
+        'hotdogs': len(sistema.menu.hotdogs),
+        'existencias': len(sistema.inventario.existencias)
+    }, args)
+    return EXITO
+
+def comando_simular(sistema: SistemaHotDog, args) -> int:
+    if not _cargar_local(sistema):
+        return ERROR
+    if not sistema.menu.hotdogs:
+        print("El menú está vacío, no hay nada que simular", file=sys.stderr)
+        return ERROR
+
+    inicio = time.perf_counter()
+    if args.motor == 'multipuesto':
+        from simulacion_multipuesto import SimulacionMultipuesto
+        libro = LibroVentas(args.libro) if args.libro else None
+        reporte = SimulacionMultipuesto(sistema.menu, sistema.gestor_ingredientes.ingredientes, args.puestos,
+                                        dias=args.dias, semilla=args.semilla, libro=libro).ejecutar()
+        if libro:
+            libro.cerrar()
+        resultados = {'por_puesto': reporte.por_puesto, 'por_dia': reporte.por_dia, 'flota': reporte.flota,
+                      'transferencias': reporte.transferencias, 'entregas_almacen': reporte.entregas_almacen}
+    else:
+        from simulacion_ventas import SimulacionVentas
+        from sustituciones import MotorSustituciones
+        motor_sustituciones = MotorSustituciones(sistema.gestor_ingredientes) if args.motor == 'sustituciones' else None
+        # Como en el menú interactivo, se simula sobre una bifurcación del inventario
+        inventario_simulado = sistema.inventario.bifurcar()
+        resumen_simulado = sistema.resumen_ventas.bifurcar()
+        libro = LibroVentas(args.libro) if args.libro else None
+        simulador = SimulacionVentas(sistema.menu, inventario_simulado, motor_sustituciones,
+                                     semilla=args.semilla, silencioso=True, resumen=resumen_simulado,
+                                     libro=libro)
+        resultados = simulador.simular(args.dias, args.clientes)
+        if libro:
+            libro.cerrar()
+        if args.aplicar:
+            try:
+                resultados['ingredientes_actualizados'] = inventario_simulado.confirmar()
+            except ConflictoBifurcacion as e:
+                print(f"{e}; la simulación no se aplicó", file=sys.stderr)
+                return ERROR
+            if not sistema.guardar_datos_locales():
+                return ERROR
+            # Solo las simulaciones aplicadas pasan al historial de ventas
+            sistema.resumen_ventas.incorporar(resumen_simulado)
+            sistema.guardar_resumen_ventas()
+        else:
+            inventario_simulado.descartar()
+
+    resultados['motor'] = args.motor
+    resultados['segundos'] = round(time.perf_counter() - inicio, 4)
+    _escribir_json(resultados, args)
+    return EXITO
+
+def comando_inventario(sistema: SistemaHotDog, args) -> int:
+    if not _cargar_local(sistema):
+        return ERROR
+    try:
+        with open(args.csv, newline='', encoding='utf-8') as f:
+            filas = list(csv.DictReader(f))
+    except OSError as e:
+        print(f"No se pudo leer {args.csv}: {e}", file=sys.stderr)
+        return ERROR
+
+    aplicadas = 0
+    rechazadas = []
+    for numero, fila in enumerate(filas, start=2):
+        referencia = (fila.get('ingrediente') or '').strip()
+        ingrediente = (sistema.gestor_ingredientes.buscar_por_id(referencia)
+                       or sistema.gestor_ingredientes.buscar_por_nombre(referencia)) if referencia else None
+        try:
+            cantidad = int(fila.get('cantidad', ''))
+        except ValueError:
+            cantidad = None
+        if not ingrediente or cantidad is None:
+            rechazadas.append({'linea': numero, 'fila': fila})
+            continue
+        if args.sumar:
+            cantidad += sistema.inventario.verificar_existencia(ingrediente)
+        sistema.inventario.actualizar_existencia(ingrediente, max(0, cantidad))
+        aplicadas += 1
+
+    if aplicadas and not sistema.guardar_datos_locales():
+        return ERROR
+    _escribir_json({'aplicadas': aplicadas, 'rechazadas': rechazadas}, args)
+    if rechazadas:
+        return EXITO_PARCIAL if aplicadas else ERROR
+    return EXITO
+
+def comando_exportar(sistema: SistemaHotDog, args) -> int:
+    if not _cargar_local(sistema):
+        return ERROR
+    destino = crear_almacenamiento(args.destino)
+    try:
+        destino.guardar(sistema.gestor_ingredientes.ingredientes, sistema.inventario.existencias,
+                        list(sistema.menu.hotdogs))
+    except Exception as e:
+        print(f"No se pudo exportar a {args.destino}: {e}", file=sys.stderr)
+        return ERROR
+    finally:
+        if hasattr(destino, 'cerrar'):
+            destino.cerrar()
+    print(f"Datos exportados a {args.destino}", file=sys.stderr)
+    return EXITO
+
+def comando_reporte(sistema: SistemaHotDog, args) -> int:
+    if not _cargar_local(sistema):
+        return ERROR
+    inventario = sistema.inventario
+    hotdogs = [{
+        'id': hotdog.id,
+        'nombre': hotdog.nombre,
+        'precio_venta': hotdog.precio_venta,
+        'costo_ingredientes': round(hotdog.costo_ingredientes, 2),
+        'margen': round(hotdog.margen_ganancia, 2),
+        'disponible': hotdog.verificar_inventario(inventario)
+    } for hotdog in sistema.menu.hotdogs]
+    _escribir_json({
+        'ingredientes_por_categoria': {categoria.value: len(sistema.gestor_ingredientes.listar_por_categoria(categoria))
+                                       for categoria in CategoriaIngrediente},
+        'existencias_bajas': {ing.id: inventario.verificar_existencia(ing) for ing in sistema.gestor_ingredientes.ingredientes
+                              if inventario.verificar_existencia(ing) <= args.umbral},
+        'unidades_en_inventario': sum(inventario.existencias.values()),
+        'hotdogs': hotdogs
+    }, args)
+    return EXITO
+
+def comando_factibilidad(sistema: SistemaHotDog, args) -> int:
+    from factibilidad import VerificadorFactibilidad
+    if not _cargar_local(sistema):
+        return ERROR
+    try:
+        with open(args.pedido, 'r', encoding='utf-8') as f:
+            pedido = json.load(f)
+        pedido = {str(hotdog_id): int(cantidad) for hotdog_id, cantidad in pedido.items()}
+    except (OSError, ValueError, TypeError, AttributeError) as e:
+        print(f"No se pudo leer el pedido {args.pedido}: {e}", file=sys.stderr)
+        return ERROR
+    resultado = VerificadorFactibilidad(sistema.menu, sistema.inventario).verificar(pedido, calcular_maximo=args.maximo)
+    _escribir_json(resultado.to_dict(), args)
+    return EXITO if resultado.factible else EXITO_PARCIAL
+
+def _agregado_json(agregado) -> dict:
+    return {'unidades': agregado.unidades, 'ingresos': round(agregado.ingresos, 2), 'costo': round(agregado.costo, 2),
+            'ganancia': round(agregado.ganancia, 2), 'margen': round(agregado.margen, 1), 'fallos': agregado.fallos}
+
+def comando_ventas(sistema: SistemaHotDog, args) -> int:
+    # Solo lee el historial: no hace falta cargar el catálogo
+    resumen = sistema.resumen_ventas
+    if resumen.ultimo_dia < 0:
+        print("Todavía no hay ventas registradas", file=sys.stderr)
+        return ERROR
+    datos = {
+        'top': [dict(id=hotdog_id, nombre=resumen.nombre(hotdog_id), **_agregado_json(agregado))
+                for hotdog_id, agregado in resumen.top_hotdogs(args.top, dia=args.dia, criterio=args.criterio)],
+        'por_dia': {dia: _agregado_json(agregado) for dia, agregado in resumen.comparar_dias().items()}
+    }
+    if args.dia is not None:
+        datos['por_hora'] = {hora: _agregado_json(agregado) for hora, agregado in resumen.ventas_por_hora(args.dia).items()}
+        datos['ingredientes'] = {ing_id: _agregado_json(agregado)
+                                 for ing_id, agregado in resumen.ingredientes_del_dia(args.dia).items()}
+    _escribir_json(datos, args)
+    return EXITO
+
+def _marca_tiempo(texto: str) -> float:
+    """Fecha y hora ISO (p. ej. 2025-03-01 o 2025-03-01T18:30) a segundos desde la época"""
+    try:
+        return datetime.fromisoformat(texto).timestamp()
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"fecha inválida: {texto!r}")
+
+def comando_libro(sistema: SistemaHotDog, args) -> int:
+    if not os.path.exists(args.ruta):
+        print(f"No existe el libro de ventas {args.ruta}", file=sys.stderr)
+        return ERROR
+    libro = LibroVentas(args.ruta)
+    resumen = {'ventas': 0, 'unidades': 0, 'ingresos': 0.0, 'costo': 0.0}
+    for venta in libro.recorrer(args.desde, args.hasta):
+        resumen['ventas'] += 1
+        resumen['unidades'] += venta['cantidad']
+        resumen['ingresos'] += venta['precio'] * venta['cantidad']
+        resumen['costo'] += venta['costo'] * venta['cantidad']
+    resumen['ingresos'] = round(resumen['ingresos'], 2)
+    resumen['costo'] = round(resumen['costo'], 2)
+    if args.exportar:
+        resumen['exportadas'] = libro.exportar_columnas(args.exportar, args.desde, args.hasta)
+    _escribir_json(resumen, args)
+    return EXITO
+
+def comando_pronostico(sistema: SistemaHotDog, args) -> int:
+    from pronostico import PronosticoConsumo
+    if not _cargar_local(sistema):
+        return ERROR
+    pronostico = PronosticoConsumo(sistema.menu.hotdogs, sistema.gestor_ingredientes.ingredientes, alfa=args.alfa)
+    if args.libro:
+        if not os.path.exists(args.libro):
+            print(f"No existe el libro de ventas {args.libro}", file=sys.stderr)
+            return ERROR
+        pronostico.cargar_libro(LibroVentas(args.libro).recorrer())
+    else:
+        pronostico.cargar_resumen(sistema.resumen_ventas)
+    if not pronostico.dias:
+        print("Todavía no hay ventas registradas", file=sys.stderr)
+        return ERROR
+    filas = pronostico.resumen(sistema.inventario.existencias, args.horizonte)
+    for fila in filas:
+        ingrediente = sistema.gestor_ingredientes.buscar_por_id(fila['id'])
+        fila['nombre'] = ingrediente.nombre if ingrediente else fila['id']
+    _escribir_json({'dias_de_historial': pronostico.dias, 'ingredientes': filas}, args)
+    return EXITO
+
+def crear_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="main.py", description=__doc__.splitlines()[0])
+    parser.add_argument('--archivo', default="datos_locales.json", help="archivo de datos locales")
+    subparsers = parser.add_subparsers(dest='comando', required=True)
+
+    cargar = subparsers.add_parser('cargar', aliases=['sync'], help="sincroniza con la API y guarda")
+    cargar.set_defaults(funcion=comando_cargar)
+
+    simular = subparsers.add_parser('simular', help="simula ventas")
+    simular.add_argument('--dias', type=int, default=1)
+    simular.add_argument('--semilla', type=int, default=None)
+    simular.add_argument('--clientes', type=int, default=None, help="clientes por día (por defecto, aleatorio)")
+    simular.add_argument('--motor', choices=['basico', 'sustituciones', 'multipuesto'], default='basico')
+    simular.add_argument('--puestos', type=int, default=3, help="solo para el motor multipuesto")
+    simular.add_argument('--aplicar', action='store_true', help="descuenta del inventario real y guarda las ventas en el historial")
+    simular.add_argument('--libro', default=None, help="agrega cada venta a este libro de ventas")
+    simular.set_defaults(funcion=comando_simular)
+
+    inventario = subparsers.add_parser('inventario', help="actualiza existencias desde un CSV")
+    inventario.add_argument('csv')
+    inventario.add_argument('--sumar', action='store_true', help="suma las cantidades en vez de reemplazarlas")
+    inventario.set_defaults(funcion=comando_inventario)
+
+    exportar = subparsers.add_parser('exportar', help="guarda una copia de los datos")
+    exportar.add_argument('destino')
+    exportar.set_defaults(funcion=comando_exportar)
+
+    reporte = subparsers.add_parser('reporte', help="estado del catálogo, el menú y el inventario en JSON")
+    reporte.add_argument('--umbral', type=int, default=5, help="existencia a partir de la cual se considera baja")
+    reporte.set_defaults(funcion=comando_reporte)
+
+    factibilidad = subparsers.add_parser('factibilidad', help="¿alcanza el inventario para este pedido?")
+    factibilidad.add_argument('pedido', help="archivo JSON con cantidades por ID de hot dog")
+    factibilidad.add_argument('--maximo', action='store_true', help="incluye el mayor pedido proporcional que alcanza")
+    factibilidad.set_defaults(funcion=comando_factibilidad)
+
+    ventas = subparsers.add_parser('ventas', help="historial agregado de ventas simuladas")
+    ventas.add_argument('--top', type=int, default=5)
+    ventas.add_argument('--criterio', choices=['unidades', 'ingresos', 'ganancia', 'fallos'], default='unidades')
+    ventas.add_argument('--dia', type=int, default=None, help="limita el top a un día y agrega el detalle por hora")
+    ventas.set_defaults(funcion=comando_ventas)
+
+    libro = subparsers.add_parser('libro', help="resume o exporta un rango del libro de ventas")
+    libro.add_argument('ruta')
+    libro.add_argument('--desde', type=_marca_tiempo, default=None, help="fecha y hora ISO")
+    libro.add_argument('--hasta', type=_marca_tiempo, default=None, help="fecha y hora ISO")
+    libro.add_argument('--exportar', default=None, help="directorio para la exportación por columnas")
+    libro.set_defaults(funcion=comando_libro)
+
+    pronostico = subparsers.add_parser('pronostico', help="consumo esperado por ingrediente y días hasta agotarse")
+    pronostico.add_argument('--libro', default=None, help="usa este libro de ventas en vez del historial agregado")
+    pronostico.add_argument('--alfa', type=float, default=0.3, help="peso de los días recientes (0 a 1)")
+    pronostico.add_argument('--horizonte', type=int, default=60, help="días máximos a proyectar")
+    pronostico.set_defaults(funcion=comando_pronostico)
+
+    for subparser in (cargar, simular, inventario, reporte, factibilidad, ventas, libro, pronostico):
+        subparser.add_argument('--salida', help="archivo JSON de salida (por defecto, stdout)")
+    return parser
+
+def main(argv=None) -> int:
+    args = crear_parser().parse_args(argv)
+    args.stdout = sys.stdout
+    sistema = SistemaHotDog(args.archivo)
+    try:
+        # Los mensajes del sistema van a stderr para no mezclarse con el JSON
+        with contextlib.redirect_stdout(sys.stderr):
+            codigo = args.funcion(sistema, args)
+    except KeyboardInterrupt:
+        return ERROR
+    except Exception as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return ERROR
+    finally:
+        if hasattr(sistema.almacenamiento, 'cerrar'):
+            sistema.almacenamiento.cerrar()
+    return codigo
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,113 @@
+import random
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, Tuple
+from cache_http import CacheHTTP, RespuestaCacheada
+
+class CircuitoAbierto(Exception):
+    """La API falló demasiadas veces seguidas; no se intenta de nuevo hasta que pase el enfriamiento"""
+
+class CortaCircuitos:
+    def __init__(self, umbral_fallos: int = 3, enfriamiento: float = 30.0):
+        self.umbral_fallos = umbral_fallos
+        self.enfriamiento = enfriamiento
+        self.fallos_seguidos = 0
+        self.abierto_hasta = 0.0
+        self._bloqueo = threading.Lock()
+
+    def verificar(self):
+        with self._bloqueo:
+            if self.fallos_seguidos >= self.umbral_fallos and time.monotonic() < self.abierto_hasta:
+                raise CircuitoAbierto(f"API no disponible tras {self.fallos_seguidos} fallos seguidos")
+
+    def registrar_exito(self):
+        with self._bloqueo:
+            self.fallos_seguidos = 0
+
+    def registrar_fallo(self):
+        with self._bloqueo:
+            self.fallos_seguidos += 1
+            if self.fallos_seguidos >= self.umbral_fallos:
+                self.abierto_hasta = time.monotonic() + self.enfriamiento
+
+class ClienteAPI:
+    """Descarga los recursos de la API en paralelo, una sola vez por proceso.
+
+    Usa una sesión con conexiones reutilizables, tiempos límite de conexión y
+    lectura, reintentos con espera exponencial aleatoria y un corta circuitos
+    compartido por todas las descargas.
+    """
+
+    # Errores del servidor que vale la pena reintentar
+    ESTADOS_REINTENTABLES = {429, 500, 502, 503, 504}
+
+    def __init__(self, urls: Dict[str, str], cache: CacheHTTP, tiempo_conexion: float = 3.05,
+                 tiempo_lectura: float = 10.0, reintentos: int = 3, espera_base: float = 0.5,
+                 espera_maxima: float = 4.0, corta_circuitos: CortaCircuitos = None):
+        self.urls = urls
+        self.cache = cache
+        self.tiempos: Tuple[float, float] = (tiempo_conexion, tiempo_lectura)
+        self.reintentos = reintentos
+        self.espera_base = espera_base
+        self.espera_maxima = espera_maxima
+        self.corta_circuitos = corta_circuitos or CortaCircuitos()
+
+        # La sesión y los hilos se crean con la primera descarga, así un arranque solo local no importa requests
+        self._sesion_lista = False
+        self._ejecutor = None
+        self._descargas: Dict[str, Future] = {}
+        self._bloqueo = threading.Lock()
+
+    def _preparar_sesion(self):
+        import requests
+        from requests.adapters import HTTPAdapter
+
+        sesion = requests.Session()
+        adaptador = HTTPAdapter(pool_connections=len(self.urls), pool_maxsize=len(self.urls))
+        sesion.mount("https://", adaptador)
+        sesion.mount("http://", adaptador)
+        self.cache.sesion = sesion
+        self._sesion_lista = True
+
+    def precargar(self):
+        """Inicia en segundo plano todas las descargas que aún no empezaron"""
+        for nombre in self.urls:
+            self._futuro(nombre)
+
+    def obtener(self, nombre: str) -> RespuestaCacheada:
+        """Espera la descarga del recurso; las excepciones del último intento se propagan"""
+        return self._futuro(nombre).result()
+
+    def _futuro(self, nombre: str) -> Future:
+        with self._bloqueo:
+            futuro = self._descargas.get(nombre)
+            if futuro is None:
+                if self._ejecutor is None:
+                    self._ejecutor = ThreadPoolExecutor(max_workers=len(self.urls), thread_name_prefix="api")
+                futuro = self._descargas[nombre] = self._ejecutor.submit(self._descargar, self.urls[nombre])
+            return futuro
+
+    def _descargar(self, url: str) -> RespuestaCacheada:
+        import requests
+        with self._bloqueo:
+            if not self._sesion_lista:
+                self._preparar_sesion()
+
+        for intento in range(self.reintentos + 1):
+            self.corta_circuitos.verificar()
+            try:
+                respuesta = self.cache.obtener(url, timeout=self.tiempos)
+            except requests.RequestException:
+                self.corta_circuitos.registrar_fallo()
+                if intento == self.reintentos:
+                    raise
+            else:
+                if respuesta.status_code not in self.ESTADOS_REINTENTABLES:
+                    self.corta_circuitos.registrar_exito()
+                    return respuesta
+                self.corta_circuitos.registrar_fallo()
+                if intento == self.reintentos:
+                    return respuesta
+            # Espera exponencial con variación aleatoria completa para no sincronizar reintentos
+            time.sleep(random.uniform(0, min(self.espera_maxima, self.espera_base * 2 ** intento)))
@@ -0,0 +1,155 @@
+import queue
+import threading
+import time
+from collections import Counter
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Tuple
+from hotdogs import HotDog
+from inventario import Inventario
+
+@dataclass
+class ResultadoPedido:
+    """Lo que se pudo servir de un pedido y lo que faltó para el resto"""
+    servidos: List[Tuple[HotDog, int]] = field(default_factory=list)
+    faltantes: Dict[str, int] = field(default_factory=dict)
+    completo: bool = False
+
+    @property
+    def aceptado(self) -> bool:
+        return bool(self.servidos)
+
+class ColaPedidos:
+    """Recibe pedidos de varios hilos y los descuenta del inventario por lotes.
+
+    Un hilo junta hasta `tamano_lote` pedidos o espera como máximo `intervalo`
+    segundos desde el primero; luego suma la demanda del lote y, si alcanza,
+    confirma todos los pedidos con una sola pasada sobre las existencias. Si no
+    alcanza, los pedidos se atienden en orden de llegada: ninguno pierde
+    existencias frente a uno posterior. Con `permitir_parciales` se sirve la
+    mayor cantidad posible de cada línea en vez de rechazar el pedido completo.
+    """
+
+    def __init__(self, inventario: Inventario, tamano_lote: int = 64, intervalo: float = 0.002,
+                 permitir_parciales: bool = False, bloqueo=None, al_confirmar: Callable[[], None] = None):
+        self.inventario = inventario
+        self.tamano_lote = tamano_lote
+        self.intervalo = intervalo
+        self.permitir_parciales = permitir_parciales
+        # Candado compartido con quien más escriba en el inventario
+        self.bloqueo = bloqueo or threading.Lock()
+        self.al_confirmar = al_confirmar
+        self.lotes = 0
+        self.pedidos = 0
+        self._pendientes = queue.Queue()
+        self._hilo = None
+
+    def iniciar(self):
+        if self._hilo is None:
+            self._hilo = threading.Thread(target=self._atender, name="cola-pedidos", daemon=True)
+            self._hilo.start()
+
+    def detener(self):
+        """Procesa lo que quedó en la cola y termina el hilo"""
+        if self._hilo is not None:
+            self._pendientes.put(None)
+            self._hilo.join()
+            self._hilo = None
+
+    def enviar(self, items: List[Tuple[HotDog, int]]) -> Future:
+        """Encola un pedido; el futuro se resuelve con su ResultadoPedido al confirmar el lote"""
+        futuro = Future()
+        self._pendientes.put((items, futuro))
+        return futuro
+
+    def _atender(self):
+        while True:
+            primero = self._pendientes.get()
+            if primero is None:
+                return
+            lote = [primero]
+            limite = time.monotonic() + self.intervalo
+            terminar = False
+            while len(lote) < self.tamano_lote:
+                restante = limite - time.monotonic()
+                try:
+                    siguiente = self._pendientes.get(timeout=restante) if restante > 0 else self._pendientes.get_nowait()
+                except queue.Empty:
+                    break
+                if siguiente is None:
+                    terminar = True
+                    break
+                lote.append(siguiente)
+            self._procesar_lote(lote)
+            if terminar:
+                return
+
+    def _procesar_lote(self, lote):
+        try:
+            resultados = self.confirmar_lote([items for items, _ in lote])
+        except Exception as e:
+            for _, futuro in lote:
+                futuro.set_exception(e)
+            return
+        for (_, futuro), resultado in zip(lote, resultados):
+            futuro.set_result(resultado)
+
+    def confirmar_lote(self, pedidos: List[List[Tuple[HotDog, int]]]) -> List[ResultadoPedido]:
+        """Descuenta un lote de pedidos de una vez; también se puede usar sin el hilo"""
+        # Requerimientos de cada línea, calculados fuera del candado y una sola vez por hot dog del lote
+        por_hotdog = {}
+        for items in pedidos:
+            for hotdog, _ in items:
+                if id(hotdog) not in por_hotdog:
+                    por_hotdog[id(hotdog)] = hotdog.requerimientos()
+        lineas = [[(hotdog, cantidad, por_hotdog[id(hotdog)]) for hotdog, cantidad in items] for items in pedidos]
+        demanda = Counter()
+        for pedido in lineas:
+            for _, cantidad, requerimientos in pedido:
+                for ing_id, unidades in requerimientos.items():
+                    demanda[ing_id] += unidades * cantidad
+
+        with self.bloqueo:
+            existencias = self.inventario.existencias
+            disponibles = {ing_id: existencias.get(ing_id, 0) for ing_id in demanda}
+
+            if all(disponibles[ing_id] >= cantidad for ing_id, cantidad in demanda.items()):
+                # Caso común: alcanza para todo el lote
+                resultados = [ResultadoPedido(servidos=list(items), completo=True) for items in pedidos]
+                for ing_id, cantidad in demanda.items():
+                    existencias[ing_id] = disponibles[ing_id] - cantidad
+            else:
+                resultados = [self._asignar(pedido, disponibles) for pedido in lineas]
+                for ing_id, cantidad in disponibles.items():
+                    existencias[ing_id] = cantidad
+
+        self.lotes += 1
+        self.pedidos += len(pedidos)
+        if self.al_confirmar and any(resultado.aceptado for resultado in resultados):
+            self.al_confirmar()
+        return resultados
+
+    def _asignar(self, pedido, disponibles: Dict[str, int]) -> ResultadoPedido:
+        """Reserva el pedido sobre las existencias restantes del lote, en orden de llegada"""
+        necesarios = Counter()
+        for _, cantidad, requerimientos in pedido:
+            for ing_id, unidades in requerimientos.items():
+                necesarios[ing_id] += unidades * cantidad
+        faltantes = {ing_id: cantidad - disponibles[ing_id] for ing_id, cantidad in necesarios.items()
+                     if disponibles[ing_id] < cantidad}
+        if not faltantes:
+            for ing_id, cantidad in necesarios.items():
+                disponibles[ing_id] -= cantidad
+            return ResultadoPedido(servidos=[(hotdog, cantidad) for hotdog, cantidad, _ in pedido], completo=True)
+
+        resultado = ResultadoPedido(faltantes=faltantes)
+        if not self.permitir_parciales:
+            return resultado
+        for hotdog, cantidad, requerimientos in pedido:
+            posibles = min(cantidad, min((disponibles[ing_id] // unidades for ing_id, unidades in requerimientos.items()),
+                                         default=0))
+            if posibles > 0:
+                for ing_id, unidades in requerimientos.items():
+                    disponibles[ing_id] -= unidades * posibles
+                resultado.servidos.append((hotdog, posibles))
+        return resultado
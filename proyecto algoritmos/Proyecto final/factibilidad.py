@@ -0,0 +1,97 @@
+from dataclasses import dataclass, field
+from typing import Dict, List, Tuple
+from hotdogs import HotDog
+from inventario import Inventario
+from menu import Menu
+
+@dataclass
+class ResultadoFactibilidad:
+    """Respuesta a "¿alcanza el inventario para este pedido?" sin haber tocado las existencias"""
+    factible: bool
+    necesarios: Dict[str, int] = field(default_factory=dict)
+    faltantes: Dict[str, int] = field(default_factory=dict)
+    desconocidos: List[str] = field(default_factory=list)
+    # Solo si se pidió: el mayor pedido proporcional que sí alcanza
+    pedido_maximo: Dict[str, int] = None
+    escala: float = None
+
+    def to_dict(self) -> dict:
+        datos = {'factible': self.factible, 'necesarios': self.necesarios, 'faltantes': self.faltantes}
+        if self.desconocidos:
+            datos['desconocidos'] = self.desconocidos
+        if self.pedido_maximo is not None:
+            datos['pedido_maximo'] = self.pedido_maximo
+            datos['escala'] = round(self.escala, 4)
+        return datos
+
+class VerificadorFactibilidad:
+    """Verifica pedidos grandes (p. ej. un catering de cientos de hot dogs) de una sola vez.
+
+    Suma los ingredientes de todas las líneas y compara el total con las
+    existencias, en vez de llamar a verificar_inventario por cada unidad. Solo
+    lee el inventario, así que sirve también sobre el inventario real.
+    """
+
+    def __init__(self, menu: Menu, inventario: Inventario):
+        self.menu = menu
+        self.inventario = inventario
+        # Requerimientos por hot dog; se recalculan si el menú reemplaza el objeto
+        self._requerimientos: Dict[str, Tuple[HotDog, Dict[str, int]]] = {}
+
+    def _requerimientos_de(self, hotdog: HotDog) -> Dict[str, int]:
+        guardado = self._requerimientos.get(hotdog.id)
+        if guardado is None or guardado[0] is not hotdog:
+            guardado = self._requerimientos[hotdog.id] = (hotdog, dict(hotdog.requerimientos()))
+        return guardado[1]
+
+    def verificar(self, pedido: Dict[str, int], calcular_maximo: bool = False) -> ResultadoFactibilidad:
+        """`pedido` va de ID de hot dog a cantidad; los IDs que no están en el menú se informan aparte"""
+        lineas = []
+        desconocidos = []
+        necesarios = {}
+        for hotdog_id, cantidad in pedido.items():
+            hotdog = self.menu.buscar_por_id(hotdog_id)
+            if hotdog is None:
+                desconocidos.append(hotdog_id)
+                continue
+            if cantidad <= 0:
+                continue
+            requerimientos = self._requerimientos_de(hotdog)
+            lineas.append((hotdog_id, cantidad, requerimientos))
+            for ing_id, unidades in requerimientos.items():
+                necesarios[ing_id] = necesarios.get(ing_id, 0) + unidades * cantidad
+
+        existencias = self.inventario.existencias
+        faltantes = {}
+        for ing_id, cantidad in necesarios.items():
+            disponible = existencias.get(ing_id, 0)
+            if disponible < cantidad:
+                faltantes[ing_id] = cantidad - disponible
+        resultado = ResultadoFactibilidad(factible=not faltantes and not desconocidos, necesarios=necesarios,
+                                          faltantes=faltantes, desconocidos=desconocidos)
+        if calcular_maximo:
+            resultado.escala, resultado.pedido_maximo = self._pedido_maximo(lineas, necesarios)
+        return resultado
+
+    def _pedido_maximo(self, lineas, necesarios: Dict[str, int]) -> Tuple[float, Dict[str, int]]:
+        """Reduce todas las líneas por el mismo factor y reparte lo que sobre entre las líneas"""
+        existencias = self.inventario.existencias
+        escala = min([1.0] + [existencias.get(ing_id, 0) / cantidad for ing_id, cantidad in necesarios.items()])
+        maximo = {hotdog_id: int(cantidad * escala) for hotdog_id, cantidad, _ in lineas}
+
+        # Al redondear hacia abajo siempre alcanza; lo que sobra se da primero a las líneas que más perdieron
+        restantes = {ing_id: existencias.get(ing_id, 0) for ing_id in necesarios}
+        for hotdog_id, _, requerimientos in lineas:
+            for ing_id, unidades in requerimientos.items():
+                restantes[ing_id] -= unidades * maximo[hotdog_id]
+        pendientes = sorted(((cantidad * escala - maximo[hotdog_id], hotdog_id, cantidad, requerimientos)
+                             for hotdog_id, cantidad, requerimientos in lineas if maximo[hotdog_id] < cantidad),
+                            key=lambda linea: -linea[0])
+        for _, hotdog_id, cantidad, requerimientos in pendientes:
+            extra = min([cantidad - maximo[hotdog_id]] +
+                        [restantes[ing_id] // unidades for ing_id, unidades in requerimientos.items()])
+            if extra > 0:
+                for ing_id, unidades in requerimientos.items():
+                    restantes[ing_id] -= unidades * extra
+                maximo[hotdog_id] += extra
+        return escala, maximo
@@ -0,0 +1,171 @@
+import glob
+import os
+import shutil
+import tempfile
+import threading
+import time
+from typing import Callable, Optional
+
+def _sincronizar_directorio(directorio: str):
+    """Asegura que el renombrado quede en disco (no disponible en Windows)"""
+    if not hasattr(os, 'O_DIRECTORY'):
+        return
+    fd = os.open(directorio, os.O_RDONLY | os.O_DIRECTORY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+def ruta_respaldo(ruta: str) -> str:
+    return ruta + ".bak"
+
+def escribir_atomico(ruta: str, escribir: Callable, binario: bool = False, conservar_respaldo: bool = True):
+    """Escribe en un temporal, lo sincroniza y lo renombra sobre `ruta`.
+
+    Si el proceso muere a mitad de la escritura, `ruta` conserva la versión
+    anterior completa. La versión reemplazada queda además en `ruta.bak`.
+    """
+    directorio = os.path.dirname(os.path.abspath(ruta))
+    fd, temporal = tempfile.mkstemp(prefix=os.path.basename(ruta) + ".", suffix=".tmp", dir=directorio)
+    try:
+        if binario:
+            archivo = os.fdopen(fd, 'wb')
+        else:
+            archivo = os.fdopen(fd, 'w', encoding='utf-8')
+        with archivo:
+            escribir(archivo)
+            archivo.flush()
+            os.fsync(archivo.fileno())
+
+        if conservar_respaldo and os.path.exists(ruta):
+            _actualizar_respaldo(ruta)
+        os.replace(temporal, ruta)
+        _sincronizar_directorio(directorio)
+    except BaseException:
+        if os.path.exists(temporal):
+            os.remove(temporal)
+        raise
+
+def _actualizar_respaldo(ruta: str):
+    respaldo = ruta_respaldo(ruta)
+    # Nombre único como en escribir_atomico: dos guardados a la vez no comparten el temporal
+    fd, temporal = tempfile.mkstemp(prefix=os.path.basename(respaldo) + ".", suffix=".tmp",
+                                    dir=os.path.dirname(os.path.abspath(respaldo)))
+    os.close(fd)
+    try:
+        # Un enlace duro evita copiar el archivo completo; necesita que el nombre esté libre
+        os.remove(temporal)
+        try:
+            os.link(ruta, temporal)
+        except OSError:
+            shutil.copy2(ruta, temporal)
+        os.replace(temporal, respaldo)
+    finally:
+        # Si otro guardado ya enlazó el mismo archivo al respaldo, rename no hace nada y el temporal queda
+        if os.path.exists(temporal):
+            os.remove(temporal)
+
+def recuperar_guardado(almacenamiento) -> bool:
+    """Limpia escrituras interrumpidas y restaura el respaldo si el archivo principal está dañado.
+
+    Devuelve False solo si el archivo principal está dañado y no hay respaldo válido.
+    """
+    ruta = almacenamiento.ruta
+    # Los temporales del respaldo (<ruta>.bak.XXXX.tmp) también coinciden con <ruta>.*.tmp, y <ruta>.bak.tmp
+    # con los dos patrones: cada archivo se descarta una sola vez
+    temporales = set(glob.glob(glob.escape(ruta) + ".*.tmp") + glob.glob(glob.escape(ruta_respaldo(ruta)) + ".tmp"))
+    for temporal in sorted(temporales):
+        print(f"Descartando escritura interrumpida: {os.path.basename(temporal)}")
+        os.remove(temporal)
+
+    if not os.path.exists(ruta) or almacenamiento.validar(ruta):
+        return True
+
+    respaldo = ruta_respaldo(ruta)
+    danado = ruta + ".danado"
+    os.replace(ruta, danado)
+    if os.path.exists(respaldo) and almacenamiento.validar(respaldo):
+        shutil.copy2(respaldo, ruta)
+        print(f"⚠️  {os.path.basename(ruta)} estaba incompleto; se restauró la última copia válida "
+              f"(el archivo dañado quedó en {os.path.basename(danado)})")
+        return True
+
+    print(f"❌ {os.path.basename(ruta)} estaba incompleto y no hay copia válida "
+          f"(el archivo dañado quedó en {os.path.basename(danado)})")
+    return False
+
+class AutoGuardado:
+    """Guarda en segundo plano agrupando varios cambios seguidos en una sola escritura.
+
+    Sin `bloqueo`, cada cambio copia los datos en el momento. Con el candado que
+    protege los datos, un cambio solo queda marcado y el hilo de guardado toma
+    una única instantánea bajo ese candado justo antes de escribir.
+    """
+
+    # Marca de _pendiente: hay cambios, pero la instantánea se toma al escribir
+    _DIFERIDA = object()
+
+    def __init__(self, tomar_instantanea: Callable[[], tuple], guardar: Callable, espera: float = 2.0,
+                 bloqueo=None):
+        self.tomar_instantanea = tomar_instantanea
+        self.guardar = guardar
+        self.espera = espera
+        self.bloqueo = bloqueo
+        self.guardados = 0
+        self._pendiente = None
+        self._ultimo_cambio = 0.0
+        self._bloqueo = threading.Lock()
+        self._hay_cambios = threading.Event()
+        self._detener = threading.Event()
+        self._hilo: Optional[threading.Thread] = None
+
+    def iniciar(self):
+        if self._hilo is None:
+            self._hilo = threading.Thread(target=self._ejecutar, name="autoguardado", daemon=True)
+            self._hilo.start()
+
+    def marcar_cambio(self):
+        """Agenda un guardado; sin `bloqueo` toma ya la instantánea (copia superficial en memoria)"""
+        instantanea = self._DIFERIDA if self.bloqueo is not None else self.tomar_instantanea()
+        with self._bloqueo:
+            self._pendiente = instantanea
+            self._ultimo_cambio = time.monotonic()
+        self._hay_cambios.set()
+
+    def detener(self):
+        """Detiene el hilo escribiendo antes cualquier cambio pendiente"""
+        self._detener.set()
+        self._hay_cambios.set()
+        if self._hilo is not None:
+            self._hilo.join()
+            self._hilo = None
+        self._escribir_pendiente()
+
+    def _ejecutar(self):
+        while not self._detener.is_set():
+            self._hay_cambios.wait()
+            # Esperar a que pase `espera` sin cambios nuevos antes de escribir
+            while not self._detener.is_set():
+                with self._bloqueo:
+                    restante = self._ultimo_cambio + self.espera - time.monotonic()
+                if restante <= 0:
+                    break
+                self._detener.wait(restante)
+            if self._detener.is_set():
+                return
+            self._hay_cambios.clear()
+            self._escribir_pendiente()
+
+    def _escribir_pendiente(self):
+        with self._bloqueo:
+            instantanea, self._pendiente = self._pendiente, None
+        if instantanea is None:
+            return
+        try:
+            if instantanea is self._DIFERIDA:
+                with self.bloqueo:
+                    instantanea = self.tomar_instantanea()
+            self.guardar(*instantanea)
+            self.guardados += 1
+        except Exception as e:
+            print(f"\nError en el guardado automático: {e}")
@@ -0,0 +1,249 @@
+import mmap
+import os
+import struct
+import sys
+from array import array
+from typing import Dict, List, Optional
+from ingredientes import Ingrediente, CategoriaIngrediente
+from inventario import Inventario
+from hotdogs import HotDog
+from menu import Menu
+from gestor_ingredientes import GestorIngredientes
+from guardado_seguro import escribir_atomico
+
+# Formato de la instantánea (todo en little-endian):
+#   cabecera:  MAGIA, versión (H), número de secciones (H)
+#   tabla:     por sección, nombre (4s), desplazamiento (Q) y longitud (Q)
+#   STRS:      n (I), desplazamientos (I * n+1) y los textos UTF-8 concatenados
+#   INGR:      n (I), columnas id/nombre/tipo (I * n, índices a STRS), categoría (B * n), costo (d * n)
+#   STCK:      existencia por ingrediente (q * n, -1 si no está en el inventario)
+#   MENU:      m (I), columnas id/nombre (I * m), precio (d * m), pan/salchicha/acompañante (i * m,
+#              índices a INGR, -1 si no hay) y toppings/salsas como desplazamientos (I * m+1) + índices (i)
+MAGIA = b'HDSN'
+VERSION = 1
+_CABECERA = struct.Struct('<4sHH')
+_ENTRADA_SECCION = struct.Struct('<4sQQ')
+_CATEGORIAS = list(CategoriaIngrediente)
+
+def _a_bytes(columna: array) -> bytes:
+    if sys.byteorder == 'big':
+        columna = array(columna.typecode, columna)
+        columna.byteswap()
+    return columna.tobytes()
+
+def _leer_columna(typecode: str, buffer, inicio: int, cantidad: int):
+    columna = array(typecode)
+    fin = inicio + cantidad * columna.itemsize
+    columna.frombytes(buffer[inicio:fin])
+    if sys.byteorder == 'big':
+        columna.byteswap()
+    return columna, fin
+
+class _TablaTextos:
+    def __init__(self):
+        self.indices = {}
+        self.textos = []
+
+    def indice(self, texto: str) -> int:
+        posicion = self.indices.get(texto)
+        if posicion is None:
+            posicion = len(self.textos)
+            self.indices[texto] = posicion
+            self.textos.append(texto)
+        return posicion
+
+    def serializar(self) -> bytes:
+        codificados = [texto.encode('utf-8') for texto in self.textos]
+        desplazamientos = array('I', [0])
+        total = 0
+        for codificado in codificados:
+            total += len(codificado)
+            desplazamientos.append(total)
+        return struct.pack('<I', len(codificados)) + _a_bytes(desplazamientos) + b''.join(codificados)
+
+def _leer_textos(buffer) -> List[str]:
+    (cantidad,) = struct.unpack_from('<I', buffer, 0)
+    desplazamientos, inicio = _leer_columna('I', buffer, 4, cantidad + 1)
+    datos = bytes(buffer[inicio:inicio + desplazamientos[-1]])
+    return [datos[desplazamientos[i]:desplazamientos[i + 1]].decode('utf-8') for i in range(cantidad)]
+
+class AlmacenamientoBinario:
+    """Instantánea binaria versionada, leída por secciones a través de mmap"""
+
+    SECCIONES = ('STRS', 'INGR', 'STCK', 'MENU')
+
+    def __init__(self, ruta: str):
+        self.ruta = ruta
+
+    def existe(self) -> bool:
+        return os.path.exists(self.ruta)
+
+    def guardar(self, ingredientes: List[Ingrediente], existencias: Dict[str, int], hotdogs: List[HotDog]):
+        textos = _TablaTextos()
+        posicion_ingrediente = {}
+        for posicion, ingrediente in enumerate(ingredientes):
+            posicion_ingrediente.setdefault(ingrediente.id, posicion)
+
+        # Ingredientes en columnas
+        n = len(ingredientes)
+        ids = array('I', (textos.indice(ing.id) for ing in ingredientes))
+        nombres = array('I', (textos.indice(ing.nombre) for ing in ingredientes))
+        tipos = array('I', (textos.indice(ing.tipo) for ing in ingredientes))
+        categorias = array('B', (_CATEGORIAS.index(ing.categoria) for ing in ingredientes))
+        costos = array('d', (ing.costo for ing in ingredientes))
+        seccion_ingredientes = (struct.pack('<I', n) + _a_bytes(ids) + _a_bytes(nombres) + _a_bytes(tipos)
+                                + _a_bytes(categorias) + _a_bytes(costos))
+
+        # Existencias alineadas con los ingredientes
+        stock = array('q', (existencias.get(ing.id, -1) for ing in ingredientes))
+        seccion_stock = _a_bytes(stock)
+
+        # Recetas como arreglos de índices; -1 es un ingrediente ausente (None)
+        def indice_de(ingrediente) -> int:
+            return posicion_ingrediente[ingrediente.id] if ingrediente else -1
+
+        m = len(hotdogs)
+        hd_ids = array('I', (textos.indice(hd.id) for hd in hotdogs))
+        hd_nombres = array('I', (textos.indice(hd.nombre) for hd in hotdogs))
+        precios = array('d', (hd.precio_venta for hd in hotdogs))
+        panes = array('i', (indice_de(hd.pan) for hd in hotdogs))
+        salchichas = array('i', (indice_de(hd.salchicha) for hd in hotdogs))
+        acompanantes = array('i', (indice_de(hd.acompanante) for hd in hotdogs))
+        partes = [struct.pack('<I', m), _a_bytes(hd_ids), _a_bytes(hd_nombres), _a_bytes(precios),
+                  _a_bytes(panes), _a_bytes(salchichas), _a_bytes(acompanantes)]
+        for atributo in ('toppings', 'salsas'):
+            desplazamientos = array('I', [0])
+            indices = array('i')
+            for hotdog in hotdogs:
+                indices.extend(indice_de(ing) for ing in getattr(hotdog, atributo))
+                desplazamientos.append(len(indices))
+            partes.append(_a_bytes(desplazamientos))
+            partes.append(_a_bytes(indices))
+        seccion_menu = b''.join(partes)
+
+        secciones = [('STRS', textos.serializar()), ('INGR', seccion_ingredientes),
+                     ('STCK', seccion_stock), ('MENU', seccion_menu)]
+
+        desplazamiento = _CABECERA.size + _ENTRADA_SECCION.size * len(secciones)
+        tabla = []
+        for nombre, contenido in secciones:
+            tabla.append(_ENTRADA_SECCION.pack(nombre.encode('ascii'), desplazamiento, len(contenido)))
+            desplazamiento += len(contenido)
+
+        def escribir(f):
+            f.write(_CABECERA.pack(MAGIA, VERSION, len(secciones)))
+            f.write(b''.join(tabla))
+            for _, contenido in secciones:
+                f.write(contenido)
+
+        escribir_atomico(self.ruta, escribir, binario=True)
+
+    def validar(self, ruta: str) -> bool:
+        """Comprueba la cabecera y que todas las secciones quepan en el archivo"""
+        tamano = os.path.getsize(ruta)
+        if tamano < _CABECERA.size:
+            return False
+        with open(ruta, 'rb') as f:
+            cabecera = f.read(_CABECERA.size)
+            if len(cabecera) < _CABECERA.size:
+                return False
+            magia, _, num_secciones = _CABECERA.unpack(cabecera)
+            tabla = f.read(_ENTRADA_SECCION.size * num_secciones)
+        if magia != MAGIA or len(tabla) < _ENTRADA_SECCION.size * num_secciones:
+            return False
+        for i in range(num_secciones):
+            _, inicio, longitud = _ENTRADA_SECCION.unpack_from(tabla, i * _ENTRADA_SECCION.size)
+            if inicio + longitud > tamano:
+                return False
+        return True
+
+    def _leer_tabla(self, buffer) -> Dict[str, memoryview]:
+        magia, version, num_secciones = _CABECERA.unpack_from(buffer, 0)
+        if magia != MAGIA:
+            raise ValueError(f"{self.ruta} no es una instantánea binaria")
+        if version != VERSION:
+            raise ValueError(f"Versión de instantánea no soportada: {version}")
+
+        secciones = {}
+        for i in range(num_secciones):
+            nombre, inicio, longitud = _ENTRADA_SECCION.unpack_from(buffer, _CABECERA.size + i * _ENTRADA_SECCION.size)
+            secciones[nombre.decode('ascii')] = buffer[inicio:inicio + longitud]
+        return secciones
+
+    def cargar(self, gestor_ingredientes: GestorIngredientes, inventario: Inventario, menu: Menu,
+               incluir_inventario: bool = True, incluir_menu: bool = True):
+        """Reconstruye los objetos; las secciones omitidas no se llegan a leer del disco"""
+        # mmap no acepta archivos vacíos; uno más corto que la cabecera tampoco es una instantánea
+        if os.path.getsize(self.ruta) < _CABECERA.size:
+            raise ValueError(f"{self.ruta} está vacío o truncado")
+        with open(self.ruta, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapa:
+            buffer = memoryview(mapa)
+            try:
+                secciones = self._leer_tabla(buffer)
+                textos = _leer_textos(secciones['STRS'])
+                catalogo = self._cargar_ingredientes(secciones['INGR'], textos, gestor_ingredientes)
+                if incluir_inventario:
+                    self._cargar_existencias(secciones['STCK'], catalogo, inventario)
+                if incluir_menu:
+                    self._cargar_menu(secciones['MENU'], textos, catalogo, menu)
+            finally:
+                secciones = None
+                buffer.release()
+
+    def _cargar_ingredientes(self, seccion, textos: List[str], gestor_ingredientes: GestorIngredientes) -> List[Ingrediente]:
+        (n,) = struct.unpack_from('<I', seccion, 0)
+        ids, inicio = _leer_columna('I', seccion, 4, n)
+        nombres, inicio = _leer_columna('I', seccion, inicio, n)
+        tipos, inicio = _leer_columna('I', seccion, inicio, n)
+        categorias, inicio = _leer_columna('B', seccion, inicio, n)
+        costos, _ = _leer_columna('d', seccion, inicio, n)
+
+        catalogo = []
+        for i in range(n):
+            ingrediente_id = textos[ids[i]]
+            existente = gestor_ingredientes.buscar_por_id(ingrediente_id)
+            if existente:
+                catalogo.append(existente)
+                continue
+            ingrediente = Ingrediente(id=ingrediente_id, nombre=textos[nombres[i]], categoria=_CATEGORIAS[categorias[i]],
+                                      tipo=textos[tipos[i]], costo=costos[i])
+            gestor_ingredientes.agregar_ingrediente(ingrediente)
+            catalogo.append(ingrediente)
+        return catalogo
+
+    def _cargar_existencias(self, seccion, catalogo: List[Ingrediente], inventario: Inventario):
+        stock, _ = _leer_columna('q', seccion, 0, len(catalogo))
+        inventario.existencias.update(
+            (ingrediente.id, cantidad) for ingrediente, cantidad in zip(catalogo, stock) if cantidad >= 0
+        )
+
+    def _cargar_menu(self, seccion, textos: List[str], catalogo: List[Ingrediente], menu: Menu):
+        (m,) = struct.unpack_from('<I', seccion, 0)
+        ids, inicio = _leer_columna('I', seccion, 4, m)
+        nombres, inicio = _leer_columna('I', seccion, inicio, m)
+        precios, inicio = _leer_columna('d', seccion, inicio, m)
+        panes, inicio = _leer_columna('i', seccion, inicio, m)
+        salchichas, inicio = _leer_columna('i', seccion, inicio, m)
+        acompanantes, inicio = _leer_columna('i', seccion, inicio, m)
+        desp_toppings, inicio = _leer_columna('I', seccion, inicio, m + 1)
+        toppings, inicio = _leer_columna('i', seccion, inicio, desp_toppings[-1])
+        desp_salsas, inicio = _leer_columna('I', seccion, inicio, m + 1)
+        salsas, _ = _leer_columna('i', seccion, inicio, desp_salsas[-1])
+
+        def ingrediente_en(indice: int) -> Optional[Ingrediente]:
+            return catalogo[indice] if indice >= 0 else None
+
+        for i in range(m):
+            hotdog_id = textos[ids[i]]
+            if menu.buscar_por_id(hotdog_id):
+                continue
+            menu.agregar_hotdog(HotDog(
+                id=hotdog_id,
+                nombre=textos[nombres[i]],
+                pan=ingrediente_en(panes[i]),
+                salchicha=ingrediente_en(salchichas[i]),
+                toppings=[ingrediente_en(j) for j in toppings[desp_toppings[i]:desp_toppings[i + 1]]],
+                salsas=[ingrediente_en(j) for j in salsas[desp_salsas[i]:desp_salsas[i + 1]]],
+                acompanante=ingrediente_en(acompanantes[i]),
+                precio_venta=precios[i]
+            ))
@@ -1,27 +1,117 @@
-from typing import Dict, List
-from ingredientes import Ingrediente, CategoriaIngrediente
-
-class Inventario:
-    def __init__(self):
-        self.existencias = {}
-    
-    def agregar_ingrediente(self, ingrediente: Ingrediente, cantidad: int):
-        self.existencias[ingrediente.id] = cantidad
-    
-    def verificar_existencia(self, ingrediente: Ingrediente) -> int:
-        return self.existencias.get(ingrediente.id, 0)
-    
-    def actualizar_existencia(self, ingrediente: Ingrediente, cantidad: int):
-        self.existencias[ingrediente.id] = cantidad
-    
-    def hay_suficiente(self, ingrediente: Ingrediente, cantidad_necesaria: int) -> bool:
-        return self.verificar_existencia(ingrediente) >= cantidad_necesaria
-    
-    def listar_por_categoria(self, ingredientes: List[Ingrediente], categoria: CategoriaIngrediente) -> Dict[str, int]:
-        return {ing.nombre: self.verificar_existencia(ing) for ing in ingredientes if ing.categoria == categoria}
-    
-    def consumir_ingrediente(self, ingrediente: Ingrediente, cantidad: int) -> bool:
-        if self.hay_suficiente(ingrediente, cantidad):
-            self.existencias[ingrediente.id] -= cantidad
-            return True
-        return False
\ No newline at end of file
+from collections import ChainMap
+from typing import Dict, List
+from ingredientes import Ingrediente, CategoriaIngrediente
+
+# Existencias iniciales por categoría cuando no hay datos locales
+EXISTENCIAS_POR_DEFECTO = {
+    CategoriaIngrediente.PAN: 30,
+    CategoriaIngrediente.SALCHICHA: 25,
+    CategoriaIngrediente.TOPPING: 50,
+    CategoriaIngrediente.SALSA: 100,
+    CategoriaIngrediente.ACOMPANANTE: 20
+}
+
+class ConflictoBifurcacion(ValueError):
+    """Los cambios de una bifurcación dejarían existencias negativas en la base (se vendió lo mismo dos veces)"""
+
+    def __init__(self, faltantes: Dict[str, int]):
+        super().__init__(f"La base ya no tiene existencias para {len(faltantes)} ingredientes de la bifurcación")
+        self.faltantes = faltantes
+
+class _ExistenciasBifurcadas(ChainMap):
+    """Escrituras en el primer mapa, lecturas que caen a la base; recuerda el valor de la base al primer cambio"""
+
+    def __init__(self, base):
+        super().__init__({}, base)
+        self.originales = {}
+
+    def __setitem__(self, clave, valor):
+        if clave not in self.maps[0]:
+            self.originales[clave] = self.maps[1].get(clave, 0)
+        self.maps[0][clave] = valor
+
+    def olvidar(self):
+        self.maps[0].clear()
+        self.originales.clear()
+
+class Inventario:
+    def __init__(self):
+        self.existencias = {}
+        self.base = None
+    
+    def agregar_ingrediente(self, ingrediente: Ingrediente, cantidad: int):
+        self.existencias[ingrediente.id] = cantidad
+    
+    def verificar_existencia(self, ingrediente: Ingrediente) -> int:
+        return self.existencias.get(ingrediente.id, 0)
+    
+    def actualizar_existencia(self, ingrediente: Ingrediente, cantidad: int):
+        self.existencias[ingrediente.id] = cantidad
+    
+    def inicializar_por_categoria(self, ingredientes: List[Ingrediente], cantidades: Dict[CategoriaIngrediente, int] = None):
+        """Asigna a cada ingrediente la existencia inicial de su categoría"""
+        cantidades = cantidades or EXISTENCIAS_POR_DEFECTO
+        for ingrediente in ingredientes:
+            self.agregar_ingrediente(ingrediente, cantidades.get(ingrediente.categoria, 20))
+    
+    def hay_suficiente(self, ingrediente: Ingrediente, cantidad_necesaria: int) -> bool:
+        return self.verificar_existencia(ingrediente) >= cantidad_necesaria
+    
+    def listar_por_categoria(self, ingredientes: List[Ingrediente], categoria: CategoriaIngrediente) -> Dict[str, int]:
+        return {ing.nombre: self.verificar_existencia(ing) for ing in ingredientes if ing.categoria == categoria}
+    
+    def consumir_ingrediente(self, ingrediente: Ingrediente, cantidad: int) -> bool:
+        if self.hay_suficiente(ingrediente, cantidad):
+            self.existencias[ingrediente.id] -= cantidad
+            return True
+        return False
+    
+    def bifurcar(self) -> "Inventario":
+        """Crea una copia perezosa del inventario que solo guarda los cambios sobre esta base.
+
+        Los ingredientes que la bifurcación no tocó se leen de la base actual;
+        al confirmar se aplica la diferencia de cada cambio, no el valor final,
+        así varias bifurcaciones de la misma base se suman en vez de pisarse.
+        """
+        bifurcacion = Inventario()
+        bifurcacion.existencias = _ExistenciasBifurcadas(self.existencias)
+        bifurcacion.base = self
+        return bifurcacion
+    
+    def es_bifurcacion(self) -> bool:
+        return self.base is not None
+    
+    def cambios(self) -> Dict[str, int]:
+        """Existencias modificadas respecto a la base (vacío si no es una bifurcación)"""
+        if not self.es_bifurcacion():
+            return {}
+        return dict(self.existencias.maps[0])
+    
+    def confirmar(self) -> int:
+        """Aplica a la base la diferencia de cada cambio y devuelve cuántos ingredientes cambió.
+
+        Si otra bifurcación ya consumió lo mismo y alguna existencia quedaría
+        negativa, no aplica nada y lanza ConflictoBifurcacion.
+        """
+        if not self.es_bifurcacion():
+            return 0
+        cambios = self.existencias.maps[0]
+        originales = self.existencias.originales
+        base = self.base.existencias
+        nuevas = {ing_id: base.get(ing_id, 0) + cantidad - originales[ing_id] for ing_id, cantidad in cambios.items()}
+        faltantes = {ing_id: -cantidad for ing_id, cantidad in nuevas.items() if cantidad < 0}
+        if faltantes:
+            raise ConflictoBifurcacion(faltantes)
+        base.update(nuevas)
+        aplicados = len(nuevas)
+        self.existencias.olvidar()
+        return aplicados
+    
+    def descartar(self):
+        """Olvida los cambios de la bifurcación y vuelve a leer la base"""
+        if self.es_bifurcacion():
+            self.existencias.olvidar()
+    
+    def instantanea(self) -> Dict[str, int]:
+        """Copia plana e independiente de todas las existencias visibles"""
+        return dict(self.existencias)
@@ -0,0 +1,138 @@
+import codecs
+import json
+import os
+from typing import Callable, Iterator, Optional, Tuple
+
+class LectorJSONIncremental:
+    """Recorre un objeto JSON de primer nivel sin cargar el archivo completo.
+
+    Cada elemento de los arreglos de primer nivel se entrega por separado como
+    (clave, elemento); los valores que no son arreglos quedan en `escalares`.
+    Con `registrar_posiciones`, `posicion_elemento` guarda el rango en bytes
+    (inicio, fin) del último elemento entregado, para releerlo más tarde.
+    """
+
+    ESPACIOS = ' \t\n\r'
+
+    def __init__(self, ruta: str, tamano_bloque: int = 1 << 16,
+                 al_progresar: Optional[Callable[[int, int], None]] = None, registrar_posiciones: bool = False):
+        self.ruta = ruta
+        self.tamano_bloque = tamano_bloque
+        self.al_progresar = al_progresar
+        self.registrar_posiciones = registrar_posiciones
+        self.posicion_elemento = None
+        self.escalares = {}
+        self._decodificador = json.JSONDecoder()
+
+    def recorrer(self) -> Iterator[Tuple[str, object]]:
+        self.escalares = {}
+        self._total = os.path.getsize(self.ruta)
+        self._leidos = 0
+        self._texto = codecs.getincrementaldecoder('utf-8')()
+        self._buffer = ''
+        self._pos = 0
+        self._fin_archivo = False
+        # Carácter del buffer cuyo desplazamiento en bytes ya se conoce
+        self._marca = 0
+        self._marca_bytes = 0
+
+        with open(self.ruta, 'rb') as self._archivo:
+            self._esperar('{')
+            while True:
+                caracter = self._siguiente()
+                if caracter == '}':
+                    self._pos += 1
+                    return
+                if caracter == ',':
+                    self._pos += 1
+                    continue
+
+                clave = self._leer_valor()
+                self._esperar(':')
+                if self._siguiente() == '[':
+                    self._pos += 1
+                    yield from self._recorrer_arreglo(clave)
+                else:
+                    self.escalares[clave] = self._leer_valor()
+
+    def _recorrer_arreglo(self, clave: str) -> Iterator[Tuple[str, object]]:
+        while True:
+            caracter = self._siguiente()
+            if caracter == ']':
+                self._pos += 1
+                return
+            if caracter == ',':
+                self._pos += 1
+                continue
+            if self.registrar_posiciones:
+                inicio = self._bytes_hasta(self._pos)
+                valor = self._leer_valor()
+                self.posicion_elemento = (inicio, self._bytes_hasta(self._pos))
+                yield clave, valor
+            else:
+                yield clave, self._leer_valor()
+
+    def _bytes_hasta(self, posicion: int) -> int:
+        """Desplazamiento en bytes del carácter `posicion` del buffer, codificando solo el tramo nuevo"""
+        self._marca_bytes += len(self._buffer[self._marca:posicion].encode('utf-8'))
+        self._marca = posicion
+        return self._marca_bytes
+
+    def _leer_bloque(self) -> bool:
+        bloque = self._archivo.read(self.tamano_bloque)
+        if not bloque:
+            self._buffer += self._texto.decode(b'', final=True)
+            self._fin_archivo = True
+            return False
+
+        self._leidos += len(bloque)
+        if self.registrar_posiciones:
+            self._bytes_hasta(self._pos)
+            self._marca = 0
+        # Descartar lo ya consumido para que el buffer no crezca con el archivo
+        self._buffer = self._buffer[self._pos:] + self._texto.decode(bloque)
+        self._pos = 0
+        if self.al_progresar:
+            self.al_progresar(self._leidos, self._total)
+        return True
+
+    def _siguiente(self) -> str:
+        """Salta espacios y devuelve el siguiente carácter sin consumirlo"""
+        while True:
+            while self._pos < len(self._buffer) and self._buffer[self._pos] in self.ESPACIOS:
+                self._pos += 1
+            if self._pos < len(self._buffer):
+                return self._buffer[self._pos]
+            if not self._leer_bloque():
+                raise ValueError(f"Fin inesperado del archivo {self.ruta}")
+
+    def _esperar(self, caracter: str):
+        encontrado = self._siguiente()
+        if encontrado != caracter:
+            raise ValueError(f"Se esperaba '{caracter}' y se encontró '{encontrado}' en {self.ruta}")
+        self._pos += 1
+
+    def _leer_valor(self):
+        self._siguiente()
+        while True:
+            try:
+                valor, fin = self._decodificador.raw_decode(self._buffer, self._pos)
+                # Un número al final del buffer podría continuar en el siguiente bloque
+                if fin < len(self._buffer) or self._fin_archivo:
+                    self._pos = fin
+                    return valor
+            except json.JSONDecodeError:
+                if self._fin_archivo:
+                    raise
+            self._leer_bloque()
+
+def progreso_en_consola(etiqueta: str, paso: int = 10) -> Callable[[int, int], None]:
+    """Callback que imprime el avance de la lectura cada `paso` por ciento"""
+    ultimo = [-paso]
+
+    def mostrar(leidos: int, total: int):
+        porcentaje = int(leidos * 100 / total) if total else 100
+        if porcentaje >= ultimo[0] + paso:
+            ultimo[0] = porcentaje - porcentaje % paso
+            print(f"   {etiqueta}: {porcentaje}% ({leidos / 1e6:.1f} de {total / 1e6:.1f} MB)")
+    return mostrar
@@ -0,0 +1,189 @@
+"""Libro de ventas: registro persistente, solo de agregado, de cada venta.
+
+Cada venta es una línea JSON en `<ruta>` con la marca de tiempo, el hot dog,
+la cantidad, los ingredientes consumidos, el precio y el costo. Las ventas se
+acumulan en memoria y se escriben por lotes con una sola escritura y un fsync,
+así el costo de registrar no depende del tamaño del libro.
+
+Por cada lote se agrega una línea "<marca de tiempo> <posición>" al índice
+disperso `<ruta>.idx`; una consulta por rango de tiempo salta directamente al
+lote donde empieza el rango en vez de leer el libro desde el principio.
+"""
+import bisect
+import json
+import os
+import sys
+import threading
+import time
+from array import array
+from typing import Dict, Iterator, List, Tuple
+from hotdogs import HotDog
+
+class LibroVentas:
+    def __init__(self, ruta: str, tamano_lote: int = 256):
+        self.ruta = ruta
+        self.ruta_indice = ruta + ".idx"
+        self.tamano_lote = tamano_lote
+        # (marca de tiempo, línea JSON) de las ventas aún no escritas
+        self._pendientes: List[Tuple[float, str]] = []
+        self._ultima_marca = 0.0
+        self._bloqueo = threading.Lock()
+        # Marca de tiempo inicial y posición en bytes de cada lote escrito
+        self._marcas: List[float] = []
+        self._posiciones: List[int] = []
+        self._recuperar()
+
+    def _recuperar(self):
+        """Descarta una última línea incompleta y las entradas del índice que apuntan más allá del libro"""
+        tamano = 0
+        if os.path.exists(self.ruta):
+            with open(self.ruta, 'rb+') as f:
+                tamano = f.seek(0, os.SEEK_END)
+                # Se retrocede de a bloques hasta el último salto de línea y se corta justo después
+                final = b""
+                inicio_bloque = tamano
+                while inicio_bloque > 0 and final.count(b"\n") < 2:
+                    inicio_bloque = max(0, inicio_bloque - 64 * 1024)
+                    f.seek(inicio_bloque)
+                    final = f.read(tamano - inicio_bloque)
+                if final and not final.endswith(b"\n"):
+                    # Venta a medio escribir por una interrupción
+                    final = final[:final.rfind(b"\n") + 1]
+                    tamano = inicio_bloque + len(final)
+                    f.truncate(tamano)
+                lineas = final.splitlines()
+                if lineas:
+                    self._ultima_marca = json.loads(lineas[-1])['ts']
+
+        if os.path.exists(self.ruta_indice):
+            with open(self.ruta_indice, 'r', encoding='utf-8') as f:
+                for linea in f:
+                    partes = linea.split()
+                    if len(partes) == 2 and int(partes[1]) < tamano:
+                        self._marcas.append(float(partes[0]))
+                        self._posiciones.append(int(partes[1]))
+
+    @property
+    def ultima_marca(self) -> float:
+        """Marca de tiempo de la última venta registrada (0 si el libro está vacío)"""
+        return self._ultima_marca
+
+    def registrar(self, hotdog: HotDog, preparado: HotDog = None, cantidad: int = 1, marca_tiempo: float = None):
+        """`preparado` es lo que realmente se cocinó (con sustituciones); por defecto, el mismo hot dog"""
+        preparado = preparado or hotdog
+        with self._bloqueo:
+            # Las marcas nunca retroceden, así el índice queda ordenado aunque cambie el reloj
+            marca = max(marca_tiempo if marca_tiempo is not None else time.time(), self._ultima_marca)
+            self._ultima_marca = marca
+            self._pendientes.append((marca, json.dumps({
+                'ts': marca,
+                'hotdog': hotdog.id,
+                'cantidad': cantidad,
+                'componentes': [ingrediente.id for ingrediente in preparado.componentes()],
+                'precio': preparado.precio_venta,
+                'costo': round(preparado.costo_ingredientes, 4)
+            }, separators=(',', ':'))))
+            if len(self._pendientes) >= self.tamano_lote:
+                self._vaciar()
+
+    def vaciar(self):
+        """Escribe en disco las ventas pendientes"""
+        with self._bloqueo:
+            self._vaciar()
+
+    def _vaciar(self):
+        if not self._pendientes:
+            return
+        lote = "".join(linea + "\n" for _, linea in self._pendientes).encode('utf-8')
+        marca = self._pendientes[0][0]
+        with open(self.ruta, 'ab') as f:
+            posicion = f.tell()
+            f.write(lote)
+            f.flush()
+            os.fsync(f.fileno())
+        # El índice va después de los datos: si falta su última línea, la consulta solo empieza antes
+        with open(self.ruta_indice, 'a', encoding='utf-8') as f:
+            f.write(f"{marca!r} {posicion}\n")
+        self._marcas.append(marca)
+        self._posiciones.append(posicion)
+        self._pendientes.clear()
+
+    def cerrar(self):
+        self.vaciar()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        self.cerrar()
+
+    def recorrer(self, inicio: float = None, fin: float = None) -> Iterator[dict]:
+        """Ventas con inicio <= ts <= fin, en orden; sin límites recorre todo el libro"""
+        self.vaciar()
+        if not os.path.exists(self.ruta):
+            return
+        posicion = 0
+        if inicio is not None and self._marcas:
+            # Los lotes anteriores al que precede al primero con marca >= inicio terminan antes del rango
+            lote = bisect.bisect_left(self._marcas, inicio)
+            posicion = self._posiciones[max(0, lote - 1)]
+        with open(self.ruta, 'rb') as f:
+            f.seek(posicion)
+            for linea in f:
+                venta = json.loads(linea)
+                if inicio is not None and venta['ts'] < inicio:
+                    continue
+                if fin is not None and venta['ts'] > fin:
+                    return
+                yield venta
+
+    def exportar_columnas(self, directorio: str, inicio: float = None, fin: float = None) -> int:
+        """Escribe el rango como un arreglo binario por columna; devuelve cuántas ventas exportó.
+
+        Los IDs se guardan como códigos enteros con su diccionario aparte, y los
+        componentes (de largo variable) como una lista plana de códigos más los
+        desplazamientos de cada venta, para leerlos sin analizar texto.
+        """
+        columnas = {'ts': array('d'), 'precio': array('d'), 'costo': array('d'),
+                    'cantidad': array('q'), 'hotdog': array('q'),
+                    'componentes': array('q'), 'componentes_desde': array('q', [0])}
+        codigos_hotdog: Dict[str, int] = {}
+        codigos_ingrediente: Dict[str, int] = {}
+        for venta in self.recorrer(inicio, fin):
+            columnas['ts'].append(venta['ts'])
+            columnas['precio'].append(venta['precio'])
+            columnas['costo'].append(venta['costo'])
+            columnas['cantidad'].append(venta['cantidad'])
+            columnas['hotdog'].append(codigos_hotdog.setdefault(venta['hotdog'], len(codigos_hotdog)))
+            columnas['componentes'].extend(codigos_ingrediente.setdefault(ing_id, len(codigos_ingrediente))
+                                           for ing_id in venta['componentes'])
+            columnas['componentes_desde'].append(len(columnas['componentes']))
+
+        os.makedirs(directorio, exist_ok=True)
+        for nombre, valores in columnas.items():
+            with open(os.path.join(directorio, nombre + ".bin"), 'wb') as f:
+                valores.tofile(f)
+        esquema = {
+            'filas': len(columnas['ts']),
+            'orden_bytes': sys.byteorder,
+            'columnas': {nombre: valores.typecode for nombre, valores in columnas.items()},
+            'diccionarios': {'hotdog': list(codigos_hotdog), 'componentes': list(codigos_ingrediente)}
+        }
+        with open(os.path.join(directorio, "esquema.json"), 'w', encoding='utf-8') as f:
+            json.dump(esquema, f, ensure_ascii=False)
+        return esquema['filas']
+
+def leer_columnas(directorio: str) -> Dict[str, array]:
+    """Lee una exportación de exportar_columnas; los diccionarios quedan en la clave 'diccionarios'"""
+    with open(os.path.join(directorio, "esquema.json"), 'r', encoding='utf-8') as f:
+        esquema = json.load(f)
+    columnas = {}
+    for nombre, tipo in esquema['columnas'].items():
+        valores = array(tipo)
+        with open(os.path.join(directorio, nombre + ".bin"), 'rb') as f:
+            valores.frombytes(f.read())
+        if esquema['orden_bytes'] != sys.byteorder:
+            valores.byteswap()
+        columnas[nombre] = valores
+    columnas['diccionarios'] = esquema['diccionarios']
+    return columnas
@@ -1,4 +1,23 @@
-from sistema import SistemaHotDog
-if __name__ == "__main__":
-    sistema = SistemaHotDog()
+"""Punto de entrada del sistema.
+
+Sin argumentos abre el menú interactivo. Estas opciones activan modos del
+menú interactivo y se pueden combinar:
+  --autoguardado     guarda en segundo plano después de cada cambio
+  --menu-perezoso    lee cada receta del archivo local la primera vez que se usa
+  --local-primero    arranca con los datos locales y actualiza el catálogo en segundo plano
+
+Cualquier otro argumento usa la línea de comandos sin interacción (ver cli.py).
+"""
+import sys
+from sistema import SistemaHotDog
+
+OPCIONES_INTERACTIVAS = {'--autoguardado', '--menu-perezoso', '--local-primero'}
+
+if __name__ == "__main__":
+    opciones = set(sys.argv[1:])
+    if not opciones <= OPCIONES_INTERACTIVAS:
+        from cli import main
+        sys.exit(main())
+    sistema = SistemaHotDog(autoguardado='--autoguardado' in opciones, menu_perezoso='--menu-perezoso' in opciones,
+                            priorizar_datos_locales='--local-primero' in opciones)
     sistema.ejecutar()
\ No newline at end of file
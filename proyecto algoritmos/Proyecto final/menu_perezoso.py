@@ -0,0 +1,169 @@
+import threading
+from collections import OrderedDict
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, List, Optional
+from hotdogs import HotDog
+from ingredientes import Ingrediente
+from menu import Menu
+
+@dataclass(frozen=True)
+class ResumenHotDog:
+    """Datos mínimos de un hot dog; la receta completa se lee solo cuando se usa"""
+    id: str
+    nombre: str
+    precio_venta: float
+    # Rango en bytes dentro del JSON local o ID de la fila en SQLite
+    ubicacion: object = None
+
+class HotDogsPerezosos(Sequence):
+    """Vista de solo lectura del menú que construye cada hot dog al accederlo"""
+
+    def __init__(self, menu: "MenuPerezoso", entradas: list):
+        self._menu = menu
+        self._entradas = entradas
+
+    def __len__(self) -> int:
+        return len(self._entradas)
+
+    def __getitem__(self, indice):
+        if isinstance(indice, slice):
+            return [self._menu._materializar(entrada) for entrada in self._entradas[indice]]
+        return self._menu._materializar(self._entradas[indice])
+
+    def __iter__(self):
+        for entrada in list(self._entradas):
+            yield self._menu._materializar(entrada)
+
+    def sin_cargar(self) -> list:
+        """Entradas tal cual: ResumenHotDog para los que aún no se leyeron del almacenamiento"""
+        return list(self._entradas)
+
+    def cargar(self, entrada) -> HotDog:
+        return self._menu._materializar(entrada)
+
+class MenuPerezoso(Menu):
+    """Menú que guarda resúmenes y construye los hot dogs bajo demanda, con caché LRU.
+
+    El almacenamiento registra los resúmenes con `agregar_resumen` y la función
+    que lee la receta completa con `usar_origen`, y opcionalmente una consulta
+    que responde qué resúmenes usan un ingrediente sin leer sus recetas. Los
+    hot dogs creados durante la sesión se guardan completos y nunca se descartan.
+    """
+
+    def __init__(self, capacidad: int = 256):
+        # No se llama a Menu.__init__: `hotdogs` es una vista y no una lista
+        self.capacidad = capacidad
+        self.cargados = 0
+        self._cargar_hotdog: Optional[Callable[[ResumenHotDog], HotDog]] = None
+        self._consultar_ingrediente: Optional[Callable[[str], Iterable]] = None
+        self._entradas = []
+        self._por_id = {}
+        self._cache = OrderedDict()
+        # El guardado automático recorre el menú desde otro hilo
+        self._bloqueo = threading.RLock()
+
+    @property
+    def hotdogs(self) -> HotDogsPerezosos:
+        return HotDogsPerezosos(self, self._entradas)
+
+    def usar_origen(self, cargar_hotdog: Callable[[ResumenHotDog], HotDog],
+                    consultar_ingrediente: Callable[[str], Iterable] = None):
+        """`consultar_ingrediente` recibe el ID de un ingrediente y devuelve las ubicaciones que lo usan"""
+        with self._bloqueo:
+            self._cargar_hotdog = cargar_hotdog
+            self._consultar_ingrediente = consultar_ingrediente
+            self._cache.clear()
+
+    def agregar_resumen(self, resumen: ResumenHotDog):
+        self._entradas.append(resumen)
+        self._por_id.setdefault(resumen.id, resumen)
+
+    def agregar_hotdog(self, hotdog: HotDog):
+        self._entradas.append(hotdog)
+        self._por_id.setdefault(hotdog.id, hotdog)
+
+    def eliminar_hotdog(self, hotdog: HotDog):
+        posicion = next((i for i, entrada in enumerate(self._entradas) if entrada.id == hotdog.id), None)
+        if posicion is None:
+            raise ValueError(f"El hot dog {hotdog.id} no está en el menú")
+        with self._bloqueo:
+            # Copia nueva para no alterar las instantáneas que se estén guardando
+            self._entradas = self._entradas[:posicion] + self._entradas[posicion + 1:]
+            self._cache = OrderedDict((e, hd) for e, hd in self._cache.items() if e.id != hotdog.id)
+        restante = next((entrada for entrada in self._entradas if entrada.id == hotdog.id), None)
+        if restante:
+            self._por_id[hotdog.id] = restante
+        else:
+            self._por_id.pop(hotdog.id, None)
+
+    def reemplazar_hotdog(self, hotdog: HotDog):
+        posicion = next(i for i, entrada in enumerate(self._entradas) if entrada.id == hotdog.id)
+        with self._bloqueo:
+            self._entradas = self._entradas[:posicion] + [hotdog] + self._entradas[posicion + 1:]
+            self._cache = OrderedDict((e, hd) for e, hd in self._cache.items() if e.id != hotdog.id)
+        self._por_id[hotdog.id] = hotdog
+
+    def listar_hotdogs(self) -> HotDogsPerezosos:
+        return self.hotdogs
+
+    def buscar_por_id(self, hotdog_id: str) -> Optional[HotDog]:
+        entrada = self._por_id.get(hotdog_id)
+        return self._materializar(entrada) if entrada else None
+
+    def copia_hotdogs(self) -> HotDogsPerezosos:
+        return HotDogsPerezosos(self, list(self._entradas))
+
+    def hotdogs_con_ingrediente(self, ingrediente: Ingrediente) -> List[HotDog]:
+        """Con una consulta del origen, solo se leen las recetas de los resúmenes que usan el ingrediente"""
+        if self._consultar_ingrediente is None:
+            return super().hotdogs_con_ingrediente(ingrediente)
+        ubicaciones = set(self._consultar_ingrediente(ingrediente.id))
+        resultado = []
+        for entrada in list(self._entradas):
+            if isinstance(entrada, ResumenHotDog):
+                # Un resumen sin leer tiene la misma receta que guarda el origen
+                if entrada.ubicacion in ubicaciones:
+                    resultado.append(self._materializar(entrada))
+            elif self._hotdog_usa_ingrediente(entrada, ingrediente):
+                resultado.append(entrada)
+        return resultado
+
+    def resumenes(self) -> List[ResumenHotDog]:
+        """Nombre y precio de cada hot dog sin leer ninguna receta"""
+        return [entrada if isinstance(entrada, ResumenHotDog)
+                else ResumenHotDog(entrada.id, entrada.nombre, entrada.precio_venta)
+                for entrada in self._entradas]
+
+    def materializar_todo(self) -> Dict[ResumenHotDog, HotDog]:
+        """Lee todas las recetas pendientes y deja de depender del origen; devuelve lo que leyó"""
+        with self._bloqueo:
+            leidos = {}
+            for entrada in self._entradas:
+                if isinstance(entrada, ResumenHotDog) and entrada not in leidos:
+                    leidos[entrada] = self._cache.get(entrada) or self._cargar_hotdog(entrada)
+            if leidos:
+                self._entradas = [leidos.get(entrada, entrada) if isinstance(entrada, ResumenHotDog) else entrada
+                                  for entrada in self._entradas]
+                self._por_id = {}
+                for entrada in self._entradas:
+                    self._por_id.setdefault(entrada.id, entrada)
+                self.cargados += len(leidos)
+                self._cache.clear()
+            return leidos
+
+    def _materializar(self, entrada) -> HotDog:
+        if isinstance(entrada, HotDog):
+            return entrada
+        with self._bloqueo:
+            hotdog = self._cache.get(entrada)
+            if hotdog is not None:
+                self._cache.move_to_end(entrada)
+                return hotdog
+
+            hotdog = self._cargar_hotdog(entrada)
+            self.cargados += 1
+            self._cache[entrada] = hotdog
+            if len(self._cache) > self.capacidad:
+                self._cache.popitem(last=False)
+            return hotdog
@@ -0,0 +1,128 @@
+"""Pronóstico del consumo diario de cada ingrediente a partir del historial de ventas.
+
+Las ventas por hot dog de cada día se convierten en demanda por ingrediente
+con la matriz de recetas (MatrizMenu) y se suavizan con Holt-Winters sin
+tendencia: un nivel por ingrediente más un ajuste aditivo por día de la
+semana. El estado son columnas alineadas (una posición por ingrediente), así
+cada día nuevo actualiza todos los ingredientes en una sola pasada y no hace
+falta volver a recorrer el historial.
+"""
+import math
+from array import array
+from datetime import date, datetime
+from typing import Dict, Iterable, List, Optional
+from analisis_menu import MatrizMenu
+from hotdogs import HotDog
+from ingredientes import Ingrediente
+from resumen_ventas import ResumenVentas
+
+DIAS_POR_SEMANA = 7
+
+class PronosticoConsumo:
+    def __init__(self, hotdogs: Iterable[HotDog], ingredientes: Iterable[Ingrediente] = (),
+                 alfa: float = 0.3, gamma: float = 0.1, temporada: int = DIAS_POR_SEMANA):
+        """`alfa` suaviza el nivel y `gamma` el ajuste de cada día de la semana"""
+        self.matriz = MatrizMenu(hotdogs, ingredientes)
+        self.ingrediente_ids = self.matriz.ingrediente_ids
+        self.alfa = alfa
+        self.gamma = gamma
+        self.temporada = temporada
+        vacio = bytes(8 * len(self.ingrediente_ids))
+        self.nivel = array('d', vacio)
+        self.estacional: List[array] = [array('d', vacio) for _ in range(temporada)]
+        self.dias = 0
+        # Día de la semana (0 = lunes) del próximo día que se agregue
+        self.dia_semana = 0
+
+    def agregar_dia(self, ventas: Dict[str, float], dia_semana: int = None):
+        """Incorpora las unidades vendidas por ID de hot dog en un día; sin día de la semana, sigue al anterior"""
+        self.agregar_consumo(self.matriz.producto_transpuesto(ventas), dia_semana)
+
+    def agregar_consumo(self, consumo, dia_semana: int = None):
+        """Incorpora un día de consumo por ingrediente: un vector alineado o un dict por ID de ingrediente"""
+        if isinstance(consumo, dict):
+            vector = array('d', bytes(8 * len(self.ingrediente_ids)))
+            for ing_id, cantidad in consumo.items():
+                columna = self.matriz.columna_de(ing_id)
+                if columna >= 0:
+                    vector[columna] = cantidad
+            consumo = vector
+        posicion = (self.dia_semana if dia_semana is None else dia_semana) % self.temporada
+        estacional = self.estacional[posicion]
+
+        if self.dias == 0:
+            # El primer día fija el nivel; los ajustes semanales empiezan en cero
+            self.nivel = array('d', consumo)
+        else:
+            alfa, gamma = self.alfa, self.gamma
+            self.nivel = array('d', (alfa * (real - ajuste) + (1 - alfa) * nivel
+                                     for real, ajuste, nivel in zip(consumo, estacional, self.nivel)))
+            self.estacional[posicion] = array('d', (gamma * (real - nivel) + (1 - gamma) * ajuste
+                                                    for real, ajuste, nivel in zip(consumo, estacional, self.nivel)))
+        self.dias += 1
+        self.dia_semana = (posicion + 1) % self.temporada
+
+    def pronostico(self, dias_adelante: int = 1) -> array:
+        """Consumo esperado de cada ingrediente dentro de `dias_adelante` días (1 = el próximo día)"""
+        estacional = self.estacional[(self.dia_semana + dias_adelante - 1) % self.temporada]
+        return array('d', (max(0.0, nivel + ajuste) for nivel, ajuste in zip(self.nivel, estacional)))
+
+    def pronostico_por_ingrediente(self, dias_adelante: int = 1) -> Dict[str, float]:
+        return dict(zip(self.ingrediente_ids, self.pronostico(dias_adelante)))
+
+    def dias_hasta_agotarse(self, existencias: Dict[str, int], horizonte: int = 60) -> Dict[str, Optional[float]]:
+        """Días (con fracción) hasta que se acabe cada ingrediente; None si alcanza para todo el horizonte.
+
+        Se descuenta el pronóstico de cada día a todas las columnas a la vez,
+        así la semana con más demanda cuenta aunque hoy se consuma poco.
+        """
+        restante = array('d', (float(existencias.get(ing_id, 0)) for ing_id in self.ingrediente_ids))
+        agotado = [None] * len(restante)
+        pendientes = len(restante)
+        for dia in range(1, horizonte + 1):
+            demanda = self.pronostico(dia)
+            for columna, (stock, consumo) in enumerate(zip(restante, demanda)):
+                if agotado[columna] is None and consumo > 0 and consumo > stock:
+                    agotado[columna] = dia - 1 + max(0.0, stock) / consumo
+                    pendientes -= 1
+            if not pendientes:
+                break
+            restante = array('d', (stock - consumo for stock, consumo in zip(restante, demanda)))
+        return dict(zip(self.ingrediente_ids, agotado))
+
+    # --- Fuentes de historial ---
+
+    def cargar_resumen(self, resumen: ResumenVentas, desde_dia: int = None):
+        """Agrega los días del historial agregado; el día N de la simulación cuenta como día de la semana N % 7"""
+        inicio = self.dias if desde_dia is None else desde_dia
+        for dia in range(inicio, resumen.ultimo_dia + 1):
+            ventas = {hotdog_id: agregado.unidades for hotdog_id, agregado in resumen.por_dia_hotdog.get(dia, {}).items()}
+            self.agregar_dia(ventas, dia % self.temporada)
+
+    def cargar_libro(self, ventas: Iterable[dict]):
+        """Agrega las ventas de un libro de ventas (en orden), agrupadas por fecha; los días sin ventas cuentan como cero"""
+        fecha_actual: date = None
+        del_dia: Dict[str, float] = {}
+        for venta in ventas:
+            fecha = datetime.fromtimestamp(venta['ts']).date()
+            if fecha != fecha_actual:
+                if fecha_actual is not None:
+                    self.agregar_dia(del_dia, fecha_actual.weekday())
+                    for salto in range(1, (fecha - fecha_actual).days):
+                        self.agregar_dia({}, (fecha_actual.weekday() + salto) % self.temporada)
+                fecha_actual, del_dia = fecha, {}
+            del_dia[venta['hotdog']] = del_dia.get(venta['hotdog'], 0) + venta['cantidad']
+        if fecha_actual is not None:
+            self.agregar_dia(del_dia, fecha_actual.weekday())
+
+    def resumen(self, existencias: Dict[str, int], horizonte: int = 60) -> List[dict]:
+        """Pronóstico del próximo día y días hasta agotarse por ingrediente, del más urgente al menos"""
+        manana = self.pronostico(1)
+        semana = [self.pronostico(dia) for dia in range(1, self.temporada + 1)]
+        agotado = self.dias_hasta_agotarse(existencias, horizonte)
+        filas = [{'id': ing_id, 'existencia': existencias.get(ing_id, 0),
+                  'pronostico_manana': round(manana[columna], 2),
+                  'pronostico_semana': round(sum(dia[columna] for dia in semana), 2),
+                  'dias_hasta_agotarse': None if agotado[ing_id] is None else round(agotado[ing_id], 2)}
+                 for columna, ing_id in enumerate(self.ingrediente_ids)]
+        return sorted(filas, key=lambda fila: math.inf if fila['dias_hasta_agotarse'] is None else fila['dias_hasta_agotarse'])
@@ -0,0 +1,156 @@
+"""Prueba de carga del servicio de pedidos: peticiones por segundo y latencias p50/p99.
+
+Sin --url se levanta un servidor en este mismo proceso con un catálogo sintético
+y, al terminar, se verifica que las existencias descontadas coincidan con los
+pedidos aceptados.
+
+Uso: python prueba_carga.py [--url http://127.0.0.1:8080] [--clientes 32] [--segundos 10] [--lote 1]
+"""
+import argparse
+import http.client
+import json
+import random
+import statistics
+import threading
+import time
+from collections import Counter
+from urllib.parse import urlparse
+from benchmark_instantanea import generar_datos
+from gestor_ingredientes import GestorIngredientes
+from inventario import Inventario
+from menu import Menu
+from servidor_pedidos import ServicioPedidos, crear_servidor
+
+def percentil(valores, p: float) -> float:
+    ordenados = sorted(valores)
+    if not ordenados:
+        return 0.0
+    return ordenados[min(len(ordenados) - 1, int(p / 100 * len(ordenados)))]
+
+class Terminal(threading.Thread):
+    """Un cliente con su propia conexión persistente que alterna consultas y pedidos"""
+
+    def __init__(self, host: str, puerto: int, hotdog_ids, fin: float, proporcion_pedidos: float, semilla: int):
+        super().__init__(daemon=True)
+        self.host = host
+        self.puerto = puerto
+        self.hotdog_ids = hotdog_ids
+        self.fin = fin
+        self.proporcion_pedidos = proporcion_pedidos
+        self.random = random.Random(semilla)
+        self.latencias = []
+        self.estados = Counter()
+        self.vendidos = Counter()
+
+    def _peticion(self, conexion, metodo: str, ruta: str, cuerpo=None):
+        datos = json.dumps(cuerpo).encode('utf-8') if cuerpo is not None else None
+        encabezados = {"Content-Type": "application/json"} if datos else {}
+        inicio = time.perf_counter()
+        conexion.request(metodo, ruta, body=datos, headers=encabezados)
+        respuesta = conexion.getresponse()
+        contenido = respuesta.read()
+        self.latencias.append(time.perf_counter() - inicio)
+        self.estados[respuesta.status] += 1
+        return respuesta.status, contenido
+
+    def run(self):
+        conexion = http.client.HTTPConnection(self.host, self.puerto, timeout=10)
+        try:
+            while time.perf_counter() < self.fin:
+                hotdog_id = self.random.choice(self.hotdog_ids)
+                if self.random.random() < self.proporcion_pedidos:
+                    cantidad = self.random.randint(1, 3)
+                    estado, contenido = self._peticion(conexion, "POST", "/pedidos",
+                                                       {'items': [{'hotdog': hotdog_id, 'cantidad': cantidad}]})
+                    if estado == 201:
+                        for item in json.loads(contenido)['items']:
+                            self.vendidos[item['hotdog']] += item['cantidad']
+                else:
+                    self._peticion(conexion, "GET", f"/menu/{hotdog_id}")
+        except (OSError, http.client.HTTPException):
+            self.estados['error de conexión'] += 1
+        finally:
+            conexion.close()
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--url', default=None, help="servidor ya en marcha (por defecto, uno local con datos sintéticos)")
+    parser.add_argument('--clientes', type=int, default=32)
+    parser.add_argument('--segundos', type=float, default=10.0)
+    parser.add_argument('--pedidos', type=float, default=0.5, help="proporción de peticiones que son pedidos")
+    parser.add_argument('--ingredientes', type=int, default=2000, help="tamaño del catálogo sintético")
+    parser.add_argument('--semilla', type=int, default=0)
+    parser.add_argument('--lote', type=int, default=1, help="pedidos por lote del servidor local")
+    parser.add_argument('--intervalo', type=float, default=0.002)
+    parser.add_argument('--parciales', action='store_true')
+    args = parser.parse_args()
+
+    servidor = servicio = None
+    if args.url:
+        destino = urlparse(args.url)
+        host, puerto = destino.hostname, destino.port or 80
+        conexion = http.client.HTTPConnection(host, puerto, timeout=10)
+        conexion.request("GET", "/menu")
+        hotdog_ids = [hotdog['id'] for hotdog in json.loads(conexion.getresponse().read())]
+        conexion.close()
+    else:
+        ingredientes, existencias, hotdogs = generar_datos(args.ingredientes)
+        gestor = GestorIngredientes()
+        for ingrediente in ingredientes:
+            gestor.agregar_ingrediente(ingrediente)
+        inventario = Inventario()
+        inventario.existencias = existencias
+        menu = Menu()
+        for hotdog in hotdogs:
+            menu.agregar_hotdog(hotdog)
+        iniciales = dict(existencias)
+        servicio = ServicioPedidos(menu, inventario, gestor, tamano_lote=args.lote, intervalo=args.intervalo,
+                                   permitir_parciales=args.parciales)
+        servidor = crear_servidor(servicio, puerto=0)
+        threading.Thread(target=servidor.serve_forever, daemon=True).start()
+        host, puerto = servidor.server_address[:2]
+        hotdog_ids = [hotdog.id for hotdog in hotdogs]
+
+    if not hotdog_ids:
+        print("❌ El menú del servidor está vacío")
+        return
+
+    fin = time.perf_counter() + args.segundos
+    terminales = [Terminal(host, puerto, hotdog_ids, fin, args.pedidos, args.semilla + i) for i in range(args.clientes)]
+    inicio = time.perf_counter()
+    for terminal in terminales:
+        terminal.start()
+    for terminal in terminales:
+        terminal.join()
+    duracion = time.perf_counter() - inicio
+
+    latencias = [latencia for terminal in terminales for latencia in terminal.latencias]
+    estados = sum((terminal.estados for terminal in terminales), Counter())
+    print(f"Prueba de carga: {args.clientes} clientes durante {duracion:.1f} s")
+    print("-" * 50)
+    print(f"{'peticiones':<20} {len(latencias):>12}")
+    print(f"{'peticiones/s':<20} {len(latencias) / duracion:>12.0f}")
+    if latencias:
+        print(f"{'latencia media':<20} {statistics.mean(latencias) * 1000:>9.2f} ms")
+        print(f"{'latencia p50':<20} {percentil(latencias, 50) * 1000:>9.2f} ms")
+        print(f"{'latencia p99':<20} {percentil(latencias, 99) * 1000:>9.2f} ms")
+    for estado, cantidad in sorted(estados.items(), key=lambda par: str(par[0])):
+        print(f"{'HTTP ' + str(estado):<20} {cantidad:>12}")
+
+    if servidor:
+        servidor.shutdown()
+        servidor.server_close()
+        servicio.detener()
+        # Lo descontado debe ser exactamente lo que piden los pedidos aceptados
+        vendidos = sum((terminal.vendidos for terminal in terminales), Counter())
+        esperado = Counter()
+        for hotdog_id, cantidad in vendidos.items():
+            for ing_id, unidades in servicio.menu.buscar_por_id(hotdog_id).requerimientos().items():
+                esperado[ing_id] += unidades * cantidad
+        consistente = all(iniciales[ing_id] - servicio.inventario.existencias[ing_id] == esperado[ing_id]
+                          and servicio.inventario.existencias[ing_id] >= 0 for ing_id in iniciales)
+        print(f"Inventario consistente: {'✅ sí' if consistente else '❌ no'} "
+              f"({servicio.pedidos_aceptados} pedidos aceptados, {servicio.pedidos_rechazados} rechazados)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+import heapq
+from typing import Dict, Hashable, List, Tuple
+
+class RankingTopK:
+    """Conteos que solo crecen (ventas, fallos, faltantes) con sus K mayores siempre a mano.
+
+    Los K primeros se guardan aparte con un heap de mínimos: un elemento de
+    afuera entra solo cuando supera al peor de adentro (más conteo, o el mismo
+    conteo y apareció antes), y como los conteos nunca bajan, ningún elemento
+    de afuera puede superar a los de adentro sin pasar por esa comparación.
+    Cada suma cuesta O(log K) y pedir el top cuesta O(K log K), sin recorrer
+    todos los conteos.
+    """
+
+    def __init__(self, k: int = 10):
+        self.k = k
+        self.conteos: Dict[Hashable, int] = {}
+        # Orden de primera aparición, para que los empates salgan siempre en el mismo orden
+        self._orden: Dict[Hashable, int] = {}
+        self._miembros = set()
+        # (conteo, -orden, clave) de los miembros: en la cima queda el peor, el de menor conteo y
+        # aparición más reciente; las entradas viejas se descartan al llegar a la cima
+        self._heap: List[Tuple[int, int, Hashable]] = []
+
+    def __len__(self) -> int:
+        return len(self.conteos)
+
+    def sumar(self, clave: Hashable, cantidad: int = 1):
+        conteo = self.conteos.get(clave)
+        if conteo is None:
+            conteo = 0
+            self._orden[clave] = len(self._orden)
+        conteo = self.conteos[clave] = conteo + cantidad
+        entrada = (conteo, -self._orden[clave], clave)
+        if clave in self._miembros:
+            heapq.heappush(self._heap, entrada)
+            if len(self._heap) > 4 * self.k:
+                self._compactar()
+        elif len(self._miembros) < self.k:
+            self._miembros.add(clave)
+            heapq.heappush(self._heap, entrada)
+        else:
+            menor, menos_orden, menor_clave = self._minimo()
+            # En un empate gana el que apareció primero, igual que en top()
+            if conteo > menor or (conteo == menor and self._orden[clave] < -menos_orden):
+                heapq.heapreplace(self._heap, entrada)
+                self._miembros.discard(menor_clave)
+                self._miembros.add(clave)
+
+    def _minimo(self) -> Tuple[int, int, Hashable]:
+        """Peor miembro vigente, descartando entradas que ya no coinciden con su conteo"""
+        heap = self._heap
+        while heap[0][2] not in self._miembros or self.conteos[heap[0][2]] != heap[0][0]:
+            heapq.heappop(heap)
+        return heap[0]
+
+    def _compactar(self):
+        self._heap = [(self.conteos[clave], -self._orden[clave], clave) for clave in self._miembros]
+        heapq.heapify(self._heap)
+
+    def top(self, n: int = None) -> List[Tuple[Hashable, int]]:
+        """Los n (hasta K) mayores como (clave, conteo), de mayor a menor"""
+        n = self.k if n is None else min(n, self.k)
+        ordenados = sorted(((clave, self.conteos[clave]) for clave in self._miembros),
+                           key=lambda par: (-par[1], self._orden[par[0]]))
+        return ordenados[:n]
@@ -0,0 +1,214 @@
+import math
+from array import array
+from typing import Dict, List, Optional
+from ingredientes import Ingrediente
+from inventario import Inventario, EXISTENCIAS_POR_DEFECTO
+from menu import Menu
+from simulacion_ventas import SimulacionVentas
+
+# Las políticas trabajan sobre columnas alineadas (una posición por ingrediente)
+# y calculan todos los pedidos del día en una sola pasada.
+
+def _niveles_por_categoria(ingredientes: List[Ingrediente], niveles, fraccion_por_defecto: float) -> array:
+    """Resuelve un nivel (entero, dict por categoría o None) a una columna por ingrediente"""
+    if isinstance(niveles, dict):
+        return array('l', (int(niveles.get(ing.categoria, 0)) for ing in ingredientes))
+    if niveles is not None:
+        return array('l', [int(niveles)] * len(ingredientes))
+    return array('l', (int(EXISTENCIAS_POR_DEFECTO.get(ing.categoria, 20) * fraccion_por_defecto) for ing in ingredientes))
+
+class PoliticaReabastecimiento:
+    """Política base: nunca pide. Define el tiempo de entrega y los costos"""
+    nombre = "Sin reabastecimiento"
+
+    def __init__(self, tiempo_entrega: int = 1, costo_pedido: float = 5.0, costo_mantener: float = 0.01):
+        self.tiempo_entrega = tiempo_entrega
+        self.costo_pedido = costo_pedido
+        self.costo_mantener = costo_mantener
+
+    def preparar(self, ingredientes: List[Ingrediente]):
+        """Precalcula las columnas que la política necesite"""
+        self.num_ingredientes = len(ingredientes)
+
+    def calcular_pedidos(self, dia: int, existencias: array, en_transito: array, consumo: array) -> array:
+        return array('l', [0]) * len(existencias)
+
+class PoliticaPuntoReorden(PoliticaReabastecimiento):
+    """(s, S): si la posición de inventario cae a s o menos, se pide hasta S"""
+    nombre = "Punto de reorden (s, S)"
+
+    def __init__(self, punto_reorden=None, nivel_maximo=None, **kwargs):
+        super().__init__(**kwargs)
+        self.punto_reorden = punto_reorden
+        self.nivel_maximo = nivel_maximo
+
+    def preparar(self, ingredientes: List[Ingrediente]):
+        super().preparar(ingredientes)
+        self._s = _niveles_por_categoria(ingredientes, self.punto_reorden, 0.3)
+        self._S = _niveles_por_categoria(ingredientes, self.nivel_maximo, 1.0)
+
+    def calcular_pedidos(self, dia, existencias, en_transito, consumo):
+        return array('l', (
+            maximo - (stock + transito) if stock + transito <= minimo else 0
+            for stock, transito, minimo, maximo in zip(existencias, en_transito, self._s, self._S)
+        ))
+
+class PoliticaRevisionPeriodica(PoliticaReabastecimiento):
+    """Cada `periodo` días se pide lo necesario para llegar al nivel objetivo"""
+    nombre = "Revisión periódica"
+
+    def __init__(self, periodo: int = 2, nivel_objetivo=None, **kwargs):
+        super().__init__(**kwargs)
+        if periodo < 1:
+            raise ValueError(f"El periodo de revisión debe ser de al menos 1 día (se recibió {periodo})")
+        self.periodo = periodo
+        self.nivel_objetivo = nivel_objetivo
+
+    def preparar(self, ingredientes: List[Ingrediente]):
+        super().preparar(ingredientes)
+        self._objetivo = _niveles_por_categoria(ingredientes, self.nivel_objetivo, 1.0)
+
+    def calcular_pedidos(self, dia, existencias, en_transito, consumo):
+        if (dia + 1) % self.periodo != 0:
+            return super().calcular_pedidos(dia, existencias, en_transito, consumo)
+        return array('l', (
+            max(0, objetivo - stock - transito)
+            for stock, transito, objetivo in zip(existencias, en_transito, self._objetivo)
+        ))
+
+class PoliticaPronostico(PoliticaReabastecimiento):
+    """Pide para cubrir la demanda pronosticada (suavizado exponencial) durante la entrega y la cobertura"""
+    nombre = "Basada en pronóstico"
+
+    def __init__(self, alfa: float = 0.3, dias_cobertura: int = 1, factor_seguridad: float = 0.2, **kwargs):
+        super().__init__(**kwargs)
+        self.alfa = alfa
+        self.dias_cobertura = dias_cobertura
+        self.factor_seguridad = factor_seguridad
+
+    def preparar(self, ingredientes: List[Ingrediente]):
+        super().preparar(ingredientes)
+        self._pronostico = None
+
+    def calcular_pedidos(self, dia, existencias, en_transito, consumo):
+        if self._pronostico is None:
+            self._pronostico = array('d', (float(c) for c in consumo))
+        else:
+            alfa = self.alfa
+            self._pronostico = array('d', (
+                alfa * c + (1 - alfa) * previo for c, previo in zip(consumo, self._pronostico)
+            ))
+
+        horizonte = (max(1, self.tiempo_entrega) + self.dias_cobertura) * (1 + self.factor_seguridad)
+        return array('l', (
+            max(0, math.ceil(pronostico * horizonte) - stock - transito)
+            for stock, transito, pronostico in zip(existencias, en_transito, self._pronostico)
+        ))
+
+class ControlReabastecimiento:
+    """Aplica una política al cierre de cada día y acumula sus costos"""
+
+    def __init__(self, politica: PoliticaReabastecimiento, ingredientes: List[Ingrediente], inventario: Inventario):
+        self.politica = politica
+        self.inventario = inventario
+        self.ids = [ing.id for ing in ingredientes]
+        self.costos_unitarios = array('d', (ing.costo for ing in ingredientes))
+        politica.preparar(ingredientes)
+
+        self.en_transito = array('l', [0]) * len(self.ids)
+        self.llegadas = {}
+        self.existencias_apertura = self._leer_existencias()
+
+        self.costo_mantenimiento = 0.0
+        self.costo_pedidos = 0.0
+        self.costo_compras = 0.0
+        self.pedidos_realizados = 0
+        self.unidades_pedidas = 0
+
+    def _leer_existencias(self) -> array:
+        existencias = self.inventario.existencias
+        return array('l', (existencias.get(ing_id, 0) for ing_id in self.ids))
+
+    def cierre_de_dia(self, dia: int):
+        """Cobra el mantenimiento, coloca los pedidos del día y recibe lo que llega mañana"""
+        existencias = self._leer_existencias()
+        consumo = array('l', (max(0, apertura - cierre) for apertura, cierre in zip(self.existencias_apertura, existencias)))
+        self.costo_mantenimiento += sum(existencias) * self.politica.costo_mantener
+
+        pedidos = self.politica.calcular_pedidos(dia, existencias, self.en_transito, consumo)
+        lineas = sum(1 for cantidad in pedidos if cantidad > 0)
+        if lineas:
+            self.pedidos_realizados += lineas
+            self.unidades_pedidas += sum(pedidos)
+            self.costo_pedidos += lineas * self.politica.costo_pedido
+            self.costo_compras += sum(cantidad * costo for cantidad, costo in zip(pedidos, self.costos_unitarios))
+
+            dia_llegada = dia + max(1, self.politica.tiempo_entrega)
+            pendientes = self.llegadas.get(dia_llegada)
+            if pendientes is None:
+                self.llegadas[dia_llegada] = pedidos
+            else:
+                self.llegadas[dia_llegada] = array('l', (a + b for a, b in zip(pendientes, pedidos)))
+            self.en_transito = array('l', (a + b for a, b in zip(self.en_transito, pedidos)))
+
+        # Recepción de los pedidos que llegan al abrir el día siguiente
+        recibidos = self.llegadas.pop(dia + 1, None)
+        if recibidos is not None:
+            self.en_transito = array('l', (a - b for a, b in zip(self.en_transito, recibidos)))
+            for posicion, cantidad in enumerate(recibidos):
+                if cantidad:
+                    ing_id = self.ids[posicion]
+                    self.inventario.existencias[ing_id] = existencias[posicion] + cantidad
+                    existencias[posicion] += cantidad
+
+        self.existencias_apertura = existencias
+
+    def resumen(self) -> Dict:
+        return {
+            'politica': self.politica.nombre,
+            'costo_mantenimiento': round(self.costo_mantenimiento, 2),
+            'costo_pedidos': round(self.costo_pedidos, 2),
+            'costo_compras': round(self.costo_compras, 2),
+            'pedidos_realizados': self.pedidos_realizados,
+            'unidades_pedidas': self.unidades_pedidas
+        }
+
+def ingredientes_del_menu(menu: Menu) -> List[Ingrediente]:
+    """Ingredientes distintos usados por algún hot dog del menú, en orden de aparición"""
+    vistos = {}
+    for hotdog in menu.hotdogs:
+        for ingrediente in hotdog.componentes():
+            vistos.setdefault(ingrediente.id, ingrediente)
+    return list(vistos.values())
+
+def comparar_politicas(menu: Menu, inventario: Inventario, politicas: List[PoliticaReabastecimiento],
+                       num_dias: int, clientes_por_dia: Optional[int] = None, semilla: int = 0,
+                       ingredientes: Optional[List[Ingrediente]] = None) -> List[Dict]:
+    """Simula el mismo escenario con cada política sobre una bifurcación del inventario"""
+    ingredientes = ingredientes if ingredientes is not None else ingredientes_del_menu(menu)
+    filas = []
+    for politica in politicas:
+        inventario_escenario = inventario.bifurcar()
+        control = ControlReabastecimiento(politica, ingredientes, inventario_escenario)
+        simulador = SimulacionVentas(menu, inventario_escenario, semilla=semilla, silencioso=True)
+        simulador.reabastecimiento = control
+        resultados = simulador.simular(num_dias, clientes_por_dia)
+
+        fila = control.resumen()
+        fila['ventas_perdidas'] = resultados['hotdogs_no_vendidos']
+        fila['hotdogs_vendidos'] = resultados['total_hotdogs_vendidos']
+        fila['ganancia_bruta'] = round(resultados['ganancia_neta'], 2)
+        filas.append(fila)
+    return filas
+
+def mostrar_comparacion(filas: List[Dict], num_dias: int):
+    print("\n" + "="*90)
+    print(f"           COMPARACIÓN DE POLÍTICAS DE REABASTECIMIENTO - {num_dias} DÍAS")
+    print("="*90)
+    print(f"{'POLÍTICA':<26} {'MANTENER':>10} {'PEDIDOS':>10} {'COMPRAS':>10} {'VENDIDOS':>10} {'PERDIDAS':>10} {'GANANCIA':>10}")
+    print("-" * 90)
+    for fila in filas:
+        print(f"{fila['politica']:<26} ${fila['costo_mantenimiento']:>9.2f} ${fila['costo_pedidos']:>9.2f} "
+              f"${fila['costo_compras']:>9.2f} {fila['hotdogs_vendidos']:>10} {fila['ventas_perdidas']:>10} "
+              f"${fila['ganancia_bruta']:>9.2f}")
+    print("="*90)
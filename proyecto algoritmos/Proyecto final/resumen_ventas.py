@@ -0,0 +1,213 @@
+import heapq
+import json
+import os
+from dataclasses import dataclass, asdict
+from typing import Dict, List, Optional, Tuple
+from hotdogs import HotDog
+from ingredientes import Ingrediente
+from guardado_seguro import escribir_atomico
+from rankings import RankingTopK
+
+@dataclass
+class Agregado:
+    """Totales acumulados de un grupo de ventas (o del consumo de un ingrediente)"""
+    unidades: int = 0
+    ingresos: float = 0.0
+    costo: float = 0.0
+    fallos: int = 0
+
+    @property
+    def ganancia(self) -> float:
+        return self.ingresos - self.costo
+
+    @property
+    def margen(self) -> float:
+        """Ganancia como porcentaje de los ingresos"""
+        return self.ganancia / self.ingresos * 100 if self.ingresos else 0.0
+
+    def sumar(self, unidades: int = 0, ingresos: float = 0.0, costo: float = 0.0, fallos: int = 0):
+        self.unidades += unidades
+        self.ingresos += ingresos
+        self.costo += costo
+        self.fallos += fallos
+
+class ResumenVentas:
+    """Agregados de ventas que se actualizan con cada venta, para reportar sin recorrer las ventas.
+
+    Se guardan por (día, hora, hot dog) y por (día, ingrediente), como
+    diccionarios anidados para poder leer un día o una hora directamente, junto
+    con los totales por día y por hot dog. Cada consulta recorre solo los
+    agregados que devuelve, nunca las ventas. El top N sale de rankings que se
+    mantienen con cada venta, por día y de todo el historial.
+    """
+
+    CRITERIOS = ('unidades', 'ingresos', 'ganancia', 'fallos')
+    # Cuántos primeros guarda cada ranking; pedir más recorre los agregados
+    TOP_MANTENIDO = 10
+
+    def __init__(self):
+        self.ventas: Dict[int, Dict[int, Dict[str, Agregado]]] = {}
+        self.ingredientes: Dict[int, Dict[str, Agregado]] = {}
+        self.por_dia: Dict[int, Agregado] = {}
+        self.por_dia_hotdog: Dict[int, Dict[str, Agregado]] = {}
+        self.por_hotdog: Dict[str, Agregado] = {}
+        # Ventas que no son de un hot dog del menú (p. ej. acompañantes sueltos), por día
+        self.extras: Dict[int, Agregado] = {}
+        # Nombre de cada hot dog e ingrediente tal como se vendió, para no buscar en el menú al reportar
+        self.nombres: Dict[str, str] = {}
+        self.ultimo_dia = -1
+        # Rankings por día (None = todo el historial) y criterio
+        self._rankings: Dict[Optional[int], Dict[str, RankingTopK]] = {}
+        # Rankings que dejaron de ser válidos porque un valor bajó (ganancia de una venta a pérdida)
+        self._sin_ranking = set()
+
+    def nuevo_dia(self) -> int:
+        """Número del siguiente día en el historial"""
+        self.ultimo_dia += 1
+        return self.ultimo_dia
+
+    def _agregados_hotdog(self, dia: int, hora: int, hotdog_id: str):
+        self.ultimo_dia = max(self.ultimo_dia, dia)
+        return (self.ventas.setdefault(dia, {}).setdefault(hora, {}).setdefault(hotdog_id, Agregado()),
+                self.por_dia.setdefault(dia, Agregado()),
+                self.por_dia_hotdog.setdefault(dia, {}).setdefault(hotdog_id, Agregado()),
+                self.por_hotdog.setdefault(hotdog_id, Agregado()))
+
+    def _sumar_rankings(self, dia: int, hotdog_id: str, unidades: int = 0, ingresos: float = 0.0,
+                        costo: float = 0.0, fallos: int = 0):
+        valores = {'unidades': unidades, 'ingresos': ingresos, 'ganancia': ingresos - costo, 'fallos': fallos}
+        for alcance in (None, dia):
+            rankings = self._rankings.get(alcance)
+            if rankings is None:
+                rankings = self._rankings[alcance] = {criterio: RankingTopK(self.TOP_MANTENIDO) for criterio in self.CRITERIOS}
+            for criterio, valor in valores.items():
+                if valor < 0:
+                    self._sin_ranking.add((alcance, criterio))
+                elif (alcance, criterio) not in self._sin_ranking:
+                    rankings[criterio].sumar(hotdog_id, valor)
+
+    def _sumar_hotdog(self, dia: int, hora: int, hotdog_id: str, unidades: int = 0, ingresos: float = 0.0,
+                      costo: float = 0.0, fallos: int = 0):
+        for agregado in self._agregados_hotdog(dia, hora, hotdog_id):
+            agregado.sumar(unidades, ingresos, costo, fallos)
+        self._sumar_rankings(dia, hotdog_id, unidades, ingresos, costo, fallos)
+
+    def _agregado_ingrediente(self, dia: int, ingrediente: Ingrediente) -> Agregado:
+        self.nombres[ingrediente.id] = ingrediente.nombre
+        return self.ingredientes.setdefault(dia, {}).setdefault(ingrediente.id, Agregado())
+
+    def registrar_venta(self, dia: int, hora: int, hotdog: HotDog, preparado: HotDog = None, cantidad: int = 1):
+        """`preparado` es lo que realmente salió de cocina (con sustituciones); por defecto, el mismo hot dog"""
+        preparado = preparado or hotdog
+        self.nombres[hotdog.id] = hotdog.nombre
+        ingresos = preparado.precio_venta * cantidad
+        costo = preparado.costo_ingredientes * cantidad
+        self._sumar_hotdog(dia, hora, hotdog.id, unidades=cantidad, ingresos=ingresos, costo=costo)
+        for ingrediente in preparado.componentes():
+            self._agregado_ingrediente(dia, ingrediente).sumar(unidades=cantidad, costo=ingrediente.costo * cantidad)
+
+    def registrar_fallo(self, dia: int, hora: int, hotdog: HotDog, ingrediente_faltante: Optional[Ingrediente] = None):
+        self.nombres[hotdog.id] = hotdog.nombre
+        self._sumar_hotdog(dia, hora, hotdog.id, fallos=1)
+        if ingrediente_faltante:
+            self._agregado_ingrediente(dia, ingrediente_faltante).sumar(fallos=1)
+
+    def registrar_extra(self, dia: int, ingresos: float, costo: float, cantidad: int = 1):
+        self.ultimo_dia = max(self.ultimo_dia, dia)
+        self.extras.setdefault(dia, Agregado()).sumar(unidades=cantidad, ingresos=ingresos, costo=costo)
+        # Cuentan para el dinero del día, no para las unidades de hot dogs
+        self.por_dia.setdefault(dia, Agregado()).sumar(ingresos=ingresos, costo=costo)
+
+    # --- Simulaciones hipotéticas ---
+
+    def bifurcar(self) -> "ResumenVentas":
+        """Resumen vacío que continúa la numeración de días; se suma a este con `incorporar` si se aplica"""
+        rama = ResumenVentas()
+        rama.ultimo_dia = self.ultimo_dia
+        return rama
+
+    def incorporar(self, rama: "ResumenVentas"):
+        """Suma los agregados de una bifurcación; recorre solo lo que se registró en ella"""
+        self.nombres.update(rama.nombres)
+        self._cargar_agregados(rama.to_dict())
+        self.ultimo_dia = max(self.ultimo_dia, rama.ultimo_dia)
+
+    # --- Consultas ---
+
+    def top_hotdogs(self, n: int = 5, dia: int = None, criterio: str = 'unidades') -> List[Tuple[str, Agregado]]:
+        """Los N hot dogs con más unidades, ingresos, ganancia o fallos, del historial o de un día"""
+        agregados = self.por_hotdog if dia is None else self.por_dia_hotdog.get(dia, {})
+        ranking = self._rankings.get(dia, {}).get(criterio)
+        if ranking is not None and n <= ranking.k and (dia, criterio) not in self._sin_ranking:
+            return [(hotdog_id, agregados[hotdog_id]) for hotdog_id, _ in ranking.top(n)]
+        return heapq.nlargest(n, agregados.items(), key=lambda par: getattr(par[1], criterio))
+
+    def comparar_dias(self, dias: List[int] = None) -> Dict[int, Agregado]:
+        dias = sorted(self.por_dia) if dias is None else dias
+        return {dia: self.por_dia.get(dia, Agregado()) for dia in dias}
+
+    def margen_por_hotdog(self, dia: int = None) -> Dict[str, Agregado]:
+        return dict(self.por_hotdog if dia is None else self.por_dia_hotdog.get(dia, {}))
+
+    def ventas_por_hora(self, dia: int) -> Dict[int, Agregado]:
+        totales = {}
+        for hora, por_hotdog in self.ventas.get(dia, {}).items():
+            total = totales[hora] = Agregado()
+            for agregado in por_hotdog.values():
+                total.sumar(agregado.unidades, agregado.ingresos, agregado.costo, agregado.fallos)
+        return dict(sorted(totales.items()))
+
+    def ingredientes_del_dia(self, dia: int) -> Dict[str, Agregado]:
+        return dict(self.ingredientes.get(dia, {}))
+
+    def nombre(self, elemento_id: str) -> str:
+        return self.nombres.get(elemento_id, elemento_id)
+
+    # --- Persistencia ---
+
+    def to_dict(self) -> dict:
+        return {
+            'ultimo_dia': self.ultimo_dia,
+            'nombres': self.nombres,
+            'ventas': [[dia, hora, hotdog_id, asdict(agregado)]
+                       for dia, horas in self.ventas.items()
+                       for hora, por_hotdog in horas.items()
+                       for hotdog_id, agregado in por_hotdog.items()],
+            'ingredientes': [[dia, ing_id, asdict(agregado)]
+                             for dia, por_ingrediente in self.ingredientes.items()
+                             for ing_id, agregado in por_ingrediente.items()],
+            'extras': [[dia, asdict(agregado)] for dia, agregado in self.extras.items()]
+        }
+
+    @classmethod
+    def from_dict(cls, datos: dict) -> "ResumenVentas":
+        """Reconstruye también los totales por día y por hot dog a partir de los agregados finos"""
+        resumen = cls()
+        resumen.nombres = dict(datos.get('nombres', {}))
+        resumen._cargar_agregados(datos)
+        resumen.ultimo_dia = datos.get('ultimo_dia', max(resumen.por_dia, default=-1))
+        return resumen
+
+    def _cargar_agregados(self, datos: dict):
+        for dia, hora, hotdog_id, valores in datos.get('ventas', []):
+            self._sumar_hotdog(dia, hora, hotdog_id, **valores)
+        for dia, ing_id, valores in datos.get('ingredientes', []):
+            self.ingredientes.setdefault(dia, {}).setdefault(ing_id, Agregado()).sumar(**valores)
+        for dia, valores in datos.get('extras', []):
+            self.registrar_extra(dia, valores['ingresos'], valores['costo'], valores['unidades'])
+
+    def guardar(self, ruta: str):
+        datos = self.to_dict()
+        escribir_atomico(ruta, lambda f: json.dump(datos, f, ensure_ascii=False))
+
+    @classmethod
+    def cargar(cls, ruta: str) -> "ResumenVentas":
+        """Historial guardado, o uno vacío si no existe o no se puede leer"""
+        if not os.path.exists(ruta):
+            return cls()
+        try:
+            with open(ruta, 'r', encoding='utf-8') as f:
+                return cls.from_dict(json.load(f))
+        except (OSError, ValueError, TypeError, KeyError) as e:
+            print(f"⚠️  No se pudo leer el historial de ventas ({e}); se empieza uno nuevo")
+            return cls()
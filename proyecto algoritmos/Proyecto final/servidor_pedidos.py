@@ -0,0 +1,304 @@
+"""Servicio HTTP/JSON local para que varias terminales de venta compartan el estado de un puesto.
+
+Rutas:
+  GET  /menu                  hot dogs con precio y porciones disponibles
+  GET  /menu/<id>             disponibilidad de un hot dog
+  GET  /inventario            existencias de todos los ingredientes
+  GET  /inventario/<id>       existencia de un ingrediente
+  POST /pedidos               {"items": [{"hotdog": "<id>", "cantidad": 2}, ...]}
+  POST /factibilidad          mismo cuerpo (más "maximo": true); no descuenta nada
+
+Un pedido se cobra completo o no se cobra: si falta algún ingrediente para
+el total del pedido se responde 409 con lo que falta y no se descuenta nada.
+Con --parciales se sirve lo que alcance (201 con "completo": false). Con
+--sustituciones un hot dog con ingredientes agotados se prepara con el
+equivalente más barato en existencia (el item lleva "sustituido": true).
+
+Con --lote N > 1 los pedidos se confirman en lotes de hasta N (ver cola_pedidos.py),
+esperando como máximo --intervalo segundos: más rendimiento a cambio de latencia.
+
+Uso: python servidor_pedidos.py [--archivo datos_locales.json] [--host 127.0.0.1] [--puerto 8080]
+                                [--lote 1] [--intervalo 0.002] [--parciales] [--sustituciones]
+"""
+import argparse
+import json
+import os
+import threading
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, List, Optional, Tuple
+from hotdogs import HotDog
+from inventario import Inventario
+from menu import Menu
+from gestor_ingredientes import GestorIngredientes
+from cola_pedidos import ColaPedidos
+from factibilidad import VerificadorFactibilidad
+from libro_ventas import LibroVentas
+from sustituciones import MotorSustituciones
+
+class PedidoInvalido(ValueError):
+    """El cuerpo del pedido no tiene el formato esperado o nombra hot dogs que no existen"""
+
+def _sin_resolver(hotdog: HotDog) -> bool:
+    """Receta sin componentes o con alguno que no se encontró en el catálogo (None)"""
+    componentes = hotdog.componentes()
+    return not componentes or any(ingrediente is None for ingrediente in componentes)
+
+class ServicioPedidos:
+    """Operaciones del puesto protegidas por un único candado.
+
+    Verificar y descontar existencias ocurre dentro del mismo candado, así dos
+    terminales nunca venden la última unidad de un ingrediente a la vez. Con
+    `tamano_lote` > 1 los pedidos pasan por una ColaPedidos que toma el candado
+    una vez por lote.
+    """
+
+    def __init__(self, menu: Menu, inventario: Inventario, gestor_ingredientes: GestorIngredientes,
+                 al_cambiar: Callable[[], None] = None, antes_de_atender: Callable[[], None] = None,
+                 tamano_lote: int = 1, intervalo: float = 0.002, permitir_parciales: bool = False,
+                 libro: LibroVentas = None, motor_sustituciones: MotorSustituciones = None, bloqueo=None):
+        self.menu = menu
+        self.inventario = inventario
+        self.gestor_ingredientes = gestor_ingredientes
+        # Avisos opcionales del sistema: marcar cambios tras un pedido y fusionar actualizaciones del catálogo
+        self.al_cambiar = al_cambiar
+        self.antes_de_atender = antes_de_atender
+        self.libro = libro
+        self.motor_sustituciones = motor_sustituciones
+        self.pedidos_aceptados = 0
+        self.pedidos_rechazados = 0
+        # Candado compartido con el guardado automático, que copia los datos bajo él
+        self._bloqueo = bloqueo or threading.Lock()
+        self.verificador = VerificadorFactibilidad(menu, inventario)
+        self.cola = ColaPedidos(inventario, tamano_lote, intervalo, permitir_parciales,
+                                bloqueo=self._bloqueo, al_confirmar=al_cambiar)
+        if tamano_lote > 1:
+            self.cola.iniciar()
+
+    def detener(self):
+        self.cola.detener()
+        if self.libro:
+            self.libro.cerrar()
+
+    def _preparar(self):
+        if self.antes_de_atender:
+            self.antes_de_atender()
+
+    def _porciones(self, hotdog: HotDog) -> int:
+        """Cuántos hot dogs iguales alcanzan con las existencias actuales (0 si la receta está incompleta)"""
+        if _sin_resolver(hotdog):
+            return 0
+        requerimientos = hotdog.requerimientos()
+        return min((self.inventario.existencias.get(ing_id, 0) // cantidad for ing_id, cantidad in requerimientos.items()),
+                   default=0)
+
+    def _describir(self, hotdog: HotDog) -> dict:
+        porciones = self._porciones(hotdog)
+        return {'id': hotdog.id, 'nombre': hotdog.nombre, 'precio_venta': hotdog.precio_venta,
+                'disponible': porciones > 0, 'porciones': porciones}
+
+    def listar_menu(self) -> List[dict]:
+        with self._bloqueo:
+            self._preparar()
+            return [self._describir(hotdog) for hotdog in self.menu.hotdogs]
+
+    def disponibilidad(self, hotdog_id: str) -> Optional[dict]:
+        with self._bloqueo:
+            self._preparar()
+            hotdog = self.menu.buscar_por_id(hotdog_id)
+            return self._describir(hotdog) if hotdog else None
+
+    def existencias(self, ingrediente_id: str = None) -> Optional[Dict[str, int]]:
+        with self._bloqueo:
+            self._preparar()
+            if ingrediente_id is None:
+                return dict(self.inventario.existencias)
+            if not self.gestor_ingredientes.buscar_por_id(ingrediente_id):
+                return None
+            return {ingrediente_id: self.inventario.existencias.get(ingrediente_id, 0)}
+
+    def _leer_items(self, pedido: dict) -> List[Tuple[HotDog, int]]:
+        items = pedido.get('items') if isinstance(pedido, dict) else None
+        if not isinstance(items, list) or not items:
+            raise PedidoInvalido("El pedido debe tener una lista 'items' no vacía")
+        leidos = []
+        for item in items:
+            if not isinstance(item, dict):
+                raise PedidoInvalido("Cada item debe ser un objeto con 'hotdog' y 'cantidad'")
+            cantidad = item.get('cantidad', 1)
+            if not isinstance(cantidad, int) or isinstance(cantidad, bool) or cantidad < 1:
+                raise PedidoInvalido(f"Cantidad inválida: {cantidad!r}")
+            hotdog = self.menu.buscar_por_id(str(item.get('hotdog')))
+            if not hotdog:
+                raise PedidoInvalido(f"Hot dog no encontrado: {item.get('hotdog')!r}")
+            if _sin_resolver(hotdog):
+                raise PedidoInvalido(f"El hot dog {hotdog.id!r} tiene ingredientes que no están en el catálogo")
+            leidos.append((hotdog, cantidad))
+        return leidos
+
+    def _sustituir(self, hotdog: HotDog, cantidad: int) -> HotDog:
+        """El hot dog tal cual si alcanza; si no, con sustitutos en existencia (la cola confirma si alcanzan)"""
+        if self._porciones(hotdog) >= cantidad:
+            return hotdog
+        sustituciones = self.motor_sustituciones.buscar_sustitucion(hotdog, self.inventario)
+        return hotdog.con_sustituciones(sustituciones) if sustituciones else hotdog
+
+    def verificar_factibilidad(self, pedido: dict) -> dict:
+        with self._bloqueo:
+            self._preparar()
+            cantidades = Counter()
+            for hotdog, cantidad in self._leer_items(pedido):
+                cantidades[hotdog.id] += cantidad
+            return self.verificador.verificar(cantidades, calcular_maximo=bool(pedido.get('maximo'))).to_dict()
+
+    def realizar_pedido(self, pedido: dict) -> Tuple[bool, dict]:
+        """Descuenta el pedido completo si alcanza; si no, devuelve los faltantes sin tocar el inventario"""
+        with self._bloqueo:
+            self._preparar()
+            items = self._leer_items(pedido)
+            sustituidos = set()
+            if self.motor_sustituciones:
+                originales = items
+                items = [(self._sustituir(hotdog, cantidad), cantidad) for hotdog, cantidad in originales]
+                sustituidos = {id(preparado) for (preparado, _), (hotdog, _) in zip(items, originales) if preparado is not hotdog}
+
+        if self.cola.tamano_lote > 1:
+            resultado = self.cola.enviar(items).result()
+        else:
+            # Un lote de un solo pedido, confirmado en este mismo hilo
+            resultado = self.cola.confirmar_lote([items])[0]
+
+        with self._bloqueo:
+            if not resultado.aceptado:
+                self.pedidos_rechazados += 1
+                return False, {'error': "Existencias insuficientes", 'faltantes': resultado.faltantes}
+            self.pedidos_aceptados += 1
+            numero = self.pedidos_aceptados
+
+        if self.libro:
+            for hotdog, cantidad in resultado.servidos:
+                self.libro.registrar(hotdog, cantidad=cantidad)
+
+        lineas = []
+        for hotdog, cantidad in resultado.servidos:
+            linea = {'hotdog': hotdog.id, 'cantidad': cantidad}
+            if id(hotdog) in sustituidos:
+                linea['sustituido'] = True
+            lineas.append(linea)
+        respuesta = {'pedido': numero, 'completo': resultado.completo,
+                     'total': round(sum(hotdog.precio_venta * cantidad for hotdog, cantidad in resultado.servidos), 2),
+                     'items': lineas}
+        if not resultado.completo:
+            respuesta['faltantes'] = resultado.faltantes
+        return True, respuesta
+
+class ManejadorPedidos(BaseHTTPRequestHandler):
+    # HTTP/1.1 mantiene la conexión abierta entre peticiones de la misma terminal
+    protocol_version = "HTTP/1.1"
+    # Encabezados y cuerpo salen en escrituras separadas; sin esto Nagle los retrasa ~40 ms
+    disable_nagle_algorithm = True
+    servicio: ServicioPedidos = None
+
+    def log_message(self, formato, *args):
+        # Con muchas terminales el registro por petición domina el tiempo de respuesta
+        pass
+
+    def _responder(self, estado: int, datos):
+        cuerpo = json.dumps(datos, ensure_ascii=False).encode('utf-8')
+        self.send_response(estado)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(cuerpo)))
+        self.end_headers()
+        self.wfile.write(cuerpo)
+
+    def _partes(self) -> List[str]:
+        return [parte for parte in self.path.split('?', 1)[0].split('/') if parte]
+
+    def do_GET(self):
+        partes = self._partes()
+        if partes == ['menu']:
+            self._responder(200, self.servicio.listar_menu())
+        elif len(partes) == 2 and partes[0] == 'menu':
+            disponibilidad = self.servicio.disponibilidad(partes[1])
+            if disponibilidad is None:
+                self._responder(404, {'error': f"Hot dog no encontrado: {partes[1]}"})
+            else:
+                self._responder(200, disponibilidad)
+        elif partes == ['inventario']:
+            self._responder(200, self.servicio.existencias())
+        elif len(partes) == 2 and partes[0] == 'inventario':
+            existencia = self.servicio.existencias(partes[1])
+            if existencia is None:
+                self._responder(404, {'error': f"Ingrediente no encontrado: {partes[1]}"})
+            else:
+                self._responder(200, existencia)
+        else:
+            self._responder(404, {'error': "Ruta no encontrada"})
+
+    def do_POST(self):
+        partes = self._partes()
+        if partes not in (['pedidos'], ['factibilidad']):
+            self._responder(404, {'error': "Ruta no encontrada"})
+            return
+        try:
+            longitud = int(self.headers.get("Content-Length", 0))
+            pedido = json.loads(self.rfile.read(longitud) or b"null")
+            if partes == ['factibilidad']:
+                self._responder(200, self.servicio.verificar_factibilidad(pedido))
+                return
+            aceptado, respuesta = self.servicio.realizar_pedido(pedido)
+        except (ValueError, UnicodeDecodeError) as e:
+            # PedidoInvalido y JSON mal formado
+            self._responder(400, {'error': str(e)})
+            return
+        self._responder(201 if aceptado else 409, respuesta)
+
+def crear_servidor(servicio: ServicioPedidos, host: str = "127.0.0.1", puerto: int = 8080) -> ThreadingHTTPServer:
+    """Servidor con un hilo por conexión; con puerto 0 el sistema elige uno libre"""
+    manejador = type("Manejador", (ManejadorPedidos,), {'servicio': servicio})
+    # Cola de conexiones pendientes más larga que la predeterminada (5) para ráfagas de terminales
+    servidor_clase = type("ServidorPedidos", (ThreadingHTTPServer,), {'request_queue_size': 128, 'daemon_threads': True})
+    return servidor_clase((host, puerto), manejador)
+
+def main():
+    from sistema import SistemaHotDog
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--archivo', default="datos_locales.json")
+    parser.add_argument('--host', default="127.0.0.1")
+    parser.add_argument('--puerto', type=int, default=8080)
+    parser.add_argument('--lote', type=int, default=1, help="pedidos por lote (1 = confirmar uno por uno)")
+    parser.add_argument('--intervalo', type=float, default=0.002, help="segundos máximos de espera para completar un lote")
+    parser.add_argument('--parciales', action='store_true', help="servir lo que alcance en vez de rechazar el pedido")
+    parser.add_argument('--libro', default=None, help="libro de ventas (por defecto, <archivo>.libro.jsonl)")
+    parser.add_argument('--sustituciones', action='store_true', help="sustituir ingredientes agotados por equivalentes")
+    args = parser.parse_args()
+
+    sistema = SistemaHotDog(args.archivo, autoguardado=True, priorizar_datos_locales=True)
+    sistema.preparar()
+    # Un pedido solo marca el cambio; la copia de los datos se toma en el hilo de guardado bajo este candado
+    bloqueo = threading.Lock()
+    sistema.autoguardado.bloqueo = bloqueo
+    sistema.autoguardado.iniciar()
+    servicio = ServicioPedidos(sistema.menu, sistema.inventario, sistema.gestor_ingredientes,
+                               al_cambiar=sistema._marcar_cambio, antes_de_atender=sistema.aplicar_actualizaciones,
+                               tamano_lote=args.lote, intervalo=args.intervalo, permitir_parciales=args.parciales,
+                               libro=LibroVentas(args.libro or os.path.splitext(args.archivo)[0] + ".libro.jsonl"),
+                               motor_sustituciones=MotorSustituciones(sistema.gestor_ingredientes) if args.sustituciones else None,
+                               bloqueo=bloqueo)
+    servidor = crear_servidor(servicio, args.host, args.puerto)
+    print(f"✅ Atendiendo pedidos en http://{args.host}:{servidor.server_address[1]} (Ctrl+C para detener)")
+    try:
+        servidor.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        servidor.server_close()
+        servicio.detener()
+        sistema.autoguardado.detener()
+        if hasattr(sistema.almacenamiento, 'cerrar'):
+            sistema.almacenamiento.cerrar()
+        print(f"Pedidos aceptados: {servicio.pedidos_aceptados}, rechazados: {servicio.pedidos_rechazados}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,255 @@
+import asyncio
+import random
+from typing import Dict, List, Optional
+from ingredientes import Ingrediente
+from inventario import Inventario, EXISTENCIAS_POR_DEFECTO
+from menu import Menu
+from simulacion_ventas import SimulacionVentas
+
+class RelojSimulado:
+    """Reloj compartido: la hora avanza cuando todos los puestos terminaron la actual"""
+
+    def __init__(self, participantes: int):
+        self.hora = 0
+        self.participantes = participantes
+        self.al_avanzar = []
+        self._listos = 0
+        self._condicion = asyncio.Condition()
+
+    async def fin_de_hora(self):
+        async with self._condicion:
+            hora = self.hora
+            self._listos += 1
+            if self._listos == self.participantes:
+                self._listos = 0
+                self.hora += 1
+                for accion in self.al_avanzar:
+                    accion(self.hora)
+                self._condicion.notify_all()
+            else:
+                await self._condicion.wait_for(lambda: self.hora > hora)
+
+    def retirar(self):
+        """Un puesto que terminó deja de contar para el avance del reloj"""
+        self.participantes -= 1
+
+class ReporteFlota:
+    """Acumula los resultados de cada puesto y de la flota a medida que llegan"""
+
+    CAMPOS = ('clientes', 'ventas_exitosas', 'clientes_no_pudieron_comprar', 'total_hotdogs_vendidos',
+              'hotdogs_no_vendidos', 'ingresos_totales', 'costos_totales')
+
+    def __init__(self):
+        self.por_puesto = {}
+        self.por_dia = {}
+        self.flota = dict.fromkeys(self.CAMPOS, 0)
+        self.transferencias = 0
+        self.entregas_almacen = 0
+
+    def acumular(self, puesto: str, dia: int, delta: Dict):
+        totales_puesto = self.por_puesto.setdefault(puesto, dict.fromkeys(self.CAMPOS, 0))
+        totales_dia = self.por_dia.setdefault(dia, dict.fromkeys(self.CAMPOS, 0))
+        for campo in self.CAMPOS:
+            valor = delta[campo]
+            totales_puesto[campo] += valor
+            totales_dia[campo] += valor
+            self.flota[campo] += valor
+
+    def mostrar(self):
+        print("\n" + "="*80)
+        print(f"           REPORTE DE FLOTA - {len(self.por_puesto)} PUESTOS")
+        print("="*80)
+        print(f"{'PUESTO':<14} {'CLIENTES':>9} {'VENDIDOS':>9} {'PERDIDOS':>9} {'INGRESOS':>12} {'GANANCIA':>12}")
+        print("-" * 80)
+        for nombre, totales in self.por_puesto.items():
+            ganancia = totales['ingresos_totales'] - totales['costos_totales']
+            print(f"{nombre:<14} {totales['clientes']:>9} {totales['total_hotdogs_vendidos']:>9} "
+                  f"{totales['hotdogs_no_vendidos']:>9} ${totales['ingresos_totales']:>11.2f} ${ganancia:>11.2f}")
+
+        print("\n POR DÍA (FLOTA):")
+        for dia, totales in sorted(self.por_dia.items()):
+            ganancia = totales['ingresos_totales'] - totales['costos_totales']
+            print(f"  Día {dia + 1}: {totales['clientes']} clientes, {totales['total_hotdogs_vendidos']} vendidos, "
+                  f"{totales['hotdogs_no_vendidos']} perdidos, ganancia ${ganancia:.2f}")
+
+        ganancia_flota = self.flota['ingresos_totales'] - self.flota['costos_totales']
+        print(f"\n TOTAL FLOTA: {self.flota['total_hotdogs_vendidos']} hot dogs vendidos, "
+              f"{self.flota['hotdogs_no_vendidos']} perdidos, ganancia ${ganancia_flota:.2f}")
+        print(f" Entregas del almacén: {self.entregas_almacen}  Transferencias entre puestos: {self.transferencias}")
+        print("="*80)
+
+class AlmacenCentral:
+    """Almacén que repone a los puestos y coordina transferencias entre ellos"""
+
+    def __init__(self, inventario: Inventario, reporte: ReporteFlota, tiempo_entrega: int = 2,
+                 transferencias: bool = True, tiempo_transferencia: int = 1):
+        self.inventario = inventario
+        self.reporte = reporte
+        self.tiempo_entrega = tiempo_entrega
+        self.transferencias = transferencias
+        self.tiempo_transferencia = tiempo_transferencia
+        self.entregas = {}
+        # Puestos con excedente conocido por ingrediente; se depura al usarlo
+        self.excedentes = {}
+
+    def registrar_excedente(self, puesto: "Puesto", ing_id: str):
+        self.excedentes.setdefault(ing_id, {})[puesto] = None
+
+    def solicitar(self, puesto: "Puesto", ing_id: str, cantidad: int, hora: int) -> bool:
+        """Programa la reposición desde el almacén o, si no alcanza, desde otro puesto"""
+        existencia = self.inventario.existencias.get(ing_id, 0)
+        if existencia >= cantidad:
+            self.inventario.existencias[ing_id] = existencia - cantidad
+            self._programar(hora + self.tiempo_entrega, puesto, ing_id, cantidad)
+            self.reporte.entregas_almacen += 1
+            return True
+
+        if self.transferencias:
+            donante = self._buscar_donante(puesto, ing_id, cantidad)
+            if donante:
+                donante.inventario.existencias[ing_id] -= cantidad
+                self._programar(hora + self.tiempo_transferencia, puesto, ing_id, cantidad)
+                self.reporte.transferencias += 1
+                return True
+        return False
+
+    def _buscar_donante(self, solicitante: "Puesto", ing_id: str, cantidad: int) -> Optional["Puesto"]:
+        candidatos = self.excedentes.get(ing_id, {})
+        for puesto in list(candidatos):
+            if puesto is solicitante:
+                continue
+            if puesto.inventario.existencias.get(ing_id, 0) - cantidad >= puesto.nivel_excedente:
+                return puesto
+            # El excedente ya no existe: se descarta para no volver a revisarlo
+            del candidatos[puesto]
+        return None
+
+    def _programar(self, hora: int, puesto: "Puesto", ing_id: str, cantidad: int):
+        self.entregas.setdefault(hora, []).append((puesto, ing_id, cantidad))
+
+    def entregar(self, hora: int):
+        """Llamado por el reloj al comenzar cada hora"""
+        for puesto, ing_id, cantidad in self.entregas.pop(hora, []):
+            puesto.inventario.existencias[ing_id] = puesto.inventario.existencias.get(ing_id, 0) + cantidad
+            puesto.pedidos_pendientes.discard(ing_id)
+
+class Puesto:
+    """Un carrito con su propio inventario que comparte el catálogo y el menú"""
+
+    def __init__(self, nombre: str, menu: Menu, inventario: Inventario, ids_menu: List[str],
+                 semilla: int, umbral_reposicion: int = 5, cantidad_reposicion: int = 20, libro=None):
+        self.nombre = nombre
+        self.inventario = inventario
+        self.ids_menu = ids_menu
+        self.simulador = SimulacionVentas(menu, inventario, semilla=semilla, silencioso=True, libro=libro)
+        self.umbral_reposicion = umbral_reposicion
+        self.cantidad_reposicion = cantidad_reposicion
+        self.nivel_excedente = umbral_reposicion + cantidad_reposicion
+        self.pedidos_pendientes = set()
+
+    def _contadores(self) -> Dict:
+        sim = self.simulador
+        return {
+            'ventas_exitosas': sim.ventas_exitosas,
+            'clientes_no_pudieron_comprar': sim.clientes_no_pudieron_comprar,
+            'total_hotdogs_vendidos': sim.total_hotdogs_vendidos,
+            'hotdogs_no_vendidos': sum(sim.hotdogs_fallidos.values()),
+            'ingresos_totales': sim.ingresos_totales,
+            'costos_totales': sim.costos_totales
+        }
+
+    async def ejecutar(self, reloj: RelojSimulado, almacen: Optional[AlmacenCentral], reporte: ReporteFlota,
+                       dias: int, horas_por_dia: int, clientes_por_dia=(50, 150)):
+        rng = self.simulador.rng
+        cliente_id = 0
+        for dia in range(dias):
+            num_clientes = rng.randint(*clientes_por_dia)
+            self.simulador.dia_actual = dia
+            for hora_del_dia in range(horas_por_dia):
+                self.simulador.hora_actual = hora_del_dia
+                antes = self._contadores()
+                # Reparto uniforme de los clientes del día entre las horas de atención
+                clientes_hora = num_clientes // horas_por_dia + (1 if hora_del_dia < num_clientes % horas_por_dia else 0)
+                for i in range(clientes_hora):
+                    self.simulador.segundo_actual = (hora_del_dia + i / clientes_hora) * 3600
+                    self.simulador._procesar_cliente(cliente_id)
+                    cliente_id += 1
+
+                despues = self._contadores()
+                delta = {campo: despues[campo] - antes[campo] for campo in despues}
+                delta['clientes'] = clientes_hora
+                reporte.acumular(self.nombre, dia, delta)
+
+                if almacen:
+                    self._revisar_existencias(almacen, reloj.hora)
+                await reloj.fin_de_hora()
+        reloj.retirar()
+
+    def _revisar_existencias(self, almacen: AlmacenCentral, hora: int):
+        existencias = self.inventario.existencias
+        for ing_id in self.ids_menu:
+            cantidad = existencias.get(ing_id, 0)
+            if cantidad <= self.umbral_reposicion and ing_id not in self.pedidos_pendientes:
+                if almacen.solicitar(self, ing_id, self.cantidad_reposicion, hora):
+                    self.pedidos_pendientes.add(ing_id)
+            elif cantidad >= self.nivel_excedente:
+                almacen.registrar_excedente(self, ing_id)
+
+class SimulacionMultipuesto:
+    """Simula varios puestos concurrentes (una tarea asyncio por puesto) sobre un reloj común"""
+
+    def __init__(self, menu: Menu, ingredientes: List[Ingrediente], num_puestos: int, dias: int = 7,
+                 horas_por_dia: int = 12, almacen: bool = True, transferencias: bool = True,
+                 factor_almacen: int = 10, semilla: int = 0, libro=None):
+        self.menu = menu
+        self.ingredientes = ingredientes
+        self.num_puestos = num_puestos
+        self.dias = dias
+        self.horas_por_dia = horas_por_dia
+        self.usar_almacen = almacen
+        self.transferencias = transferencias
+        self.factor_almacen = factor_almacen
+        self.semilla = semilla
+        # LibroVentas opcional compartido por todos los puestos
+        self.libro = libro
+
+    def _ids_menu(self) -> List[str]:
+        ids = {}
+        for hotdog in self.menu.hotdogs:
+            for ingrediente in hotdog.componentes():
+                ids.setdefault(ingrediente.id, None)
+        return list(ids)
+
+    async def _ejecutar(self) -> ReporteFlota:
+        reporte = ReporteFlota()
+        reloj = RelojSimulado(self.num_puestos)
+
+        almacen = None
+        if self.usar_almacen:
+            inventario_almacen = Inventario()
+            cantidades = {categoria: cantidad * self.factor_almacen for categoria, cantidad in EXISTENCIAS_POR_DEFECTO.items()}
+            inventario_almacen.inicializar_por_categoria(self.ingredientes, cantidades)
+            almacen = AlmacenCentral(inventario_almacen, reporte, transferencias=self.transferencias)
+            reloj.al_avanzar.append(almacen.entregar)
+
+        ids_menu = self._ids_menu()
+        generador_semillas = random.Random(self.semilla)
+        # Todos los puestos comparten el mismo calendario simulado
+        fecha_inicio = SimulacionVentas.fecha_inicial(self.libro)
+        tareas = []
+        for numero in range(self.num_puestos):
+            inventario = Inventario()
+            inventario.inicializar_por_categoria(self.ingredientes)
+            puesto = Puesto(f"Puesto {numero + 1}", self.menu, inventario, ids_menu, generador_semillas.randrange(2**32),
+                            libro=self.libro)
+            puesto.simulador.fecha_inicio = fecha_inicio
+            puesto.simulador.iniciar_calendario(0)
+            tareas.append(asyncio.create_task(
+                puesto.ejecutar(reloj, almacen, reporte, self.dias, self.horas_por_dia)
+            ))
+
+        await asyncio.gather(*tareas)
+        return reporte
+
+    def ejecutar(self) -> ReporteFlota:
+        return asyncio.run(self._ejecutar())
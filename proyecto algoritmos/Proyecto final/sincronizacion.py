@@ -0,0 +1,147 @@
+import hashlib
+import json
+import os
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Tuple
+from ingredientes import Ingrediente, CategoriaIngrediente
+from hotdogs import HotDog
+from inventario import Inventario
+from menu import Menu
+from gestor_ingredientes import GestorIngredientes
+from guardado_seguro import escribir_atomico
+
+@dataclass
+class Diferencias:
+    """Registros de la API comparados con los de la última sincronización"""
+    agregados: List[dict] = field(default_factory=list)
+    modificados: List[dict] = field(default_factory=list)
+    eliminados: List[str] = field(default_factory=list)
+    huellas: Dict[str, str] = field(default_factory=dict)
+
+    @property
+    def hay_cambios(self) -> bool:
+        return bool(self.agregados or self.modificados or self.eliminados)
+
+    def resumen(self) -> str:
+        return f"+{len(self.agregados)} ~{len(self.modificados)} -{len(self.eliminados)}"
+
+class SincronizadorCatalogo:
+    """Aplica solo los cambios del catálogo de la API desde la última sincronización.
+
+    Cada registro ya convertido se identifica por una huella (hash de su
+    contenido). Las huellas se guardan junto a los datos locales, de modo que
+    un registro que no cambió en la API no se vuelve a tocar, aunque se haya
+    editado o eliminado localmente.
+    """
+
+    def __init__(self, gestor_ingredientes: GestorIngredientes, inventario: Inventario, menu: Menu, ruta_huellas: str):
+        self.gestor_ingredientes = gestor_ingredientes
+        self.inventario = inventario
+        self.menu = menu
+        self.ruta_huellas = ruta_huellas
+        # Se leen en la primera sincronización, no al arrancar
+        self._huellas = None
+
+    @property
+    def huellas(self) -> dict:
+        if self._huellas is None:
+            self._huellas = {'ingredientes': {}, 'menu': {}}
+            if os.path.exists(self.ruta_huellas):
+                try:
+                    with open(self.ruta_huellas, 'r', encoding='utf-8') as f:
+                        self._huellas.update(json.load(f))
+                except (OSError, ValueError) as e:
+                    print(f"⚠️  No se pudieron leer las huellas de sincronización ({e}); se comparará todo el catálogo")
+        return self._huellas
+
+    @staticmethod
+    def huella(registro: dict) -> str:
+        contenido = json.dumps(registro, sort_keys=True, ensure_ascii=False, separators=(',', ':'))
+        return hashlib.sha1(contenido.encode('utf-8')).hexdigest()
+
+    def diferencias(self, tipo: str, registros: List[dict]) -> Diferencias:
+        anteriores = self.huellas[tipo]
+        diferencias = Diferencias()
+        for registro in registros:
+            huella = self.huella(registro)
+            diferencias.huellas[registro['id']] = huella
+            anterior = anteriores.get(registro['id'])
+            if anterior is None:
+                diferencias.agregados.append(registro)
+            elif anterior != huella:
+                diferencias.modificados.append(registro)
+        diferencias.eliminados = [registro_id for registro_id in anteriores if registro_id not in diferencias.huellas]
+        return diferencias
+
+    def sincronizar(self, ingredientes: List[dict], menu: List[dict],
+                    crear_hotdog: Callable[[dict], Optional[HotDog]]) -> Tuple[Diferencias, Diferencias]:
+        """Aplica ambos catálogos; los ingredientes primero para que los hot dogs nuevos los encuentren"""
+        return self.sincronizar_ingredientes(ingredientes), self.sincronizar_menu(menu, crear_hotdog)
+
+    def reiniciar(self):
+        """Olvida las huellas, p. ej. si los datos locales no existen, para volver a aplicar todo el catálogo"""
+        self._huellas = {'ingredientes': {}, 'menu': {}}
+
+    def sincronizar_ingredientes(self, registros: List[dict]) -> Diferencias:
+        diferencias = self.diferencias('ingredientes', registros)
+
+        # Sin huella previa pero ya presente localmente: se adopta sin modificarlo
+        diferencias.agregados = [registro for registro in diferencias.agregados
+                                 if not self.gestor_ingredientes.buscar_por_id(registro['id'])]
+        nuevos = [Ingrediente.from_dict(registro) for registro in diferencias.agregados]
+        for ingrediente in nuevos:
+            self.gestor_ingredientes.agregar_ingrediente(ingrediente)
+        self.inventario.inicializar_por_categoria(nuevos)
+
+        for registro in diferencias.modificados:
+            ingrediente = self.gestor_ingredientes.buscar_por_id(registro['id'])
+            if ingrediente:
+                # Se modifica el mismo objeto para que los hot dogs que lo usan vean el cambio
+                ingrediente.nombre = registro['nombre']
+                ingrediente.categoria = CategoriaIngrediente.from_string(registro['categoria'])
+                ingrediente.tipo = registro['tipo']
+                ingrediente.costo = registro['costo']
+
+        for ingrediente_id in diferencias.eliminados:
+            ingrediente = self.gestor_ingredientes.buscar_por_id(ingrediente_id)
+            # Se conserva si algún hot dog local todavía lo usa
+            if ingrediente and not self.menu.hotdogs_con_ingrediente(ingrediente):
+                self.gestor_ingredientes.quitar_ingrediente(ingrediente)
+                self.inventario.existencias.pop(ingrediente_id, None)
+
+        self.huellas['ingredientes'] = diferencias.huellas
+        return diferencias
+
+    def sincronizar_menu(self, registros: List[dict], crear_hotdog: Callable[[dict], Optional[HotDog]]) -> Diferencias:
+        diferencias = self.diferencias('menu', registros)
+
+        diferencias.agregados = [registro for registro in diferencias.agregados if not self.menu.contiene(registro['id'])]
+        for registro in diferencias.agregados:
+            self._aplicar_hotdog(registro, crear_hotdog, diferencias)
+        for registro in diferencias.modificados:
+            self._aplicar_hotdog(registro, crear_hotdog, diferencias)
+
+        for hotdog_id in diferencias.eliminados:
+            hotdog = self.menu.buscar_por_id(hotdog_id)
+            if hotdog:
+                self.menu.eliminar_hotdog(hotdog)
+
+        self.huellas['menu'] = diferencias.huellas
+        return diferencias
+
+    def _aplicar_hotdog(self, registro: dict, crear_hotdog: Callable[[dict], Optional[HotDog]], diferencias: Diferencias):
+        hotdog = crear_hotdog(registro)
+        if not hotdog:
+            # Sin huella, se vuelve a intentar en la próxima sincronización
+            diferencias.huellas.pop(registro['id'], None)
+        elif self.menu.contiene(hotdog.id):
+            self.menu.reemplazar_hotdog(hotdog)
+        else:
+            self.menu.agregar_hotdog(hotdog)
+
+    def copia_huellas(self) -> dict:
+        return {tipo: dict(huellas) for tipo, huellas in self.huellas.items()}
+
+    def guardar_huellas(self, huellas: dict = None):
+        huellas = huellas if huellas is not None else self.huellas
+        escribir_atomico(self.ruta_huellas, lambda f: json.dump(huellas, f), conservar_respaldo=False)
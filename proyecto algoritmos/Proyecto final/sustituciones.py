@@ -0,0 +1,89 @@
+from collections import Counter
+from typing import Dict, List, Optional
+from ingredientes import Ingrediente
+from hotdogs import HotDog
+from gestor_ingredientes import GestorIngredientes
+
+class MotorSustituciones:
+    """Busca reemplazos en existencia para los ingredientes agotados de un hot dog"""
+
+    def __init__(self, gestor_ingredientes: GestorIngredientes):
+        self.gestor_ingredientes = gestor_ingredientes
+        self.sustitutos_personalizados = {}
+        self.indice = {}
+        self._grupos = {}
+        self.reconstruir_indice()
+
+    def reconstruir_indice(self):
+        """Precalcula los sustitutos de cada ingrediente ordenados por costo"""
+        self._grupos = {}
+        for ingrediente in self.gestor_ingredientes.ingredientes:
+            clave = (ingrediente.categoria, ingrediente.tipo)
+            self._grupos.setdefault(clave, []).append(ingrediente)
+
+        for grupo in self._grupos.values():
+            grupo.sort(key=lambda ing: ing.costo)
+
+        self.indice = {}
+        for ingrediente in self.gestor_ingredientes.ingredientes:
+            self.indice[ingrediente.id] = self._calcular_sustitutos(ingrediente)
+
+    def _calcular_sustitutos(self, ingrediente: Ingrediente) -> List[Ingrediente]:
+        ids_personalizados = self.sustitutos_personalizados.get(ingrediente.id)
+        if ids_personalizados is None:
+            # Por defecto se comparte la lista del grupo (misma categoría y tipo)
+            return self._grupos.get((ingrediente.categoria, ingrediente.tipo), [])
+
+        sustitutos = []
+        for ing_id in ids_personalizados:
+            sustituto = self.gestor_ingredientes.buscar_por_id(ing_id)
+            if sustituto:
+                sustitutos.append(sustituto)
+        sustitutos.sort(key=lambda ing: ing.costo)
+        return sustitutos
+
+    def definir_sustitutos(self, ingrediente: Ingrediente, sustitutos: List[Ingrediente]):
+        """Reemplaza la lista de sustitutos por defecto de un ingrediente"""
+        self.sustitutos_personalizados[ingrediente.id] = [s.id for s in sustitutos]
+        self.indice[ingrediente.id] = self._calcular_sustitutos(ingrediente)
+
+    def restablecer_sustitutos(self, ingrediente: Ingrediente):
+        """Vuelve a usar los sustitutos por defecto (misma categoría y tipo)"""
+        self.sustitutos_personalizados.pop(ingrediente.id, None)
+        self.indice[ingrediente.id] = self._calcular_sustitutos(ingrediente)
+
+    def listar_sustitutos(self, ingrediente: Ingrediente) -> List[Ingrediente]:
+        return [s for s in self.indice.get(ingrediente.id, []) if s.id != ingrediente.id]
+
+    def buscar_sustitucion(self, hotdog: HotDog, inventario) -> Optional[Dict[str, Ingrediente]]:
+        """Devuelve el reemplazo más barato en existencia para cada ingrediente faltante.
+
+        Retorna un diccionario vacío si no hace falta sustituir nada y None si
+        algún ingrediente no tiene sustituto disponible.
+        """
+        requerimientos = hotdog.requerimientos()
+        por_id = {ing.id: ing for ing in hotdog.componentes()}
+        reservado = Counter()
+        faltantes = []
+
+        for ing_id, cantidad in requerimientos.items():
+            if inventario.hay_suficiente(por_id[ing_id], cantidad):
+                reservado[ing_id] += cantidad
+            else:
+                faltantes.append((por_id[ing_id], cantidad))
+
+        sustituciones = {}
+        for ingrediente, cantidad in faltantes:
+            # Los candidatos ya vienen ordenados por costo: el primero con existencia es el más barato
+            for candidato in self.indice.get(ingrediente.id, []):
+                if candidato.id == ingrediente.id:
+                    continue
+                disponible = inventario.verificar_existencia(candidato) - reservado[candidato.id]
+                if disponible >= cantidad:
+                    reservado[candidato.id] += cantidad
+                    sustituciones[ingrediente.id] = candidato
+                    break
+            else:
+                return None
+
+        return sustituciones
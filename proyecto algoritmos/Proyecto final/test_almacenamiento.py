@@ -0,0 +1,64 @@
+import os
+import shutil
+import tempfile
+import unittest
+from almacenamiento import AlmacenamientoJSON, AlmacenamientoSQLite
+from benchmark_instantanea import generar_datos
+from gestor_ingredientes import GestorIngredientes
+from inventario import Inventario
+from menu import Menu
+from menu_perezoso import MenuPerezoso
+
+class PruebaAlmacenamientoSQLite(unittest.TestCase):
+    def setUp(self):
+        self.directorio = tempfile.mkdtemp()
+        self.ingredientes, self.existencias, self.hotdogs = generar_datos(200)
+        self.ruta_db = os.path.join(self.directorio, "datos.db")
+
+    def tearDown(self):
+        shutil.rmtree(self.directorio, ignore_errors=True)
+
+    def _json(self, nombre: str, ingredientes, hotdogs) -> str:
+        ruta = os.path.join(self.directorio, nombre)
+        existencias = {ing.id: self.existencias[ing.id] for ing in ingredientes}
+        AlmacenamientoJSON(ruta).guardar(ingredientes, existencias, hotdogs)
+        return ruta
+
+    def _cargar(self, menu):
+        almacenamiento = AlmacenamientoSQLite(self.ruta_db)
+        gestor, inventario = GestorIngredientes(), Inventario()
+        almacenamiento.cargar(gestor, inventario, menu)
+        return almacenamiento, gestor, inventario
+
+    def test_importar_json_reemplaza_todo(self):
+        completo = self._json("completo.json", self.ingredientes, self.hotdogs)
+        reducido = self._json("reducido.json", self.ingredientes[:50], self.hotdogs[:2])
+        for ruta in (completo, reducido):
+            # Una instancia nueva por importación: sin estado previo del que sacar diferencias
+            almacenamiento = AlmacenamientoSQLite(self.ruta_db)
+            almacenamiento.importar_json(ruta)
+            almacenamiento.cerrar()
+
+        menu = Menu()
+        almacenamiento, gestor, inventario = self._cargar(menu)
+        almacenamiento.cerrar()
+        self.assertEqual([hd.id for hd in menu.hotdogs], [hd.id for hd in self.hotdogs[:2]])
+        self.assertEqual(len(gestor.ingredientes), 50)
+        self.assertEqual(len(inventario.existencias), 50)
+
+    def test_hotdogs_con_ingrediente_lee_solo_los_afectados(self):
+        almacenamiento = AlmacenamientoSQLite(self.ruta_db)
+        almacenamiento.importar_json(self._json("completo.json", self.ingredientes, self.hotdogs))
+        almacenamiento.cerrar()
+        menu = MenuPerezoso()
+        almacenamiento, gestor, _ = self._cargar(menu)
+        for hotdog in self.hotdogs:
+            ingrediente = gestor.buscar_por_id(hotdog.salchicha.id)
+            esperados = [hd.id for hd in self.hotdogs if any(c.id == ingrediente.id for c in hd.componentes())]
+            antes = menu.cargados
+            self.assertEqual([hd.id for hd in menu.hotdogs_con_ingrediente(ingrediente)], esperados)
+            self.assertLessEqual(menu.cargados - antes, len(esperados))
+        almacenamiento.cerrar()
+
+if __name__ == "__main__":
+    unittest.main()
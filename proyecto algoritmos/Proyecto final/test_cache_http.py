@@ -0,0 +1,98 @@
+import json
+import shutil
+import tempfile
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from cache_http import CacheHTTP
+from cliente_api import ClienteAPI
+
+class _ServidorCatalogo(BaseHTTPRequestHandler):
+    """Sustituto local de la API: cuenta peticiones y responde 304 si el ETag coincide"""
+
+    ETAG = '"v1"'
+    CUERPOS = {
+        "/ingredientes.json": json.dumps([{"Categoria": "pan", "Opciones": []}]).encode('utf-8'),
+        "/menu.json": json.dumps([{"nombre": "simple"}]).encode('utf-8'),
+    }
+
+    def do_GET(self):
+        servidor = self.server
+        with servidor.bloqueo:
+            servidor.peticiones += 1
+        cuerpo = self.CUERPOS.get(self.path)
+        if cuerpo is None:
+            self.send_response(404)
+            self.end_headers()
+            return
+        if self.headers.get('If-None-Match') == self.ETAG:
+            with servidor.bloqueo:
+                servidor.validaciones += 1
+            self.send_response(304)
+            self.send_header('ETag', self.ETAG)
+            self.end_headers()
+            return
+        with servidor.bloqueo:
+            servidor.completas += 1
+        self.send_response(200)
+        self.send_header('ETag', self.ETAG)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(cuerpo)))
+        self.end_headers()
+        self.wfile.write(cuerpo)
+
+    def log_message(self, formato, *args):
+        pass
+
+class PruebaCacheHTTP(unittest.TestCase):
+    def setUp(self):
+        self.servidor = ThreadingHTTPServer(("127.0.0.1", 0), _ServidorCatalogo)
+        self.servidor.bloqueo = threading.Lock()
+        self.servidor.peticiones = self.servidor.validaciones = self.servidor.completas = 0
+        self.hilo = threading.Thread(target=self.servidor.serve_forever, daemon=True)
+        self.hilo.start()
+        self.directorio = tempfile.mkdtemp()
+        puerto = self.servidor.server_address[1]
+        self.urls = {nombre: f"http://127.0.0.1:{puerto}/{nombre}.json" for nombre in ("ingredientes", "menu")}
+
+    def tearDown(self):
+        self.servidor.shutdown()
+        self.servidor.server_close()
+        shutil.rmtree(self.directorio, ignore_errors=True)
+
+    def _arrancar(self) -> ClienteAPI:
+        """Un arranque del sistema: cliente y caché nuevos sobre el mismo directorio"""
+        cliente = ClienteAPI(self.urls, CacheHTTP(self.directorio), reintentos=0)
+        cliente.precargar()
+        for nombre in self.urls:
+            self.assertEqual(cliente.obtener(nombre).status_code, 200)
+        return cliente
+
+    def test_arranque_en_caliente_no_descarga_nada(self):
+        frio = self._arrancar()
+        self.assertEqual(frio.cache.descargas, 2)
+        self.assertEqual(self.servidor.completas, 2)
+
+        caliente = self._arrancar()
+        self.assertEqual(caliente.cache.descargas, 0)
+        self.assertEqual(caliente.cache.validadas, 2)
+        # El servidor solo vio revalidaciones: ninguna descarga completa nueva
+        self.assertEqual(self.servidor.completas, 2)
+        self.assertEqual(self.servidor.validaciones, 2)
+        self.assertEqual(self.servidor.peticiones, 4)
+
+    def test_cuerpo_validado_es_el_guardado(self):
+        self._arrancar()
+        respuesta = CacheHTTP(self.directorio).obtener(self.urls["menu"])
+        self.assertEqual(respuesta.origen, 'validada')
+        self.assertEqual(respuesta.json(), [{"nombre": "simple"}])
+
+    def test_max_edad_evita_la_red(self):
+        self._arrancar()
+        cache = CacheHTTP(self.directorio, max_edad=60)
+        respuesta = cache.obtener(self.urls["ingredientes"])
+        self.assertEqual(respuesta.origen, 'cache')
+        self.assertEqual(self.servidor.peticiones, 2)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,75 @@
+import threading
+import unittest
+from cola_pedidos import ColaPedidos
+from hotdogs import HotDog
+from ingredientes import CategoriaIngrediente, Ingrediente
+from inventario import Inventario
+
+def _ingrediente(id: str, categoria: CategoriaIngrediente) -> Ingrediente:
+    return Ingrediente(id=id, nombre=id, categoria=categoria, tipo="prueba", costo=1.0)
+
+class PruebaColaPedidos(unittest.TestCase):
+    def setUp(self):
+        self.pan = _ingrediente("pan", CategoriaIngrediente.PAN)
+        self.salchicha = _ingrediente("salchicha", CategoriaIngrediente.SALCHICHA)
+        self.mostaza = _ingrediente("mostaza", CategoriaIngrediente.SALSA)
+        self.simple = HotDog("simple", "simple", self.pan, self.salchicha, [], [])
+        self.con_mostaza = HotDog("con_mostaza", "con mostaza", self.pan, self.salchicha, [], [self.mostaza])
+        self.inventario = Inventario()
+        self.inventario.existencias = {"pan": 5, "salchicha": 20, "mostaza": 20}
+
+    def test_parciales_en_orden_de_llegada(self):
+        cola = ColaPedidos(self.inventario, permitir_parciales=True)
+        primero, segundo, tercero = cola.confirmar_lote([[(self.simple, 3)], [(self.con_mostaza, 4)], [(self.simple, 2)]])
+
+        # El primero se sirve completo, el segundo con lo que quedó y el tercero ya no alcanza a nada
+        self.assertTrue(primero.completo)
+        self.assertEqual(primero.servidos, [(self.simple, 3)])
+        self.assertFalse(segundo.completo)
+        self.assertEqual(segundo.servidos, [(self.con_mostaza, 2)])
+        self.assertEqual(segundo.faltantes, {"pan": 2})
+        self.assertFalse(tercero.aceptado)
+        self.assertEqual(self.inventario.existencias, {"pan": 0, "salchicha": 15, "mostaza": 18})
+
+    def test_sin_parciales_el_rechazado_no_reserva(self):
+        cola = ColaPedidos(self.inventario)
+        primero, segundo, tercero = cola.confirmar_lote([[(self.simple, 3)], [(self.simple, 4)], [(self.simple, 2)]])
+        self.assertTrue(primero.completo)
+        self.assertFalse(segundo.aceptado)
+        self.assertEqual(segundo.faltantes, {"pan": 2})
+        # Lo que el segundo no pudo llevarse sigue disponible para el siguiente
+        self.assertTrue(tercero.completo)
+        self.assertEqual(self.inventario.existencias["pan"], 0)
+
+    def test_lote_se_confirma_de_una_vez(self):
+        bloqueo = threading.Lock()
+        confirmaciones = []
+        cola = ColaPedidos(self.inventario, bloqueo=bloqueo, al_confirmar=lambda: confirmaciones.append(1))
+        iniciales = dict(self.inventario.existencias)
+        resultados = []
+
+        with bloqueo:
+            hilo = threading.Thread(target=lambda: resultados.extend(
+                cola.confirmar_lote([[(self.simple, 1)], [(self.con_mostaza, 2)], [(self.simple, 1), (self.con_mostaza, 1)]])))
+            hilo.start()
+            hilo.join(0.2)
+            # Mientras otro escritor tiene el candado, el lote no aplicó ni una parte
+            self.assertTrue(hilo.is_alive())
+            self.assertEqual(self.inventario.existencias, iniciales)
+        hilo.join()
+
+        self.assertTrue(all(resultado.completo for resultado in resultados))
+        self.assertEqual(self.inventario.existencias, {"pan": 0, "salchicha": 15, "mostaza": 17})
+        self.assertEqual((cola.lotes, cola.pedidos, len(confirmaciones)), (1, 3, 1))
+
+    def test_hilo_reparte_resultados_a_cada_futuro(self):
+        cola = ColaPedidos(self.inventario, tamano_lote=8, intervalo=0.05)
+        cola.iniciar()
+        futuros = [cola.enviar([(self.simple, 1)]) for _ in range(7)]
+        cola.detener()
+        aceptados = [futuro.result(timeout=5).aceptado for futuro in futuros]
+        self.assertEqual(aceptados, [True] * 5 + [False] * 2)
+        self.assertEqual(self.inventario.existencias["pan"], 0)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,62 @@
+import random
+import unittest
+from collections import Counter
+from benchmark_instantanea import generar_datos
+from factibilidad import VerificadorFactibilidad
+from inventario import Inventario
+from menu import Menu
+
+class PruebaVerificadorFactibilidad(unittest.TestCase):
+    def setUp(self):
+        _, existencias, self.hotdogs = generar_datos(400)
+        self.inventario = Inventario()
+        self.inventario.existencias = existencias
+        self.menu = Menu()
+        for hotdog in self.hotdogs:
+            self.menu.agregar_hotdog(hotdog)
+        self.verificador = VerificadorFactibilidad(self.menu, self.inventario)
+
+    def _consumo(self, pedido):
+        consumo = Counter()
+        for hotdog_id, cantidad in pedido.items():
+            for ing_id, unidades in self.menu.buscar_por_id(hotdog_id).requerimientos().items():
+                consumo[ing_id] += unidades * cantidad
+        return consumo
+
+    def test_no_modifica_el_inventario(self):
+        antes = dict(self.inventario.existencias)
+        pedido = {hotdog.id: 500 for hotdog in self.hotdogs[:5]}
+        pedido["no_existe"] = 1
+        resultado = self.verificador.verificar(pedido, calcular_maximo=True)
+        self.assertFalse(resultado.factible)
+        self.assertEqual(resultado.desconocidos, ["no_existe"])
+        self.assertEqual(self.inventario.existencias, antes)
+
+    def test_necesarios_y_faltantes(self):
+        pedido = {hotdog.id: 3 for hotdog in self.hotdogs[:4]}
+        resultado = self.verificador.verificar(pedido)
+        consumo = self._consumo(pedido)
+        self.assertEqual(resultado.necesarios, dict(consumo))
+        esperados = {ing_id: cantidad - self.inventario.existencias[ing_id] for ing_id, cantidad in consumo.items()
+                     if cantidad > self.inventario.existencias[ing_id]}
+        self.assertEqual(resultado.faltantes, esperados)
+        self.assertEqual(resultado.factible, not esperados)
+
+    def test_pedido_maximo_cabe_en_existencias(self):
+        for semilla in range(100):
+            rng = random.Random(semilla)
+            pedido = {hotdog.id: rng.randint(1, 300) for hotdog in rng.sample(self.hotdogs, rng.randint(1, 8))}
+            resultado = self.verificador.verificar(pedido, calcular_maximo=True)
+            maximo = resultado.pedido_maximo
+            self.assertEqual(set(maximo), set(pedido))
+            self.assertTrue(all(0 <= maximo[hotdog_id] <= cantidad for hotdog_id, cantidad in pedido.items()))
+            for ing_id, cantidad in self._consumo(maximo).items():
+                self.assertLessEqual(cantidad, self.inventario.existencias[ing_id], f"semilla {semilla}")
+            # El máximo nunca queda por debajo del pedido reducido proporcionalmente
+            for hotdog_id, cantidad in pedido.items():
+                self.assertGreaterEqual(maximo[hotdog_id], int(cantidad * resultado.escala))
+            if resultado.factible:
+                self.assertEqual(maximo, pedido)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,98 @@
+import glob
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+from almacenamiento import AlmacenamientoJSON
+from benchmark_instantanea import generar_datos
+from gestor_ingredientes import GestorIngredientes
+from guardado_seguro import AutoGuardado, escribir_atomico, recuperar_guardado, ruta_respaldo
+from inventario import Inventario
+from menu import Menu
+
+class PruebaGuardadoSeguro(unittest.TestCase):
+    def setUp(self):
+        self.directorio = tempfile.mkdtemp()
+        self.ruta = os.path.join(self.directorio, "datos.json")
+        self.almacenamiento = AlmacenamientoJSON(self.ruta)
+        self.ingredientes, self.existencias, self.hotdogs = generar_datos(100)
+
+    def tearDown(self):
+        shutil.rmtree(self.directorio, ignore_errors=True)
+
+    def _guardar(self, hotdogs):
+        self.almacenamiento.guardar(self.ingredientes, self.existencias, hotdogs)
+
+    def _hotdogs_guardados(self):
+        menu = Menu()
+        self.almacenamiento.cargar(GestorIngredientes(), Inventario(), menu)
+        return [hotdog.id for hotdog in menu.hotdogs]
+
+    def test_descarta_temporal_a_medio_escribir(self):
+        self._guardar(self.hotdogs)
+        # Un guardado que murió antes de renombrar deja su temporal truncado junto al archivo
+        with open(self.ruta, 'rb') as f:
+            contenido = f.read()
+        temporal = self.ruta + ".k3j9x.tmp"
+        with open(temporal, 'wb') as f:
+            f.write(contenido[:len(contenido) // 2])
+        with open(ruta_respaldo(self.ruta) + ".tmp", 'wb') as f:
+            f.write(contenido[:10])
+
+        self.assertTrue(recuperar_guardado(self.almacenamiento))
+        self.assertEqual(glob.glob(os.path.join(self.directorio, "*.tmp")), [])
+        with open(self.ruta, 'rb') as f:
+            self.assertEqual(f.read(), contenido)
+        self.assertEqual(self._hotdogs_guardados(), [hotdog.id for hotdog in self.hotdogs])
+
+    def test_restaura_respaldo_si_el_principal_esta_truncado(self):
+        self._guardar(self.hotdogs[:2])
+        self._guardar(self.hotdogs)
+        with open(self.ruta, 'rb+') as f:
+            f.truncate(os.path.getsize(self.ruta) // 3)
+
+        self.assertTrue(recuperar_guardado(self.almacenamiento))
+        self.assertTrue(os.path.exists(self.ruta + ".danado"))
+        self.assertEqual(self._hotdogs_guardados(), [hotdog.id for hotdog in self.hotdogs[:2]])
+
+    def test_sin_respaldo_valido(self):
+        self._guardar(self.hotdogs)
+        with open(self.ruta, 'rb+') as f:
+            f.truncate(100)
+        self.assertFalse(recuperar_guardado(self.almacenamiento))
+        self.assertFalse(os.path.exists(self.ruta))
+
+    def test_escritura_interrumpida_conserva_la_version_anterior(self):
+        self._guardar(self.hotdogs)
+        with open(self.ruta, 'rb') as f:
+            anterior = f.read()
+
+        def escribir(archivo):
+            archivo.write("{\"a medio")
+            raise KeyboardInterrupt
+
+        with self.assertRaises(KeyboardInterrupt):
+            escribir_atomico(self.ruta, escribir)
+        with open(self.ruta, 'rb') as f:
+            self.assertEqual(f.read(), anterior)
+        self.assertEqual(glob.glob(os.path.join(self.directorio, "*.tmp")), [])
+
+class PruebaAutoGuardado(unittest.TestCase):
+    def test_agrupa_cambios_y_guarda_el_ultimo_estado(self):
+        estado = {'version': 0}
+        guardados = []
+        bloqueo = threading.Lock()
+        autoguardado = AutoGuardado(lambda: (dict(estado),), guardados.append, espera=0.2, bloqueo=bloqueo)
+        autoguardado.iniciar()
+        for version in range(1, 51):
+            with bloqueo:
+                estado['version'] = version
+            autoguardado.marcar_cambio()
+        autoguardado.detener()
+
+        self.assertLess(len(guardados), 50)
+        self.assertEqual(guardados[-1], {'version': 50})
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,58 @@
+import unittest
+from ingredientes import CategoriaIngrediente, Ingrediente
+from inventario import ConflictoBifurcacion, Inventario
+
+class PruebaBifurcacion(unittest.TestCase):
+    def setUp(self):
+        self.pan = Ingrediente(id="pan", nombre="pan", categoria=CategoriaIngrediente.PAN, tipo="prueba")
+        self.salchicha = Ingrediente(id="salchicha", nombre="salchicha", categoria=CategoriaIngrediente.SALCHICHA,
+                                     tipo="prueba")
+        self.base = Inventario()
+        self.base.existencias = {"pan": 10, "salchicha": 4, "mostaza": 7}
+
+    def test_bifurcacion_no_toca_la_base(self):
+        rama = self.base.bifurcar()
+        self.assertTrue(rama.consumir_ingrediente(self.pan, 3))
+        self.assertEqual(rama.verificar_existencia(self.pan), 7)
+        self.assertEqual(self.base.existencias, {"pan": 10, "salchicha": 4, "mostaza": 7})
+        self.assertEqual(rama.cambios(), {"pan": 7})
+        # Lo que la rama no tocó se sigue leyendo de la base
+        self.base.existencias["mostaza"] = 5
+        self.assertEqual(rama.instantanea(), {"pan": 7, "salchicha": 4, "mostaza": 5})
+
+    def test_confirmar_suma_las_diferencias(self):
+        primera, segunda = self.base.bifurcar(), self.base.bifurcar()
+        primera.consumir_ingrediente(self.pan, 3)
+        segunda.consumir_ingrediente(self.pan, 2)
+        segunda.consumir_ingrediente(self.salchicha, 1)
+        self.assertEqual(primera.confirmar(), 1)
+        self.assertEqual(segunda.confirmar(), 2)
+        self.assertEqual(self.base.existencias, {"pan": 5, "salchicha": 3, "mostaza": 7})
+        # Tras confirmar, la rama queda vacía y vuelve a leer la base
+        self.assertEqual(segunda.cambios(), {})
+        self.assertEqual(segunda.verificar_existencia(self.pan), 5)
+
+    def test_conflicto_si_quedaria_negativo(self):
+        primera, segunda = self.base.bifurcar(), self.base.bifurcar()
+        primera.consumir_ingrediente(self.salchicha, 3)
+        segunda.consumir_ingrediente(self.salchicha, 2)
+        segunda.consumir_ingrediente(self.pan, 1)
+        primera.confirmar()
+
+        with self.assertRaises(ConflictoBifurcacion) as contexto:
+            segunda.confirmar()
+        self.assertEqual(contexto.exception.faltantes, {"salchicha": 1})
+        # No se aplicó nada de la rama en conflicto, ni siquiera lo que sí alcanzaba
+        self.assertEqual(self.base.existencias, {"pan": 10, "salchicha": 1, "mostaza": 7})
+        self.assertEqual(segunda.cambios(), {"salchicha": 2, "pan": 9})
+
+        segunda.descartar()
+        self.assertEqual(segunda.instantanea(), self.base.existencias)
+
+    def test_sin_bifurcar(self):
+        self.assertFalse(self.base.es_bifurcacion())
+        self.assertEqual(self.base.cambios(), {})
+        self.assertEqual(self.base.confirmar(), 0)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,93 @@
+import os
+import shutil
+import tempfile
+import unittest
+from benchmark_instantanea import generar_datos
+from libro_ventas import LibroVentas, leer_columnas
+
+class PruebaLibroVentas(unittest.TestCase):
+    def setUp(self):
+        self.directorio = tempfile.mkdtemp()
+        self.ruta = os.path.join(self.directorio, "ventas.jsonl")
+        _, _, self.hotdogs = generar_datos(200)
+
+    def tearDown(self):
+        shutil.rmtree(self.directorio, ignore_errors=True)
+
+    def _llenar(self, ventas: int, tamano_lote: int = 10):
+        with LibroVentas(self.ruta, tamano_lote=tamano_lote) as libro:
+            for i in range(ventas):
+                libro.registrar(self.hotdogs[i % len(self.hotdogs)], cantidad=1 + i % 3, marca_tiempo=1000.0 + i)
+
+    def _cortar(self, sobrante: bytes):
+        """Simula una escritura interrumpida: una venta a medio escribir al final del libro"""
+        with open(self.ruta, 'ab') as f:
+            f.write(sobrante)
+
+    def test_descarta_venta_incompleta(self):
+        self._llenar(25)
+        tamano = os.path.getsize(self.ruta)
+        self._cortar(b'{"ts":2000.0,"hotdog":"hd_')
+        libro = LibroVentas(self.ruta)
+        self.assertEqual(os.path.getsize(self.ruta), tamano)
+        self.assertEqual(libro.ultima_marca, 1024.0)
+        self.assertEqual(len(list(libro.recorrer())), 25)
+
+    def test_descarta_cola_mas_larga_que_un_bloque(self):
+        self._llenar(25)
+        tamano = os.path.getsize(self.ruta)
+        self._cortar(b'{"ts":2000.0,"componentes":["' + b"x" * 200 * 1024)
+        libro = LibroVentas(self.ruta)
+        self.assertEqual(os.path.getsize(self.ruta), tamano)
+        self.assertEqual(libro.ultima_marca, 1024.0)
+        # Lo que se registre después empieza en una línea propia
+        libro.registrar(self.hotdogs[0], marca_tiempo=3000.0)
+        self.assertEqual([venta['ts'] for venta in libro.recorrer(2000.0)], [3000.0])
+        self.assertEqual(len(list(libro.recorrer())), 26)
+
+    def test_indice_descarta_entradas_tras_el_corte(self):
+        self._llenar(25)
+        with open(self.ruta, 'rb+') as f:
+            f.truncate(os.path.getsize(self.ruta) - 3)
+        libro = LibroVentas(self.ruta)
+        self.assertTrue(all(posicion < os.path.getsize(self.ruta) for posicion in libro._posiciones))
+        self.assertEqual([venta['ts'] for venta in libro.recorrer()], [1000.0 + i for i in range(24)])
+
+    def test_rango_coincide_con_recorrer_todo(self):
+        self._llenar(500, tamano_lote=16)
+        libro = LibroVentas(self.ruta)
+        todas = list(libro.recorrer())
+        for inicio, fin in [(1000.0, 1499.0), (1100.5, 1250.0), (1016.0, 1016.0), (1490.0, None), (None, 1007.0),
+                            (900.0, 999.0), (1600.0, None)]:
+            esperadas = [venta for venta in todas if (inicio is None or venta['ts'] >= inicio)
+                         and (fin is None or venta['ts'] <= fin)]
+            self.assertEqual(list(libro.recorrer(inicio, fin)), esperadas, (inicio, fin))
+
+    def test_rango_salta_los_lotes_anteriores(self):
+        self._llenar(500, tamano_lote=16)
+        libro = LibroVentas(self.ruta)
+        # Se daña el primer lote: una consulta que empieza bastante después no debe leerlo
+        with open(self.ruta, 'rb+') as f:
+            f.write(b"#" * libro._posiciones[1])
+        self.assertEqual([venta['ts'] for venta in libro.recorrer(1400.0, 1402.0)], [1400.0, 1401.0, 1402.0])
+        with self.assertRaises(ValueError):
+            list(libro.recorrer())
+
+    def test_exportar_columnas(self):
+        self._llenar(40)
+        libro = LibroVentas(self.ruta)
+        destino = os.path.join(self.directorio, "columnas")
+        self.assertEqual(libro.exportar_columnas(destino, 1010.0, 1019.0), 10)
+        columnas = leer_columnas(destino)
+        ventas = list(libro.recorrer(1010.0, 1019.0))
+        self.assertEqual(list(columnas['ts']), [venta['ts'] for venta in ventas])
+        self.assertEqual([columnas['diccionarios']['hotdog'][codigo] for codigo in columnas['hotdog']],
+                         [venta['hotdog'] for venta in ventas])
+        desde = columnas['componentes_desde']
+        ingredientes = columnas['diccionarios']['componentes']
+        for i, venta in enumerate(ventas):
+            codigos = columnas['componentes'][desde[i]:desde[i + 1]]
+            self.assertEqual([ingredientes[codigo] for codigo in codigos], venta['componentes'])
+
+if __name__ == "__main__":
+    unittest.main()
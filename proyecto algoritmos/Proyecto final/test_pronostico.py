@@ -0,0 +1,84 @@
+import random
+import unittest
+from collections import Counter
+from benchmark_instantanea import generar_datos
+from pronostico import PronosticoConsumo
+from resumen_ventas import ResumenVentas
+
+class PruebaPronosticoConsumo(unittest.TestCase):
+    ALFA, GAMMA, TEMPORADA = 0.3, 0.1, 7
+
+    def setUp(self):
+        _, _, self.hotdogs = generar_datos(200)
+        rng = random.Random(7)
+        # Historial con más ventas los fines de semana
+        self.historial = [{hotdog.id: rng.randint(0, 4) + (6 if dia % 7 >= 5 else 0)
+                           for hotdog in rng.sample(self.hotdogs, 5)} for dia in range(40)]
+
+    def _consumo(self, ventas):
+        consumo = Counter()
+        for hotdog in self.hotdogs:
+            for ing_id, unidades in hotdog.requerimientos().items():
+                consumo[ing_id] += unidades * ventas.get(hotdog.id, 0)
+        return consumo
+
+    def _recalcular(self, dias):
+        """Holt-Winters de referencia: recorre todo el historial desde cero, un ingrediente a la vez"""
+        esperado = {}
+        for ing_id in {ing_id for hotdog in self.hotdogs for ing_id in hotdog.requerimientos()}:
+            serie = [self._consumo(ventas)[ing_id] for ventas in dias]
+            nivel, estacional = serie[0], [0.0] * self.TEMPORADA
+            for dia in range(1, len(serie)):
+                posicion = dia % self.TEMPORADA
+                nivel = self.ALFA * (serie[dia] - estacional[posicion]) + (1 - self.ALFA) * nivel
+                estacional[posicion] = self.GAMMA * (serie[dia] - nivel) + (1 - self.GAMMA) * estacional[posicion]
+            esperado[ing_id] = max(0.0, nivel + estacional[len(serie) % self.TEMPORADA])
+        return esperado
+
+    def _resumen(self, dias):
+        resumen = ResumenVentas()
+        por_id = {hotdog.id: hotdog for hotdog in self.hotdogs}
+        for dia, ventas in enumerate(dias):
+            for hotdog_id, cantidad in ventas.items():
+                resumen.registrar_venta(dia, 12, por_id[hotdog_id], cantidad=cantidad)
+        return resumen
+
+    def test_incremental_coincide_con_recalcular(self):
+        pronostico = PronosticoConsumo(self.hotdogs, alfa=self.ALFA, gamma=self.GAMMA)
+        for dia, ventas in enumerate(self.historial, start=1):
+            pronostico.agregar_dia(ventas)
+            if dia in (1, 2, 7, 8, 23, 40):
+                obtenido = pronostico.pronostico_por_ingrediente()
+                for ing_id, valor in self._recalcular(self.historial[:dia]).items():
+                    self.assertAlmostEqual(obtenido[ing_id], valor, places=9, msg=f"día {dia}, {ing_id}")
+
+    def test_cargar_resumen_por_partes(self):
+        resumen = self._resumen(self.historial[:25])
+        por_partes = PronosticoConsumo(self.hotdogs)
+        por_partes.cargar_resumen(resumen)
+        # Días nuevos después: solo se agregan los que faltan
+        for dia, ventas in enumerate(self.historial[25:], start=25):
+            for hotdog_id, cantidad in ventas.items():
+                resumen.registrar_venta(dia, 12, next(hd for hd in self.hotdogs if hd.id == hotdog_id), cantidad=cantidad)
+        por_partes.cargar_resumen(resumen)
+
+        de_una_vez = PronosticoConsumo(self.hotdogs)
+        de_una_vez.cargar_resumen(self._resumen(self.historial))
+        self.assertEqual(por_partes.dias, len(self.historial))
+        self.assertEqual(list(por_partes.nivel), list(de_una_vez.nivel))
+        self.assertEqual([list(ajuste) for ajuste in por_partes.estacional],
+                         [list(ajuste) for ajuste in de_una_vez.estacional])
+
+    def test_dias_hasta_agotarse_con_demanda_constante(self):
+        pronostico = PronosticoConsumo(self.hotdogs)
+        ventas = {self.hotdogs[0].id: 2}
+        for _ in range(14):
+            pronostico.agregar_dia(ventas)
+        consumo = self._consumo(ventas)
+        ing_id = next(iter(consumo))
+        agotado = pronostico.dias_hasta_agotarse({ing_id: 10 * consumo[ing_id]}, horizonte=30)
+        self.assertAlmostEqual(agotado[ing_id], 10.0)
+        self.assertIsNone(pronostico.dias_hasta_agotarse({ing_id: 100 * consumo[ing_id]}, horizonte=30)[ing_id])
+
+if __name__ == "__main__":
+    unittest.main()
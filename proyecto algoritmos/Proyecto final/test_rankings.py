@@ -0,0 +1,27 @@
+import random
+import unittest
+from rankings import RankingTopK
+
+class PruebaRankingTopK(unittest.TestCase):
+    def _esperado(self, ranking: RankingTopK):
+        """El top calculado recorriendo todos los conteos: mayor conteo primero, empates por primera aparición"""
+        ordenados = sorted(ranking.conteos.items(), key=lambda par: (-par[1], ranking._orden[par[0]]))
+        return ordenados[:ranking.k]
+
+    def test_empate_gana_el_primero_en_aparecer(self):
+        ranking = RankingTopK(1)
+        for clave in "abba":
+            ranking.sumar(clave)
+        self.assertEqual(ranking.top(), [('a', 2)])
+
+    def test_coincide_con_recorrer_todo(self):
+        for semilla in range(200):
+            rng = random.Random(semilla)
+            ranking = RankingTopK(rng.randint(1, 6))
+            claves = [f"hd_{i}" for i in range(rng.randint(1, 15))]
+            for _ in range(rng.randint(0, 150)):
+                ranking.sumar(rng.choice(claves), rng.choice([0, 1, 1, 2]))
+                self.assertEqual(ranking.top(), self._esperado(ranking), f"semilla {semilla}")
+
+if __name__ == "__main__":
+    unittest.main()
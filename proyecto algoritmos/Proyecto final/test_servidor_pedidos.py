@@ -0,0 +1,138 @@
+import http.client
+import json
+import threading
+import unittest
+from collections import Counter
+from dataclasses import replace
+from benchmark_instantanea import generar_datos
+from gestor_ingredientes import GestorIngredientes
+from guardado_seguro import AutoGuardado
+from inventario import Inventario
+from menu import Menu
+from servidor_pedidos import ServicioPedidos, crear_servidor
+
+class PruebaPedidosConcurrentes(unittest.TestCase):
+    HILOS = 8
+    PEDIDOS_POR_HILO = 150
+
+    def setUp(self):
+        ingredientes, existencias, hotdogs = generar_datos(200)
+        self.gestor = GestorIngredientes()
+        for ingrediente in ingredientes:
+            self.gestor.agregar_ingrediente(ingrediente)
+        self.inventario = Inventario()
+        self.inventario.existencias = existencias
+        self.iniciales = dict(existencias)
+        self.menu = Menu()
+        for hotdog in hotdogs:
+            self.menu.agregar_hotdog(hotdog)
+        self.hotdogs = hotdogs
+
+        self.bloqueo = threading.Lock()
+        self.instantaneas = []
+        self.hilos_instantanea = set()
+        self.autoguardado = AutoGuardado(self._instantanea, self.instantaneas.append, espera=0.0, bloqueo=self.bloqueo)
+
+    def _instantanea(self):
+        # Debe correr en el hilo de guardado (o al detener) y con el candado del servicio tomado
+        self.assertTrue(self.bloqueo.locked())
+        self.hilos_instantanea.add(threading.current_thread().name)
+        return (dict(self.inventario.existencias),)
+
+    def _vender(self, tamano_lote: int, permitir_parciales: bool = False):
+        servicio = ServicioPedidos(self.menu, self.inventario, self.gestor, al_cambiar=self.autoguardado.marcar_cambio,
+                                   tamano_lote=tamano_lote, permitir_parciales=permitir_parciales, bloqueo=self.bloqueo)
+        self.autoguardado.iniciar()
+        vendidos = Counter()
+        bloqueo_vendidos = threading.Lock()
+
+        def terminal(numero: int):
+            for i in range(self.PEDIDOS_POR_HILO):
+                hotdog = self.hotdogs[(numero * 7 + i) % len(self.hotdogs)]
+                aceptado, respuesta = servicio.realizar_pedido({'items': [{'hotdog': hotdog.id, 'cantidad': 1 + i % 3}]})
+                if aceptado:
+                    with bloqueo_vendidos:
+                        for item in respuesta['items']:
+                            vendidos[item['hotdog']] += item['cantidad']
+
+        hilos = [threading.Thread(target=terminal, args=(n,)) for n in range(self.HILOS)]
+        for hilo in hilos:
+            hilo.start()
+        for hilo in hilos:
+            hilo.join()
+        servicio.detener()
+        self.autoguardado.detener()
+        return servicio, vendidos
+
+    def _verificar(self, servicio, vendidos):
+        self.assertGreater(servicio.pedidos_rechazados, 0, "el catálogo debe agotarse para que la prueba tenga sentido")
+        self.assertTrue(all(cantidad >= 0 for cantidad in self.inventario.existencias.values()))
+        for existencias in self.instantaneas:
+            self.assertTrue(all(cantidad >= 0 for cantidad in existencias.values()))
+
+        # Lo descontado coincide exactamente con lo que se vendió
+        consumo = Counter()
+        por_id = {hotdog.id: hotdog for hotdog in self.hotdogs}
+        for hotdog_id, cantidad in vendidos.items():
+            for ing_id, unidades in por_id[hotdog_id].requerimientos().items():
+                consumo[ing_id] += unidades * cantidad
+        for ing_id, inicial in self.iniciales.items():
+            self.assertEqual(self.inventario.existencias[ing_id], inicial - consumo[ing_id])
+
+        # Los pedidos solo marcan el cambio: ninguna copia se toma en los hilos de las terminales
+        self.assertTrue(self.instantaneas)
+        self.assertEqual(self.instantaneas[-1], self.inventario.existencias)
+        self.assertTrue(self.hilos_instantanea <= {"autoguardado", threading.main_thread().name})
+
+    def test_pedidos_uno_por_uno(self):
+        self._verificar(*self._vender(tamano_lote=1))
+
+    def test_pedidos_por_lotes(self):
+        self._verificar(*self._vender(tamano_lote=16))
+
+    def test_pedidos_parciales_por_lotes(self):
+        self._verificar(*self._vender(tamano_lote=16, permitir_parciales=True))
+
+class PruebaRecetasIncompletas(unittest.TestCase):
+    """Hot dogs cuyos ingredientes no se encontraron en el catálogo (p. ej. al leer una instantánea)"""
+
+    def setUp(self):
+        ingredientes, existencias, hotdogs = generar_datos(100)
+        self.inventario = Inventario()
+        self.inventario.existencias = existencias
+        menu = Menu()
+        menu.agregar_hotdog(hotdogs[0])
+        menu.agregar_hotdog(replace(hotdogs[1], id="incompleto", pan=None, salchicha=None, toppings=[], salsas=[],
+                                    acompanante=None))
+        self.servicio = ServicioPedidos(menu, self.inventario, GestorIngredientes())
+        self.servidor = crear_servidor(self.servicio, puerto=0)
+        threading.Thread(target=self.servidor.serve_forever, daemon=True).start()
+
+    def tearDown(self):
+        self.servidor.shutdown()
+        self.servidor.server_close()
+
+    def _peticion(self, metodo: str, ruta: str, cuerpo=None):
+        conexion = http.client.HTTPConnection(*self.servidor.server_address[:2], timeout=10)
+        try:
+            conexion.request(metodo, ruta, body=json.dumps(cuerpo) if cuerpo is not None else None)
+            respuesta = conexion.getresponse()
+            return respuesta.status, json.loads(respuesta.read())
+        finally:
+            conexion.close()
+
+    def test_menu_marca_no_disponible(self):
+        estado, menu = self._peticion("GET", "/menu")
+        self.assertEqual(estado, 200)
+        incompleto = next(hotdog for hotdog in menu if hotdog['id'] == "incompleto")
+        self.assertEqual((incompleto['disponible'], incompleto['porciones']), (False, 0))
+
+    def test_pedido_se_rechaza_sin_descontar(self):
+        antes = dict(self.inventario.existencias)
+        estado, respuesta = self._peticion("POST", "/pedidos", {'items': [{'hotdog': "incompleto", 'cantidad': 1}]})
+        self.assertEqual(estado, 400)
+        self.assertIn('error', respuesta)
+        self.assertEqual(self.inventario.existencias, antes)
+
+if __name__ == "__main__":
+    unittest.main()